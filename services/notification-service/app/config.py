@@ -14,6 +14,40 @@ class Settings:
     rabbitmq_password: int = os.getenv("RABBITMQ_PASSWORD","taskpass")
     rabbitmq_vhost: str = os.getenv("RABBITMQ_VHOST","taskhost")
 
+    # Consumer ayarlari
+    # pool: mesajlar task_id'ye gore lane'lere dagitilip paralel islenir
+    # sequential: mesajlar tek tek islenir (eski davranis)
+    consumer_mode: str = os.getenv("CONSUMER_MODE", "pool")
+    consumer_concurrency: int = int(os.getenv("CONSUMER_CONCURRENCY", "10"))
+    # Broker'in ack beklemeden gonderdigi mesaj; lane'ler bos kalmasin diye concurrency'den buyuk
+    consumer_prefetch_count: int = int(os.getenv("CONSUMER_PREFETCH_COUNT", "20"))
+    consumer_drain_timeout_seconds: float = float(os.getenv("CONSUMER_DRAIN_TIMEOUT_SECONDS", "30"))
+    consumer_stats_interval_seconds: float = float(os.getenv("CONSUMER_STATS_INTERVAL_SECONDS", "30"))
+
+    # Retry bekleme kademeleri (saniye); n. retry n. kademede bekler
+    retry_delays_seconds: list[float] = [
+        float(delay) for delay in os.getenv("RETRY_DELAYS_SECONDS", "1,10,60").split(",")
+    ]
+
+    # Bildirim kanallari
+    # parallel: bir event'in kanallari ayni anda gonderilir
+    # sequential: kanallar sirayla gonderilir (eski davranis, karsilastirma icin)
+    notification_fanout_mode: str = os.getenv("NOTIFICATION_FANOUT_MODE", "parallel")
+    email_timeout_seconds: float = float(os.getenv("EMAIL_TIMEOUT_SECONDS", "5"))
+    webhook_timeout_seconds: float = float(os.getenv("WEBHOOK_TIMEOUT_SECONDS", "3"))
+    # Timeout'u tanimlanmamis kanallar icin
+    notification_timeout_seconds: float = float(os.getenv("NOTIFICATION_TIMEOUT_SECONDS", "5"))
+
+    # Email digest: kullanici basina DIGEST_WINDOW_SECONDS boyunca biriktir,
+    # DIGEST_MAX_SIZE event'e ulasinca beklemeden gonder
+    digest_enabled: bool = os.getenv("DIGEST_ENABLED", "true").lower() == "true"
+    digest_window_seconds: float = float(os.getenv("DIGEST_WINDOW_SECONDS", "10"))
+    digest_max_size: int = int(os.getenv("DIGEST_MAX_SIZE", "50"))
+
+    # Idempotency: islenen event_id'ler DEDUP_TTL_SECONDS boyunca hatirlanir
+    dedup_ttl_seconds: float = float(os.getenv("DEDUP_TTL_SECONDS", "3600"))
+    dedup_max_size: int = int(os.getenv("DEDUP_MAX_SIZE", "100000"))
+
     @property
     def rabbitmq_url(self)-> str:
         """RabbitMQ connection URL."""
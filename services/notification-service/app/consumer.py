@@ -3,20 +3,35 @@ RabbitMQ consumer with Dead Letter Queue support.
 Event'leri dinler ve handlerlara yonlendirir.
 Hata durumunda retry yapar, max retry asilirsa DLQ'ya gonderir.
 
+Retry'lar hemen tekrar publish edilmez; retry sayisina gore bir bekleme
+kuyruguna (orn. 1s, 10s, 60s) yazilir. Bekleme kuyrugunun TTL'i dolunca
+RabbitMQ mesaji dead-letter ile ana kuyruga geri verir, bekleyen retry
+consumer'da CPU harcamaz.
+
+Iki calisma modu vardir (CONSUMER_MODE):
+    - pool      : Mesajlar task_id'ye gore CONSUMER_CONCURRENCY lane'e dagitilir
+                  ve paralel islenir; ayni task'in event'leri sirasini korur.
+                  Kapanista yeni mesaj alinmaz, eldeki mesajlar bitirilir.
+    - sequential: Mesajlar tek tek islenir (eski davranis).
+
+Her iki modda mesaj/saniye ve handler gecikme yuzdelikleri periyodik loglanir.
 """
 
 import asyncio
 import json
 import signal
 import logging
+import time
+from collections.abc import Iterable
 from aio_pika import connect_robust, ExchangeType, Message
 from aio_pika.abc import AbstractIncomingMessage
 from app.config import settings
+from app.worker_pool import ConsumerMetrics, KeyedWorkerPool
 from app.handlers import (
-    handle_task_created,
-    handle_task_completed,
-    handle_task_deleted,
-    handle_task_updated
+    ChannelDeliveryError,
+    email_digest,
+    event_dedup,
+    handle_event
 )
 
 logging.basicConfig(
@@ -38,10 +53,18 @@ logger = logging.getLogger(__name__)
 #Constants
 MAX_RETRIES = 3
 RETRY_HEADER = "x-retry-count"
+ORIGINAL_ROUTING_KEY_HEADER = "x-original-routing-key"
+QUEUE_NAME = "notifications"
+RETRY_QUEUE_PREFIX = "notifications.retry"
+# Retry'da sadece bu kanallar tekrar denenir (virgulle ayrilmis)
+FAILED_CHANNELS_HEADER = "x-failed-channels"
 
 # Graceful shutdown
 shutdown_event = asyncio.Event()
 
+# Islenen mesaj istatistikleri
+consumer_metrics = ConsumerMetrics()
+
 def signal_handler(sig, frame):
     """
     graceful shutdown icin Signal handler 
@@ -51,6 +74,21 @@ def signal_handler(sig, frame):
 signal.signal(signal.SIGINT, signal_handler) # Ctrl + C
 signal.signal(signal.SIGTERM, signal_handler) # Docker stop/kill
 
+def get_ordering_key(message: AbstractIncomingMessage) -> str:
+    """
+    Mesajin sira anahtarini dondurur (ayni anahtar = ayni lane).
+
+    Args:
+        message: RabbitMQ mesaji
+    Returns:
+        str: task_id, yoksa routing key
+    """
+    try:
+        task_id = json.loads(message.body).get("task_id")
+    except (ValueError, AttributeError):
+        task_id = None
+    return str(task_id) if task_id is not None else (message.routing_key or "-")
+
 def get_retry_count(message:AbstractIncomingMessage) -> int:
     """
     Mesajin retry sayisini dondurur.
@@ -63,10 +101,60 @@ def get_retry_count(message:AbstractIncomingMessage) -> int:
     headers= message.headers or {}
     return headers.get(RETRY_HEADER, 0)
 
+def get_failed_channels(message: AbstractIncomingMessage) -> set[str] | None:
+    """
+    Onceki denemede basarisiz olan kanallari dondurur.
+
+    Args:
+        message: RabbitMQ mesaji
+    Returns:
+        set[str] | None: Kanallar; header yoksa None (tum kanallar)
+    """
+    value = (message.headers or {}).get(FAILED_CHANNELS_HEADER)
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode()
+    return set(value.split(","))
+
+def get_retry_queue_name(retry_count: int) -> str:
+    """
+    Retry sayisina gore bekleme kuyrugunun adini dondurur.
+
+    Tanimli kademeden fazla retry'da son kademe kullanilir.
+
+    Args:
+        retry_count: Yeni retry sayisi (1'den baslar)
+    """
+    delays = settings.retry_delays_seconds
+    delay = delays[min(max(retry_count, 1), len(delays)) - 1]
+    return f"{RETRY_QUEUE_PREFIX}.{delay:g}s"
+
+async def declare_retry_queues(channel) -> None:
+    """
+    Retry bekleme kuyruklarini olusturur.
+
+    Kuyruklarin consumer'i yoktur. TTL kuyruk bazinda verildigi icin (mesaj
+    bazinda degil) kuyruktaki tum mesajlar ayni surede bekler ve sirayla
+    expire olur. Expire olan mesaj default exchange uzerinden dogrudan ana
+    kuyruga doner; task_events'e publish edilmedigi icin ayni topic'e bagli
+    diger subscriber'lar retry'i tekrar almaz.
+    """
+    for retry_count in range(1, len(settings.retry_delays_seconds) + 1):
+        delay = settings.retry_delays_seconds[retry_count - 1]
+        await channel.declare_queue(
+            get_retry_queue_name(retry_count),
+            durable=True,
+            arguments={
+                "x-message-ttl": int(delay * 1000),
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": QUEUE_NAME,
+            }
+        )
+
 async def process_message(
     message: AbstractIncomingMessage,
     channel,
-    exchange,
     dlx_exchange    
 ) -> None:
     """
@@ -76,6 +164,7 @@ async def process_message(
         message: RabbitMQ mesaji
     """
     retry_count= get_retry_count(message)
+    channels = get_failed_channels(message)
     correlation_id = "-"
     try:
         # Parse JSON
@@ -91,19 +180,8 @@ async def process_message(
         )
 
         # handler route ediyoruz yani yonlendiriyoruz bu kisimda
-        if event_type == "task.created":
-            await handle_task_created(event_data)
-        elif event_type == "task.updated":
-            await handle_task_updated(event_data)
-        elif event_type == "task.deleted":
-            await handle_task_deleted(event_data)
-        elif event_type == "task.completed":
-            await handle_task_completed(event_data)
-        else:
-            logger.warning(
-                f"Unkown event type: {event_type}",
-                extra={"correlation_id":correlation_id}
-            )
+        # (duplicate event'ler handler calismadan ack'lenir)
+        await handle_event(event_data, channels)
         
         # Basarili - ACK
         await message.ack()
@@ -121,10 +199,13 @@ async def process_message(
         #Retry veya DLQ kararinin verildigi kisim
         if retry_count <MAX_RETRIES:
             #Retry: Mesaji tekrar kuyruga gonder (artirilmis retry count yaparak)
-            await retry_message(message, channel,exchange, retry_count + 1)
+            # Kanal hatasiysa sadece basarisiz kanallar tekrar denenir
+            failed_channels = e.failed.keys() if isinstance(e, ChannelDeliveryError) else None
+            await retry_message(message, channel, retry_count + 1, failed_channels)
             await message.ack()
             logger.warning(
-                f"Message  requeued for retry ({retry_count + 1}/{MAX_RETRIES})",
+                f"Message  requeued for retry ({retry_count + 1}/{MAX_RETRIES}) "
+                f"via {get_retry_queue_name(retry_count + 1)}",
                 extra={"correlation_id":correlation_id}
             )
         else:
@@ -138,21 +219,25 @@ async def process_message(
 async def retry_message(
     original_message: AbstractIncomingMessage,
     channel,
-    exchange,
-    retry_count: int
+    retry_count: int,
+    failed_channels: Iterable[str] | None = None
 ) -> None:
     """
-    Mesaji retry icin tekrar kuyruga gonderir.
+    Mesaji retry sayisina gore bekleme kuyruguna gonderir.
+    Bekleme suresi dolunca mesaj ana kuyruga geri doner.
     
     Args:
         original_message: Orjinal mesaj
         channel:RabbitMQ channeli
-        exchange: Ana exchange
-        retry_count: yeni retry sayisi
+        retry_count: yeni retry sayisi (bekleme kademesini secer)
+        failed_channels: Tekrar denenecek kanallar (None = onceki header korunur)
     """
     # Yeni headers olustur
     headers = dict(original_message.headers or {})
     headers[RETRY_HEADER]= retry_count
+    headers.setdefault(ORIGINAL_ROUTING_KEY_HEADER, original_message.routing_key)
+    if failed_channels is not None:
+        headers[FAILED_CHANNELS_HEADER] = ",".join(sorted(failed_channels))
 
     # Yeni mesaj olustur
     new_message = Message(
@@ -162,10 +247,10 @@ async def retry_message(
         correlation_id= original_message.correlation_id
     )
 
-    # Ayni routing key ile tekrar publish et
-    await exchange.publish(
+    # Bekleme kuyruguna publish et (default exchange: routing key = kuyruk adi)
+    await channel.default_exchange.publish(
         new_message,
-        routing_key = original_message.routing_key or "task.unkown"
+        routing_key = get_retry_queue_name(retry_count)
     )
 
 async def send_to_dlq(
@@ -184,7 +269,7 @@ async def send_to_dlq(
     # Headers'a hata bilgisi ekle
     headers = dict(message.headers or {})
     headers["x-death-reason"] = error_reason
-    headers["x-original-routing-key"] = message.routing_key
+    headers.setdefault(ORIGINAL_ROUTING_KEY_HEADER, message.routing_key)
 
     #DQL mesaji olustur
     dlq_message=Message(
@@ -209,7 +294,8 @@ async def start_consumer():
     # Connect
     connection = await connect_robust(settings.rabbitmq_url)
     channel= await connection.channel()
-    await channel.set_qos(prefetch_count= 10) #max 10 mesaji paralelde isle
+    # Ack beklenmeden gonderilecek en fazla mesaj (pool modunda paralel islenir)
+    await channel.set_qos(prefetch_count=settings.consumer_prefetch_count)
 
     # ---MAIN EXCHANGE ---
     exchange = await channel.declare_exchange(
@@ -234,27 +320,84 @@ async def start_consumer():
 
     # ---MAIN QUEUE---
     queue = await channel.declare_queue(
-        "notifications",
+        QUEUE_NAME,
         durable= True
     )
 
+    # ---RETRY (DELAY) QUEUES---
+    await declare_retry_queues(channel)
+
     # Bind
     await queue.bind(exchange, routing_key = "task.*")
     logger.info(f"Consumer started, listenin on queue 'notifications'")
     logger.info(f"Bound to exchange 'task_events' with routing key 'task.*'")
     logger.info(f"Dead Letter Queue: 'notifications.dead_letter'")
+    logger.info(f"Retry delays: {settings.retry_delays_seconds}s")
+
+    reporter = asyncio.create_task(report_stats())
+    try:
+        if settings.consumer_mode == "sequential":
+            await consume_sequential(queue, channel, dlx_exchange)
+        else:
+            await consume_with_pool(queue, channel, dlx_exchange)
+    finally:
+        reporter.cancel()
+        # Buffer'da bekleyen digest'leri gonder (mesajlari ack'lenmis durumda)
+        await email_digest.close()
+        logger.info(f"Consumer stats: {consumer_metrics.stats()}")
+        logger.info(f"Digest stats: {email_digest.stats()}")
+        logger.info(f"Dedup stats: {event_dedup.stats()}")
 
-    # Consume
+    await connection.close()
+    logger.info("Consumer stopped")
+
+async def consume_sequential(queue, channel, dlx_exchange) -> None:
+    """
+    Mesajlari tek tek isler (bir mesaj bitmeden digerine gecilmez).
+    """
     async with queue.iterator() as queue_iter:
         async for message in queue_iter:
             if shutdown_event.is_set():
                 logger.info("Shutdown event set, stopping consumer...")
                 break
-        
-            await process_message(message,channel,exchange,dlx_exchange)
-    
-    await connection.close()
-    logger.info("Consumer stopped")
+
+            start = time.perf_counter()
+            await process_message(message,channel,dlx_exchange)
+            consumer_metrics.record(time.perf_counter() - start)
+
+async def consume_with_pool(queue, channel, dlx_exchange) -> None:
+    """
+    Mesajlari key'e gore sirali worker pool ile paralel isler.
+
+    Ayni anda islenen mesaj sayisi prefetch_count ile sinirlidir.
+    Shutdown isaretinde consumer iptal edilir (yeni mesaj gelmez) ve
+    lane'lerdeki mesajlar islenip ack'lenene kadar beklenir. Drain
+    suresinde bitmeyen mesajlar ack'lenmedigi icin broker'a geri doner.
+    """
+    async def handle(message: AbstractIncomingMessage) -> None:
+        await process_message(message, channel, dlx_exchange)
+
+    pool = KeyedWorkerPool(settings.consumer_concurrency, handle, consumer_metrics)
+    pool.start()
+
+    async def on_message(message: AbstractIncomingMessage) -> None:
+        pool.submit(get_ordering_key(message), message)
+
+    consumer_tag = await queue.consume(on_message)
+    logger.info(f"Worker pool started with {settings.consumer_concurrency} lanes")
+
+    await shutdown_event.wait()
+    logger.info(f"Shutdown: draining {pool.pending} queued messages...")
+    await queue.cancel(consumer_tag)
+    await pool.drain(timeout=settings.consumer_drain_timeout_seconds)
+
+async def report_stats() -> None:
+    """Consumer istatistiklerini periyodik olarak loglar."""
+    while True:
+        await asyncio.sleep(settings.consumer_stats_interval_seconds)
+        logger.info(f"Consumer stats: {consumer_metrics.stats()}")
+        logger.info(f"Digest stats: {email_digest.stats()}")
+        logger.info(f"Dedup stats: {event_dedup.stats()}")
 
 if __name__ =="__main__":
     asyncio.run(start_consumer())
\ No newline at end of file
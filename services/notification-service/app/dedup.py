@@ -0,0 +1,117 @@
+"""
+Event idempotency icin sinirli, TTL'li "gorulen ID" deposu.
+
+Dapr (requeueInFailure) ve consumer retry'lari ayni event'i birden fazla
+kez teslim edebilir. Basariyla islenen event'in event_id'si burada
+tutulur; ayni ID tekrar gelirse handler calistirilmadan atlanir.
+
+Ayni event ayni anda iki kez gelirse (paralel Dapr istekleri, orijinal
+teslimle yarisan redelivery) ikincisi acquire()'da ilkinin bitmesini bekler:
+ilki basariliysa duplicate olarak atlanir, basarisizsa kendisi isler.
+
+Depo process bellegindedir: en fazla max_size ID tutar (en eskisi atilir)
+ve ID'ler ttl_seconds sonra unutulur.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class DedupStore:
+    """
+    TTL'li ve boyutu sinirli event ID seti.
+
+    Args:
+        ttl_seconds: ID'nin hatirlanma suresi
+        max_size: Tutulacak en fazla ID sayisi
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Event] = {}
+        self.checks = 0
+        self.hits = 0
+
+    def seen(self, event_id: str) -> bool:
+        """
+        Event daha once basariyla islendi mi?
+
+        Args:
+            event_id: Event ID
+        """
+        expires_at = self._seen.get(event_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._seen[event_id]
+            return False
+        return True
+
+    async def acquire(self, event_id: str) -> bool:
+        """
+        Event'i isleme hakkini alir.
+
+        Event islenmisse False doner. Ayni event su an isleniyorsa onun
+        bitmesini bekler ve tekrar kontrol eder. True donerse cagiran
+        islemden sonra release() cagirmalidir.
+
+        Args:
+            event_id: Event ID
+        Returns:
+            bool: Islenmeli ise True, duplicate ise False
+        """
+        self.checks += 1
+        while True:
+            if self.seen(event_id):
+                self.hits += 1
+                return False
+            in_flight = self._in_flight.get(event_id)
+            if in_flight is None:
+                break
+            await in_flight.wait()
+        self._in_flight[event_id] = asyncio.Event()
+        return True
+
+    def release(self, event_id: str, processed: bool) -> None:
+        """
+        acquire() ile alinan hakki birakir.
+
+        Args:
+            event_id: Event ID
+            processed: Event basariyla islendiyse True (islendi olarak kaydedilir)
+        """
+        if processed:
+            self.mark(event_id)
+        in_flight = self._in_flight.pop(event_id, None)
+        if in_flight is not None:
+            in_flight.set()
+
+    def mark(self, event_id: str) -> None:
+        """
+        Event'i islendi olarak kaydeder.
+
+        Args:
+            event_id: Event ID
+        """
+        now = time.monotonic()
+        self._seen[event_id] = now + self.ttl_seconds
+        self._seen.move_to_end(event_id)
+
+        # Suresi dolanlari ve limiti asanlari (en eskiden) temizle
+        while self._seen:
+            oldest_id, expires_at = next(iter(self._seen.items()))
+            if expires_at > now and len(self._seen) <= self.max_size:
+                break
+            del self._seen[oldest_id]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "checks": self.checks,
+            "duplicates_skipped": self.hits,
+            "hit_rate": round(self.hits / self.checks, 4) if self.checks else 0.0,
+            "size": len(self._seen),
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,127 @@
+"""
+Kullanici bazinda bildirim birlestirme (digest).
+
+Event'ler kullaniciya gore bellekte biriktirilir ve tek bir digest olarak
+gonderilir. Bir kullanicinin buffer'i iki durumda flush edilir:
+    - max_size event birikince (hemen)
+    - ilk event'ten window_seconds sonra
+Boylece toplu islemlerde (orn. 500 task guncelleme) 500 email yerine
+birkac digest gider.
+
+Not: Event'ler buffer'a eklenince mesaj ack'lenir. Bu yuzden digest
+kanalinin hatalari ChannelDeliveryError/x-failed-channels ile broker
+uzerinden tekrar denenmez: her deneme timeout ile sinirlidir, basarisiz
+digest en fazla max_attempts kez (artan beklemeyle) tekrar denenir,
+sonra loglanip birakilir.
+"""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class DigestBuffer:
+    """
+    Event'leri key (user_id) bazinda biriktirip toplu gonderen buffer.
+
+    Args:
+        sender: (key, items) ile cagrilan, digest'i gonderen coroutine fonksiyonu
+        window_seconds: Ilk event'ten flush'a kadar bekleme suresi
+        max_size: Bu sayiya ulasan buffer hemen flush edilir
+        max_attempts: Basarisiz digest icin en fazla deneme sayisi
+        timeout: Tek gonderim denemesinin timeout'u (saniye); None = sinirsiz
+        retry_delay: Ilk tekrar denemeden onceki bekleme (her denemede iki katina cikar)
+    """
+
+    def __init__(
+        self,
+        sender: Callable[[Any, list[Any]], Awaitable[None]],
+        window_seconds: float,
+        max_size: int,
+        max_attempts: int = 3,
+        timeout: float | None = None,
+        retry_delay: float = 2.0
+    ):
+        self.sender = sender
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self._buffers: dict[Any, list[Any]] = {}
+        self._timers: dict[Any, asyncio.TimerHandle] = {}
+        self._flushes: set[asyncio.Task] = set()
+        self.events_buffered = 0
+        self.digests_sent = 0
+        self.digests_failed = 0
+
+    async def add(self, key: Any, item: Any) -> None:
+        """
+        Event'i key'in buffer'ina ekler. Gonderimi beklemez.
+
+        Args:
+            key: Alici (user_id)
+            item: Digest'e girecek event bilgisi
+        """
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append(item)
+        self.events_buffered += 1
+
+        if len(buffer) >= self.max_size:
+            self._schedule_flush(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self.window_seconds, self._schedule_flush, key
+            )
+
+    @property
+    def pending(self) -> int:
+        """Buffer'larda bekleyen event sayisi."""
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def _schedule_flush(self, key: Any) -> None:
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        items = self._buffers.pop(key, None)
+        if not items:
+            return
+        task = asyncio.create_task(self._send(key, items))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _send(self, key: Any, items: list[Any]) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await asyncio.wait_for(self.sender(key, items), self.timeout)
+                self.digests_sent += 1
+                return
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                logger.warning(
+                    f"Digest for {key} failed ({attempt}/{self.max_attempts}): {error}"
+                )
+                if attempt < self.max_attempts:
+                    await asyncio.sleep(min(self.retry_delay * 2 ** (attempt - 1), 30))
+        self.digests_failed += 1
+        logger.error(f"Digest for {key} dropped, {len(items)} events not delivered")
+
+    async def close(self) -> None:
+        """Tum buffer'lari flush eder ve gonderimlerin bitmesini bekler."""
+        for key in list(self._buffers):
+            self._schedule_flush(key)
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "events_buffered": self.events_buffered,
+            "digests_sent": self.digests_sent,
+            "digests_failed": self.digests_failed,
+            "pending": self.pending,
+            "events_per_digest": (
+                round(self.events_buffered / self.digests_sent, 2) if self.digests_sent else 0.0
+            ),
+        }
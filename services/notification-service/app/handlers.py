@@ -1,18 +1,173 @@
 """
 Event handler'lar.
 Her event tipi icin ayri handler fonksiyonu icerir.
+
+Bir event'in kanal teslimatlari (email, webhook) fan_out() ile paralel
+calisir; her kanalin kendi timeout'u vardir. Basarisiz kanallar
+ChannelDeliveryError ile raporlanir, boylece retry'da sadece onlar
+tekrar denenir (handler'larin channels parametresi).
+
+Email bildirimleri DIGEST_ENABLED ise kullanici bazinda birlestirilir
+(app.digest); kullanici penceresi boyunca gelen event'ler tek email olur.
+Bu durumda email kanali fan_out'ta sadece buffer'a ekler: EMAIL_TIMEOUT_SECONDS
+ve tekrar denemeler digest gonderiminde uygulanir, email hatalari
+ChannelDeliveryError'da gorunmez.
+
+handle_event() event'i tipine gore handler'a yonlendirir ve idempotency
+saglar: basariyla islenen event_id'ler event_dedup'ta tutulur, ayni event
+tekrar gelirse (Dapr requeue, broker redelivery) handler calistirilmaz.
 """
-from argparse import Action
 import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from app.config import settings
+from app.dedup import DedupStore
+from app.digest import DigestBuffer
+
 logger=logging.getLogger(__name__)
 
-async def handle_task_created(event_data: dict) -> None:
+# Bildirim kanallari
+EMAIL_CHANNEL = "email"
+WEBHOOK_CHANNEL = "webhook"
+
+class ChannelDeliveryError(Exception):
+    """
+    Bir veya daha fazla kanala teslimat basarisiz oldu.
+
+    Attributes:
+        failed: Kanal adi -> hata mesaji
+    """
+
+    def __init__(self, failed: dict[str, str]):
+        self.failed = failed
+        super().__init__(
+            "Channel delivery failed: "
+            + ", ".join(f"{channel} ({error})" for channel, error in failed.items())
+        )
+
+def get_channel_timeout(channel: str) -> float:
+    """Kanalin teslimat timeout'u (saniye)."""
+    if channel == EMAIL_CHANNEL:
+        return settings.email_timeout_seconds
+    if channel == WEBHOOK_CHANNEL:
+        return settings.webhook_timeout_seconds
+    return settings.notification_timeout_seconds
+
+async def deliver(channel: str, send: Callable[[], Awaitable[None]]) -> None:
+    """
+    Tek kanala teslimat yapar, kanalin timeout'unu uygular.
+
+    Raises:
+        TimeoutError: Kanal timeout suresinde bitmezse
+    """
+    timeout = get_channel_timeout(channel)
+    try:
+        await asyncio.wait_for(send(), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"timed out after {timeout}s") from None
+
+async def fan_out(
+    deliveries: dict[str, Callable[[], Awaitable[None]]],
+    correlation_id: str | None,
+    channels: set[str] | None = None
+) -> None:
+    """
+    Event'in kanal teslimatlarini paralel calistirir.
+
+    Args:
+        deliveries: Kanal adi -> teslimati yapan coroutine fonksiyonu
+        correlation_id: Request tracing ID
+        channels: Sadece bu kanallar (retry'da basarisiz olanlar); None = hepsi
+    Raises:
+        ChannelDeliveryError: Basarisiz kanal varsa (digerleri teslim edilmistir)
+    """
+    selected = {
+        channel: send for channel, send in deliveries.items()
+        if channels is None or channel in channels
+    }
+    start = time.perf_counter()
+
+    if settings.notification_fanout_mode == "sequential":
+        results: list[BaseException | None] = []
+        for channel, send in selected.items():
+            try:
+                results.append(await deliver(channel, send))
+            except Exception as e:
+                results.append(e)
+    else:
+        results = await asyncio.gather(
+            *(deliver(channel, send) for channel, send in selected.items()),
+            return_exceptions=True
+        )
+
+    failed: dict[str, str] = {}
+    for channel, result in zip(selected, results):
+        if isinstance(result, Exception):
+            failed[channel] = str(result) or type(result).__name__
+        elif isinstance(result, BaseException):
+            raise result
+
+    logger.info(
+        f"Fan-out finished in {(time.perf_counter() - start) * 1000:.1f}ms "
+        f"({len(selected)} channels, {len(failed)} failed)",
+        extra={"correlation_id":correlation_id}
+    )
+    if failed:
+        raise ChannelDeliveryError(failed)
+
+async def handle_event(event_data: dict, channels: set[str] | None = None) -> bool:
+    """
+    Event'i tipine gore handler'a yonlendirir, duplicate'leri atlar.
+
+    event_id'siz event'ler (eski producer'lar) her zaman islenir.
+    Event ancak handler basariyla bitince islendi sayilir; kanal hatasinda
+    retry'lar (ayni event_id ile) atlanmaz. Ayni event paralel gelirse
+    ikincisi ilkinin sonucunu bekler.
+
+    Args:
+        event_data: Event verisi
+        channels: Teslim edilecek kanallar (None = hepsi)
+    Returns:
+        bool: Event islendiyse True, duplicate olarak atlandiysa False
+    """
+    event_id = event_data.get("event_id")
+    event_type = event_data.get("event_type")
+    correlation_id = event_data.get("correlation_id")
+
+    if event_id and not await event_dedup.acquire(event_id):
+        logger.info(
+            f"Skipping duplicate event {event_id} ({event_type})",
+            extra={"correlation_id":correlation_id}
+        )
+        return False
+
+    processed = False
+    try:
+        handler = EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            logger.warning(
+                f"Unkown event type: {event_type}",
+                extra={"correlation_id":correlation_id}
+            )
+            return True
+
+        await handler(event_data, channels)
+        processed = True
+        return True
+    finally:
+        if event_id:
+            event_dedup.release(event_id, processed)
+
+async def handle_task_created(event_data: dict, channels: set[str] | None = None) -> None:
     """
     TaskCreated event'ini handle eder.
 
     Args:
         event_data: Event verisi
+        channels: Teslim edilecek kanallar (None = hepsi)
     """
     task_id=event_data.get("task_id")
     task_data=event_data.get("data",{})
@@ -23,18 +178,24 @@ async def handle_task_created(event_data: dict) -> None:
         extra={"correlation_id":correlation_id}
     )
 
-    # Simulated email sending
-    await send_email_notification(task_data, correlation_id)
-
-    # Simulated webhook
-    await send_webhook_notification("task_created",task_data,correlation_id)
+    await fan_out(
+        {
+            EMAIL_CHANNEL: email_delivery(event_data, task_data, "created"),
+            WEBHOOK_CHANNEL: partial(
+                send_webhook_notification, "task_created", task_data, correlation_id
+            ),
+        },
+        correlation_id,
+        channels
+    )
 
-async def handle_task_updated(event_data: dict) -> None:
+async def handle_task_updated(event_data: dict, channels: set[str] | None = None) -> None:
     """
     TaskUpdated event'ini handle eder.
 
     Args:
         event_data: Event verisi
+        channels: Teslim edilecek kanallar (None = hepsi)
     """
     task_id = event_data.get("task_id")
     task_data = event_data.get("data",{})
@@ -45,14 +206,19 @@ async def handle_task_updated(event_data: dict) -> None:
         extra={"correlation_id":correlation_id}
     )
 
-    await send_email_notification(task_data, correlation_id, action="updated")
+    await fan_out(
+        {EMAIL_CHANNEL: email_delivery(event_data, task_data, "updated")},
+        correlation_id,
+        channels
+    )
 
-async def handle_task_deleted(event_data: dict)-> None:
+async def handle_task_deleted(event_data: dict, channels: set[str] | None = None)-> None:
     """
     TaskDeleted event'ini handle eder.
     
     Args:
         event_data: Event verisi
+        channels: Teslim edilecek kanallar (None = hepsi)
     """
     task_id = event_data.get("task_id")
     correlation_id=event_data.get("correlation_id")
@@ -62,14 +228,19 @@ async def handle_task_deleted(event_data: dict)-> None:
         extra={"correlation_id":correlation_id}
     )
 
-    await send_email_notification({"id":task_id},correlation_id, action="deleted")
+    await fan_out(
+        {EMAIL_CHANNEL: email_delivery(event_data, {"id":task_id}, "deleted")},
+        correlation_id,
+        channels
+    )
 
-async def handle_task_completed(event_data: dict)-> None:
+async def handle_task_completed(event_data: dict, channels: set[str] | None = None)-> None:
     """
     TaskCompleted event'ini handle eder.
     
     Args:
         event_data: Event verisi
+        channels: Teslim edilecek kanallar (None = hepsi)
     """
     task_id = event_data.get("task_id")
     task_data = event_data.get("data",{})
@@ -80,8 +251,45 @@ async def handle_task_completed(event_data: dict)-> None:
         extra={"correlation_id":correlation_id}
     )
     
-    await send_email_notification(task_data,correlation_id,action="completed")
-    await send_webhook_notification("task_completed", task_data,correlation_id)
+    await fan_out(
+        {
+            EMAIL_CHANNEL: email_delivery(event_data, task_data, "completed"),
+            WEBHOOK_CHANNEL: partial(
+                send_webhook_notification, "task_completed", task_data, correlation_id
+            ),
+        },
+        correlation_id,
+        channels
+    )
+
+def email_delivery(
+    event_data: dict,
+    task_data: dict,
+    action: str
+) -> Callable[[], Awaitable[None]]:
+    """
+    Event'in email teslimatini dondurur.
+
+    Digest aciksa email kullanicinin digest buffer'ina eklenir,
+    degilse hemen gonderilir.
+    """
+    user_id = event_data.get("user_id")
+    correlation_id = event_data.get("correlation_id")
+    if settings.digest_enabled and user_id is not None:
+        return partial(
+            email_digest.add,
+            user_id,
+            {"action": action, "task": task_data, "correlation_id": correlation_id}
+        )
+    return partial(send_email_notification, task_data, correlation_id, action=action)
+
+# Event tipi -> handler
+EVENT_HANDLERS: dict[str, Callable[[dict, set[str] | None], Awaitable[None]]] = {
+    "task.created": handle_task_created,
+    "task.updated": handle_task_updated,
+    "task.deleted": handle_task_deleted,
+    "task.completed": handle_task_completed,
+}
 
 # ------ NOTIFICATION HELPERS ------ #
 async def send_email_notification(
@@ -126,4 +334,43 @@ async def send_webhook_notification(
     logger.info(
         f"WEBHOOK CALLED: {event_type} - Task #{task_data.get('id')}",
         extra={"correlation_id":correlation_id}
-    )
\ No newline at end of file
+    )
+
+async def send_email_digest(user_id: int, items: list[dict]) -> None:
+    """
+    Kullaniciya biriken bildirimleri tek email olarak gonderir.
+
+    Args:
+        user_id: Alici kullanici ID'si
+        items: action, task ve correlation_id iceren bildirimler
+    """
+    if len(items) == 1:
+        item = items[0]
+        await send_email_notification(item["task"], item["correlation_id"], item["action"])
+        return
+
+    # Simulated email sending delay
+    await asyncio.sleep(0.1)
+
+    counts: dict[str, int] = {}
+    for item in items:
+        counts[item["action"]] = counts.get(item["action"], 0) + 1
+    logger.info(
+        f"EMAIL DIGEST SENT: user #{user_id} - {len(items)} updates "
+        f"({', '.join(f'{count} {action}' for action, count in counts.items())})",
+        extra={"correlation_id":items[-1]["correlation_id"]}
+    )
+
+# Kullanici bazinda email digest buffer'i
+email_digest = DigestBuffer(
+    send_email_digest,
+    window_seconds=settings.digest_window_seconds,
+    max_size=settings.digest_max_size,
+    timeout=settings.email_timeout_seconds
+)
+
+# Islenmis event ID'leri (idempotency)
+event_dedup = DedupStore(
+    ttl_seconds=settings.dedup_ttl_seconds,
+    max_size=settings.dedup_max_size
+)
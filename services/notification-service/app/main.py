@@ -7,10 +7,9 @@ from fastapi import FastAPI, Request
 from contextlib import asynccontextmanager
 import logging
 from app.handlers import(
-    handle_task_completed,
-    handle_task_created,
-    handle_task_deleted,
-    handle_task_updated
+    email_digest,
+    event_dedup,
+    handle_event
 )
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +24,10 @@ async def lifespan(app:FastAPI):
     logger.info("Notification Service starting...")
     yield
     logger.info("Notification Service shutting down...")
+    # Buffer'da bekleyen digest'leri gonder
+    await email_digest.close()
+    logger.info(f"Digest stats: {email_digest.stats()}")
+    logger.info(f"Dedup stats: {event_dedup.stats()}")
 
 app = FastAPI(
     title="Notification Service",
@@ -76,17 +79,8 @@ async def handle_task_event(request: Request):
             extra= {"correlation_id": correlation_id}
         )
 
-        #Route to handler
-        if event_type == "task.created":
-            await handle_task_created(event_data)
-        elif event_type == "task.updated":
-            await handle_task_updated(event_data)
-        elif event_type == "task.deleted":
-            await handle_task_deleted(event_data)
-        elif event_type == "task.completed":
-            await handle_task_completed(event_data)
-        else:
-            logger.warning(f"unkown event type: {event_type}")
+        #Route to handler (Dapr'in tekrar gonderdigi event'ler atlanir)
+        await handle_event(event_data)
         
         #Dapr'a basarili oldugunu bildir.
         return {"status":"SUCCESS"}
@@ -99,4 +93,9 @@ async def handle_task_event(request: Request):
 # ----- HEALTH CHECK ----- #
 @app.get("/health")
 async def health():
-    return {"status":"healthy"}
\ No newline at end of file
+    return {"status":"healthy"}
+
+@app.get("/stats")
+async def stats():
+    """Dedup hit rate ve digest istatistikleri."""
+    return {"dedup": event_dedup.stats(), "digest": email_digest.stats()}
\ No newline at end of file
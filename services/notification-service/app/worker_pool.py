@@ -0,0 +1,147 @@
+"""
+Key'e gore sirali, eszamanli mesaj isleme.
+
+Mesajlar N "lane"e dagitilir; ayni key (task_id) her zaman ayni lane'e
+duser ve bir lane mesajlarini sirayla isler. Boylece ayni task'in
+event'leri geldigi sirayla, farkli task'larin event'leri ise paralel
+islenir.
+
+Kapanista drain() yeni is almayi durdurur ve lane'lerdeki mesajlar
+bitene kadar bekler.
+"""
+import asyncio
+import logging
+import time
+import zlib
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ConsumerMetrics:
+    """
+    Islenen mesaj sayisi, mesaj/saniye ve handler gecikme yuzdelikleri.
+
+    Args:
+        window: Yuzdelikler icin tutulan son olcum sayisi
+    """
+
+    def __init__(self, window: int = 1000):
+        self.started_at = time.monotonic()
+        self.processed = 0
+        self.failed = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float, failed: bool = False) -> None:
+        self.processed += 1
+        if failed:
+            self.failed += 1
+        self._latencies.append(latency)
+
+    def percentile(self, p: float) -> float:
+        """Son olcumlerin p. yuzdeligi (saniye)."""
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+    def stats(self) -> dict[str, Any]:
+        elapsed = time.monotonic() - self.started_at
+        return {
+            "processed": self.processed,
+            "failed": self.failed,
+            "messages_per_second": round(self.processed / elapsed, 2) if elapsed else 0.0,
+            "latency_p50_ms": round(self.percentile(50) * 1000, 2),
+            "latency_p95_ms": round(self.percentile(95) * 1000, 2),
+            "latency_p99_ms": round(self.percentile(99) * 1000, 2),
+        }
+
+
+class KeyedWorkerPool:
+    """
+    Key bazinda sirayi koruyan worker pool.
+
+    Args:
+        lanes: Paralel calisan lane (worker) sayisi
+        handler: Her is icin cagrilan coroutine fonksiyonu
+        metrics: Sonuclarin yazilacagi ConsumerMetrics
+    """
+
+    def __init__(
+        self,
+        lanes: int,
+        handler: Callable[[Any], Awaitable[None]],
+        metrics: ConsumerMetrics | None = None
+    ):
+        self.handler = handler
+        self.metrics = metrics or ConsumerMetrics()
+        self._queues: list[asyncio.Queue] = [asyncio.Queue() for _ in range(lanes)]
+        self._workers: list[asyncio.Task] = []
+        self._accepting = False
+
+    def start(self) -> None:
+        """Lane worker'larini baslatir."""
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._work(queue), name=f"lane-{index}")
+            for index, queue in enumerate(self._queues)
+        ]
+
+    def lane_for(self, key: Any) -> int:
+        """Key'in lane'i (process'ler arasi sabit olsun diye crc32)."""
+        return zlib.crc32(str(key).encode()) % len(self._queues)
+
+    def submit(self, key: Any, item: Any) -> None:
+        """
+        Isi key'in lane'ine ekler.
+
+        Bellekte biriken is sayisini RabbitMQ prefetch_count sinirlar.
+        """
+        if not self._accepting:
+            raise RuntimeError("Worker pool is not accepting work")
+        self._queues[self.lane_for(key)].put_nowait(item)
+
+    @property
+    def pending(self) -> int:
+        """Lane'lerde bekleyen is sayisi."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            item = await queue.get()
+            start = time.perf_counter()
+            failed = False
+            try:
+                await self.handler(item)
+            except Exception as e:
+                failed = True
+                logger.error(f"Worker handler error: {e}")
+            except asyncio.CancelledError:
+                # Drain timeout: mesaj ack'lenmedi, islenmis sayilmaz
+                queue.task_done()
+                raise
+            self.metrics.record(time.perf_counter() - start, failed)
+            queue.task_done()
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """
+        Yeni is almayi durdurur, bekleyen isler bitene kadar bekler
+        ve worker'lari kapatir.
+
+        Args:
+            timeout: En fazla bekleme (saniye); None = sinirsiz
+        """
+        self._accepting = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._queues)), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Drain timed out, {self.pending} messages left unprocessed")
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
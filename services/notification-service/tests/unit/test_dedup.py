@@ -0,0 +1,118 @@
+"""DedupStore ve handle_event idempotency testleri."""
+
+import asyncio
+import time
+
+import pytest
+
+from app import handlers
+from app.dedup import DedupStore
+
+
+class TestDedupStore:
+    """TTL, boyut siniri ve hit rate"""
+
+    async def test_marked_event_is_duplicate(self):
+        store = DedupStore(ttl_seconds=60, max_size=10)
+
+        assert await store.acquire("e1") is True
+        store.release("e1", processed=True)
+
+        assert await store.acquire("e1") is False
+        assert await store.acquire("e2") is True
+        assert store.stats()["hit_rate"] == pytest.approx(1 / 3, abs=0.001)
+        assert store.stats()["duplicates_skipped"] == 1
+
+    async def test_ttl_expiry(self, monkeypatch):
+        store = DedupStore(ttl_seconds=5, max_size=10)
+        store.mark("e1")
+        assert store.seen("e1") is True
+
+        clock = time.monotonic() + 6
+        monkeypatch.setattr("app.dedup.time.monotonic", lambda: clock)
+
+        assert store.seen("e1") is False
+        assert await store.acquire("e1") is True
+
+    async def test_max_size_evicts_oldest(self):
+        store = DedupStore(ttl_seconds=60, max_size=2)
+        for event_id in ("e1", "e2", "e3"):
+            store.mark(event_id)
+
+        assert store.seen("e1") is False
+        assert store.seen("e2") is True
+        assert store.seen("e3") is True
+        assert store.stats()["size"] == 2
+
+    async def test_failed_release_is_not_marked(self):
+        store = DedupStore(ttl_seconds=60, max_size=10)
+
+        assert await store.acquire("e1") is True
+        store.release("e1", processed=False)
+
+        assert await store.acquire("e1") is True
+
+    async def test_concurrent_acquire_waits_for_in_flight(self):
+        store = DedupStore(ttl_seconds=60, max_size=10)
+        assert await store.acquire("e1") is True
+
+        waiter = asyncio.create_task(store.acquire("e1"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        assert store.stats()["in_flight"] == 1
+
+        store.release("e1", processed=True)
+        assert await waiter is False
+
+
+class TestHandleEvent:
+    """handle_event: duplicate atlama ve yarisan teslimler"""
+
+    @pytest.fixture
+    def calls(self, monkeypatch) -> list[dict]:
+        calls: list[dict] = []
+
+        async def fake_handler(event_data: dict, channels=None) -> None:
+            await asyncio.sleep(0.01)
+            if event_data.get("fail"):
+                raise RuntimeError("handler failed")
+            calls.append(event_data)
+
+        monkeypatch.setattr(handlers, "event_dedup", DedupStore(ttl_seconds=60, max_size=100))
+        monkeypatch.setitem(handlers.EVENT_HANDLERS, "task.created", fake_handler)
+        return calls
+
+    async def test_duplicate_is_skipped(self, calls):
+        event = {"event_id": "e1", "event_type": "task.created"}
+
+        assert await handlers.handle_event(event) is True
+        assert await handlers.handle_event(event) is False
+        assert len(calls) == 1
+        assert handlers.event_dedup.stats()["hit_rate"] == 0.5
+
+    async def test_failed_handler_is_not_marked(self, calls):
+        event = {"event_id": "e1", "event_type": "task.created", "fail": True}
+
+        with pytest.raises(RuntimeError):
+            await handlers.handle_event(event)
+        assert handlers.event_dedup.seen("e1") is False
+
+        # Retry ayni event_id ile tekrar islenir
+        assert await handlers.handle_event({**event, "fail": False}) is True
+        assert len(calls) == 1
+
+    async def test_concurrent_deliveries_run_handler_once(self, calls):
+        event = {"event_id": "e1", "event_type": "task.created"}
+
+        results = await asyncio.gather(*(handlers.handle_event(event) for _ in range(3)))
+
+        assert sorted(results) == [False, False, True]
+        assert len(calls) == 1
+
+    async def test_events_without_id_are_always_processed(self, calls):
+        event = {"event_type": "task.created"}
+
+        await handlers.handle_event(event)
+        await handlers.handle_event(event)
+
+        assert len(calls) == 2
@@ -0,0 +1,150 @@
+"""DigestBuffer ve email digest testleri."""
+
+import asyncio
+
+from app import handlers
+from app.digest import DigestBuffer
+
+
+class RecordingSender:
+    def __init__(self, fail_times: int = 0, delay: float = 0.0):
+        self.digests: list[tuple[int, list]] = []
+        self.calls = 0
+        self.fail_times = fail_times
+        self.delay = delay
+
+    async def __call__(self, key: int, items: list) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.fail_times:
+            raise ConnectionError("smtp down")
+        self.digests.append((key, items))
+
+
+class TestDigestBuffer:
+    """Boyut/sure ile flush, retry ve close"""
+
+    async def test_flushes_on_max_size(self):
+        sender = RecordingSender()
+        digest = DigestBuffer(sender, window_seconds=60, max_size=3)
+
+        for index in range(7):
+            await digest.add(1, index)
+        await asyncio.sleep(0.01)
+
+        assert sender.digests == [(1, [0, 1, 2]), (1, [3, 4, 5])]
+        assert digest.pending == 1
+        await digest.close()
+
+    async def test_flushes_after_window(self):
+        sender = RecordingSender()
+        digest = DigestBuffer(sender, window_seconds=0.05, max_size=100)
+
+        await digest.add(1, "a")
+        await digest.add(1, "b")
+        await digest.add(2, "c")
+        assert sender.digests == []
+
+        await asyncio.sleep(0.1)
+
+        assert sorted(sender.digests) == [(1, ["a", "b"]), (2, ["c"])]
+        assert digest.pending == 0
+        assert digest.stats()["digests_sent"] == 2
+
+    async def test_close_drains_buffers(self):
+        sender = RecordingSender(delay=0.01)
+        digest = DigestBuffer(sender, window_seconds=60, max_size=100)
+        await digest.add(1, "a")
+        await digest.add(2, "b")
+
+        await digest.close()
+
+        assert sorted(sender.digests) == [(1, ["a"]), (2, ["b"])]
+        assert digest.pending == 0
+
+    async def test_failed_send_is_retried(self):
+        sender = RecordingSender(fail_times=2)
+        digest = DigestBuffer(
+            sender, window_seconds=60, max_size=100, max_attempts=3, retry_delay=0
+        )
+        await digest.add(1, "a")
+
+        await digest.close()
+
+        assert sender.calls == 3
+        assert sender.digests == [(1, ["a"])]
+        assert digest.stats()["digests_failed"] == 0
+
+    async def test_digest_dropped_after_max_attempts(self):
+        sender = RecordingSender(fail_times=10)
+        digest = DigestBuffer(
+            sender, window_seconds=60, max_size=100, max_attempts=2, retry_delay=0
+        )
+        await digest.add(1, "a")
+
+        await digest.close()
+
+        assert sender.calls == 2
+        assert digest.stats()["digests_failed"] == 1
+        assert digest.stats()["digests_sent"] == 0
+
+    async def test_send_timeout_counts_as_failure(self):
+        sender = RecordingSender(delay=1)
+        digest = DigestBuffer(
+            sender, window_seconds=60, max_size=100,
+            max_attempts=1, timeout=0.01, retry_delay=0
+        )
+        await digest.add(1, "a")
+
+        await asyncio.wait_for(digest.close(), timeout=0.5)
+
+        assert digest.stats()["digests_failed"] == 1
+
+
+class TestEmailDigest:
+    """send_email_digest ve handler entegrasyonu"""
+
+    async def test_single_item_sent_as_normal_email(self, monkeypatch):
+        sent: list[tuple] = []
+
+        async def fake_send_email(task_data, correlation_id, action="created"):
+            sent.append((task_data, correlation_id, action))
+
+        monkeypatch.setattr(handlers, "send_email_notification", fake_send_email)
+
+        await handlers.send_email_digest(
+            1, [{"action": "updated", "task": {"id": 5}, "correlation_id": "c1"}]
+        )
+
+        assert sent == [({"id": 5}, "c1", "updated")]
+
+    async def test_many_items_sent_as_one_digest(self, monkeypatch):
+        sent: list[tuple] = []
+
+        async def fake_send_email(*args, **kwargs):
+            sent.append(args)
+
+        monkeypatch.setattr(handlers, "send_email_notification", fake_send_email)
+
+        await handlers.send_email_digest(
+            1,
+            [{"action": "updated", "task": {"id": i}, "correlation_id": None} for i in range(3)],
+        )
+
+        assert sent == []
+
+    async def test_handler_emails_go_through_digest(self, monkeypatch):
+        sender = RecordingSender()
+        digest = DigestBuffer(sender, window_seconds=60, max_size=100)
+        monkeypatch.setattr(handlers, "email_digest", digest)
+
+        for task_id in range(3):
+            await handlers.handle_task_updated(
+                {"task_id": task_id, "user_id": 9, "data": {"id": task_id}}
+            )
+        await digest.close()
+
+        assert len(sender.digests) == 1
+        user_id, items = sender.digests[0]
+        assert user_id == 9
+        assert [item["task"]["id"] for item in items] == [0, 1, 2]
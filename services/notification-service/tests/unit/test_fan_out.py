@@ -0,0 +1,184 @@
+"""fan_out ve kanal bazinda retry (x-failed-channels) testleri."""
+
+import asyncio
+import json
+
+import pytest
+
+from app import consumer
+from app.config import settings
+from app.handlers import (
+    EMAIL_CHANNEL,
+    WEBHOOK_CHANNEL,
+    ChannelDeliveryError,
+    fan_out,
+)
+
+
+def recording_send(calls: list[str], channel: str, delay: float = 0.0):
+    async def send() -> None:
+        await asyncio.sleep(delay)
+        calls.append(channel)
+    return send
+
+
+class TestFanOut:
+    """Kanal teslimatlarinin paralel calismasi ve hata raporlama"""
+
+    async def test_channels_run_concurrently(self):
+        calls: list[str] = []
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await fan_out(
+            {
+                EMAIL_CHANNEL: recording_send(calls, EMAIL_CHANNEL, 0.1),
+                WEBHOOK_CHANNEL: recording_send(calls, WEBHOOK_CHANNEL, 0.1),
+            },
+            correlation_id=None,
+        )
+
+        assert sorted(calls) == [EMAIL_CHANNEL, WEBHOOK_CHANNEL]
+        # Sirayla olsaydi ~0.2s surerdi
+        assert loop.time() - start < 0.18
+
+    async def test_sequential_mode(self, monkeypatch):
+        monkeypatch.setattr(settings, "notification_fanout_mode", "sequential")
+        calls: list[str] = []
+
+        await fan_out(
+            {
+                EMAIL_CHANNEL: recording_send(calls, EMAIL_CHANNEL, 0.01),
+                WEBHOOK_CHANNEL: recording_send(calls, WEBHOOK_CHANNEL),
+            },
+            correlation_id=None,
+        )
+
+        assert calls == [EMAIL_CHANNEL, WEBHOOK_CHANNEL]
+
+    async def test_timeout_fails_only_that_channel(self, monkeypatch):
+        monkeypatch.setattr(settings, "webhook_timeout_seconds", 0.01)
+        calls: list[str] = []
+
+        with pytest.raises(ChannelDeliveryError) as exc_info:
+            await fan_out(
+                {
+                    EMAIL_CHANNEL: recording_send(calls, EMAIL_CHANNEL),
+                    WEBHOOK_CHANNEL: recording_send(calls, WEBHOOK_CHANNEL, 1),
+                },
+                correlation_id=None,
+            )
+
+        assert list(exc_info.value.failed) == [WEBHOOK_CHANNEL]
+        assert "timed out" in exc_info.value.failed[WEBHOOK_CHANNEL]
+        assert calls == [EMAIL_CHANNEL]
+
+    async def test_channel_error_is_reported(self):
+        async def broken() -> None:
+            raise ConnectionError("smtp down")
+
+        with pytest.raises(ChannelDeliveryError) as exc_info:
+            await fan_out(
+                {EMAIL_CHANNEL: broken, WEBHOOK_CHANNEL: recording_send([], WEBHOOK_CHANNEL)},
+                correlation_id=None,
+            )
+
+        assert exc_info.value.failed == {EMAIL_CHANNEL: "smtp down"}
+
+    async def test_retry_runs_only_failed_channels(self):
+        calls: list[str] = []
+
+        await fan_out(
+            {
+                EMAIL_CHANNEL: recording_send(calls, EMAIL_CHANNEL),
+                WEBHOOK_CHANNEL: recording_send(calls, WEBHOOK_CHANNEL),
+            },
+            correlation_id=None,
+            channels={WEBHOOK_CHANNEL},
+        )
+
+        assert calls == [WEBHOOK_CHANNEL]
+
+
+class FakeExchange:
+    def __init__(self):
+        self.published: list[tuple[object, str]] = []
+
+    async def publish(self, message, routing_key: str) -> None:
+        self.published.append((message, routing_key))
+
+
+class FakeChannel:
+    def __init__(self):
+        self.default_exchange = FakeExchange()
+
+
+class FakeMessage:
+    def __init__(self, headers: dict | None = None):
+        self.body = json.dumps(
+            {"event_id": "e1", "event_type": "task.created", "task_id": 1}
+        ).encode()
+        self.headers = headers or {}
+        self.routing_key = "task.created"
+        self.content_type = "application/json"
+        self.correlation_id = None
+        self.acked = False
+
+    async def ack(self) -> None:
+        self.acked = True
+
+
+class TestChannelRetry:
+    """Consumer'in basarisiz kanallari retry header'ina yazmasi"""
+
+    def test_get_failed_channels(self):
+        assert consumer.get_failed_channels(FakeMessage()) is None
+        assert consumer.get_failed_channels(
+            FakeMessage({consumer.FAILED_CHANNELS_HEADER: b"email,webhook"})
+        ) == {"email", "webhook"}
+
+    async def test_channel_failure_sets_header(self, monkeypatch):
+        async def failing_handle_event(event_data, channels=None):
+            raise ChannelDeliveryError({WEBHOOK_CHANNEL: "timed out"})
+
+        monkeypatch.setattr(consumer, "handle_event", failing_handle_event)
+        channel = FakeChannel()
+        message = FakeMessage()
+
+        await consumer.process_message(message, channel, None)
+
+        retry, routing_key = channel.default_exchange.published[0]
+        assert retry.headers[consumer.FAILED_CHANNELS_HEADER] == WEBHOOK_CHANNEL
+        assert retry.headers[consumer.RETRY_HEADER] == 1
+        assert routing_key == consumer.get_retry_queue_name(1)
+        assert message.acked
+
+    async def test_retry_passes_failed_channels_to_handler(self, monkeypatch):
+        received: list[set[str] | None] = []
+
+        async def recording_handle_event(event_data, channels=None):
+            received.append(channels)
+
+        monkeypatch.setattr(consumer, "handle_event", recording_handle_event)
+        message = FakeMessage({consumer.FAILED_CHANNELS_HEADER: WEBHOOK_CHANNEL})
+
+        await consumer.process_message(message, FakeChannel(), None)
+
+        assert received == [{WEBHOOK_CHANNEL}]
+
+    async def test_non_channel_error_keeps_existing_header(self, monkeypatch):
+        async def failing_handle_event(event_data, channels=None):
+            raise RuntimeError("unexpected")
+
+        monkeypatch.setattr(consumer, "handle_event", failing_handle_event)
+        channel = FakeChannel()
+        message = FakeMessage(
+            {consumer.FAILED_CHANNELS_HEADER: WEBHOOK_CHANNEL, consumer.RETRY_HEADER: 1}
+        )
+
+        await consumer.process_message(message, channel, None)
+
+        retry, routing_key = channel.default_exchange.published[0]
+        assert retry.headers[consumer.FAILED_CHANNELS_HEADER] == WEBHOOK_CHANNEL
+        assert retry.headers[consumer.RETRY_HEADER] == 2
+        assert routing_key == consumer.get_retry_queue_name(2)
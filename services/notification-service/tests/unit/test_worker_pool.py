@@ -0,0 +1,236 @@
+"""KeyedWorkerPool, ConsumerMetrics ve consume_with_pool testleri."""
+
+import asyncio
+
+import pytest
+
+from app import consumer
+from app.worker_pool import ConsumerMetrics, KeyedWorkerPool
+
+
+def keys_on_different_lanes(pool: KeyedWorkerPool) -> tuple[str, str]:
+    """Farkli lane'e dusen iki key bulur."""
+    first = "task-0"
+    for index in range(1, 100):
+        key = f"task-{index}"
+        if pool.lane_for(key) != pool.lane_for(first):
+            return first, key
+    raise AssertionError("no key on a different lane")
+
+
+class TestKeyedWorkerPool:
+    """Key bazinda sira ve drain davranisi"""
+
+    async def test_same_key_in_order_different_keys_in_parallel(self):
+        processed: list[tuple[str, int]] = []
+        running = 0
+        max_running = 0
+
+        async def handler(item: tuple[str, int]) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            processed.append(item)
+            running -= 1
+
+        pool = KeyedWorkerPool(4, handler)
+        first, second = keys_on_different_lanes(pool)
+        pool.start()
+        for index in range(5):
+            pool.submit(first, (first, index))
+            pool.submit(second, (second, index))
+        await pool.drain(timeout=5)
+
+        assert [i for key, i in processed if key == first] == [0, 1, 2, 3, 4]
+        assert [i for key, i in processed if key == second] == [0, 1, 2, 3, 4]
+        # Iki key ayni anda islendi
+        assert max_running == 2
+        assert pool.metrics.processed == 10
+
+    async def test_same_key_never_runs_concurrently(self):
+        running = 0
+        max_running = 0
+
+        async def handler(item: int) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.005)
+            running -= 1
+
+        pool = KeyedWorkerPool(4, handler)
+        pool.start()
+        for index in range(5):
+            pool.submit("same", index)
+        await pool.drain(timeout=5)
+
+        assert max_running == 1
+
+    async def test_drain_finishes_queued_work(self):
+        done: list[int] = []
+
+        async def handler(item: int) -> None:
+            await asyncio.sleep(0.005)
+            done.append(item)
+
+        pool = KeyedWorkerPool(2, handler)
+        pool.start()
+        for index in range(10):
+            pool.submit(index, index)
+        await pool.drain(timeout=5)
+
+        assert sorted(done) == list(range(10))
+        assert pool.pending == 0
+
+    async def test_drain_stops_at_timeout(self):
+        never = asyncio.Event()
+
+        async def handler(item: int) -> None:
+            await never.wait()
+
+        pool = KeyedWorkerPool(1, handler)
+        pool.start()
+        for index in range(3):
+            pool.submit("key", index)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await pool.drain(timeout=0.05)
+
+        assert loop.time() - start < 1
+        # Ilk mesaj islenirken iptal edildi, kalanlar islenmedi
+        assert pool.pending == 2
+        assert pool.metrics.processed == 0
+
+    async def test_handler_errors_are_counted(self):
+        async def handler(item: int) -> None:
+            if item == 1:
+                raise ValueError("boom")
+
+        pool = KeyedWorkerPool(1, handler)
+        pool.start()
+        for index in range(3):
+            pool.submit("key", index)
+        await pool.drain(timeout=5)
+
+        assert pool.metrics.processed == 3
+        assert pool.metrics.failed == 1
+
+    async def test_submit_after_drain_raises(self):
+        async def handler(item: int) -> None:
+            pass
+
+        pool = KeyedWorkerPool(1, handler)
+        pool.start()
+        await pool.drain(timeout=1)
+
+        with pytest.raises(RuntimeError):
+            pool.submit("key", 1)
+
+    async def test_submit_before_start_raises(self):
+        async def handler(item: int) -> None:
+            pass
+
+        with pytest.raises(RuntimeError):
+            KeyedWorkerPool(1, handler).submit("key", 1)
+
+
+class TestConsumerMetrics:
+    """Yuzdelik ve sayac hesaplari"""
+
+    def test_percentiles(self):
+        metrics = ConsumerMetrics()
+        for ms in range(1, 101):
+            metrics.record(ms / 1000)
+
+        assert metrics.percentile(50) == pytest.approx(0.050, abs=0.001)
+        assert metrics.percentile(95) == pytest.approx(0.095, abs=0.001)
+        assert metrics.percentile(99) == pytest.approx(0.099, abs=0.001)
+        assert metrics.percentile(100) == pytest.approx(0.100)
+        assert metrics.stats()["latency_p95_ms"] == pytest.approx(95, abs=1)
+
+    def test_empty_metrics(self):
+        metrics = ConsumerMetrics()
+
+        assert metrics.percentile(99) == 0.0
+        assert metrics.stats()["processed"] == 0
+
+    def test_window_keeps_recent_latencies(self):
+        metrics = ConsumerMetrics(window=10)
+        for _ in range(100):
+            metrics.record(1.0)
+        for _ in range(10):
+            metrics.record(0.001)
+
+        assert metrics.processed == 110
+        assert metrics.percentile(99) == 0.001
+
+    def test_failed_count(self):
+        metrics = ConsumerMetrics()
+        metrics.record(0.01)
+        metrics.record(0.01, failed=True)
+
+        assert metrics.stats()["failed"] == 1
+        assert metrics.stats()["processed"] == 2
+
+
+class FakeMessage:
+    def __init__(self, task_id: int, index: int):
+        self.body = f'{{"task_id": {task_id}, "index": {index}}}'.encode()
+        self.routing_key = "task.updated"
+        self.task_id = task_id
+        self.index = index
+
+
+class FakeQueue:
+    def __init__(self):
+        self.callback = None
+        self.cancelled: str | None = None
+
+    async def consume(self, callback):
+        self.callback = callback
+        return "ctag"
+
+    async def cancel(self, consumer_tag: str) -> None:
+        self.cancelled = consumer_tag
+
+
+class TestConsumeWithPool:
+    """consume_with_pool: teslim, sira ve graceful shutdown"""
+
+    async def test_processes_and_drains_on_shutdown(self, monkeypatch):
+        processed: list[tuple[int, int]] = []
+
+        async def fake_process_message(message, channel, dlx_exchange) -> None:
+            await asyncio.sleep(0.005)
+            processed.append((message.task_id, message.index))
+
+        shutdown = asyncio.Event()
+        monkeypatch.setattr(consumer, "process_message", fake_process_message)
+        monkeypatch.setattr(consumer, "shutdown_event", shutdown)
+        monkeypatch.setattr(consumer, "consumer_metrics", ConsumerMetrics())
+        queue = FakeQueue()
+
+        task = asyncio.create_task(consumer.consume_with_pool(queue, None, None))
+        while queue.callback is None:
+            await asyncio.sleep(0)
+        for index in range(4):
+            for task_id in (1, 2, 3):
+                await queue.callback(FakeMessage(task_id, index))
+
+        shutdown.set()
+        await asyncio.wait_for(task, timeout=5)
+
+        assert queue.cancelled == "ctag"
+        assert len(processed) == 12
+        for task_id in (1, 2, 3):
+            assert [i for t, i in processed if t == task_id] == [0, 1, 2, 3]
+        assert consumer.consumer_metrics.processed == 12
+
+    def test_ordering_key_falls_back_to_routing_key(self):
+        message = FakeMessage(7, 0)
+        assert consumer.get_ordering_key(message) == "7"
+
+        message.body = b"not json"
+        assert consumer.get_ordering_key(message) == "task.updated"
@@ -37,6 +37,22 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_name(name, type_, parent_names) -> bool:
+    """
+    Full-text search nesneleri (bkz. app.db.search) model'de tanimli degil;
+    autogenerate'in bunlari silmeye calismamasi icin disarida birakilir.
+    """
+    if type_ == "table":
+        return not (name or "").startswith("tasks_fts")
+    if type_ == "column":
+        return name != "search_vector"
+    if type_ == "index":
+        return name not in (
+            "ix_tasks_search_vector", "ix_tasks_title_trgm", "ix_tasks_description_trgm"
+        )
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -53,6 +69,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle":"named"}
     )
@@ -63,7 +80,11 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Asıl migration işlemini gerçekleştiren senkron yardımcı fonksiyon."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,39 @@
+"""add_task_access_path_indexes
+
+Revision ID: 5b1e7c9a2d40
+Revises: cd842e321782
+Create Date: 2026-10-17 10:12:41.512093
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c9a2d40'
+down_revision: str | Sequence[str] | None = 'cd842e321782'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tum task sorgulari user_id ile filtreler; status/priority filtreleri ve
+    # (created_at, id) keyset siralamasi icin kompozit index'ler.
+    op.create_index(
+        'ix_tasks_user_id_status', 'tasks', ['user_id', 'status'], unique=False
+    )
+    op.create_index(
+        'ix_tasks_user_id_priority', 'tasks', ['user_id', 'priority'], unique=False
+    )
+    op.create_index(
+        'ix_tasks_user_id_created_at_id', 'tasks', ['user_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_user_id_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_priority', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_status', table_name='tasks')
@@ -0,0 +1,51 @@
+"""add_task_trigram_indexes
+
+Revision ID: c47d9e05b3a8
+Revises: 8e3f2a61c7b9
+Create Date: 2026-10-17 13:05:52.871346
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from app.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d9e05b3a8'
+down_revision: str | Sequence[str] | None = '8e3f2a61c7b9'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _trigram_enabled() -> bool:
+    # pg_trgm sadece PostgreSQL'de ve search_mode=trigram iken kurulur
+    # (app.db.search._trigram_mode ile ayni kosul). fulltext modunda extension
+    # yetkisi gerekmez ve kullanilmayan index'ler yazmalari yavaslatmaz.
+    # Sonradan trigram moduna gecilirse bu revision yeniden uygulanmalidir.
+    return (
+        op.get_bind().dialect.name == 'postgresql'
+        and settings.search_mode == 'trigram'
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _trigram_enabled():
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_tasks_title_trgm ON tasks USING gin (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_tasks_description_trgm ON tasks "
+        "USING gin (description gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _trigram_enabled():
+        return
+    op.execute("DROP INDEX IF EXISTS ix_tasks_description_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_tasks_title_trgm")
+    # Extension baska nesneler tarafindan kullaniliyor olabilir, silinmez
@@ -11,7 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ForbiddenException, InvalidTokenException
 from app.core.security import decode_token
-from app.db.database import get_db_session
+from app.core.user_cache import cache_user, get_cached_user
+from app.db.database import get_db_session, get_replica_db_session
 from app.db.entities import UserEntity
 from app.db.repositories.user import UserRepository
 from app.db.unit_of_work import TaskUnitOfWork
@@ -32,13 +33,23 @@ async def get_unit_of_work(
     
     pass
 
+async def get_read_unit_of_work(
+        session: AsyncSession | None = Depends(get_replica_db_session)
+) -> TaskUnitOfWork | None:
+    """
+    Read replica session'i ile unit of work olusturur.
+    Replica tanimli degilse None doner (okumalar primary'den yapilir).
+    """
+    return TaskUnitOfWork(session) if session is not None else None
+
 async def get_task_service(
     uow: TaskUnitOfWork = Depends(get_unit_of_work),
+    read_uow: TaskUnitOfWork | None = Depends(get_read_unit_of_work),
 ) -> TaskService:
     """Taskunitten gelen Session ile calisan
     bir task service nesnesi uretir."""
 
-    return TaskService(uow)
+    return TaskService(uow, read_uow)
 
 
 async def get_auth_service(uow: TaskUnitOfWork = Depends(get_unit_of_work)):
@@ -51,7 +62,9 @@ async def get_current_user(
     session: AsyncSession = Depends(get_db_session),
 ) -> UserEntity:
     """
-    Gelen istekteki token'i dogrular ve veritabanindan kullaniciyi getirir.
+    Gelen istekteki token'i dogrular ve kullaniciyi getirir.
+    Kullanici once user cache'ten (L1 + Redis) aranir, yoksa veritabanindan
+    okunup cache'e yazilir.
 
     Args:
         credentials: HTTP Bearer token bilgileri.
@@ -70,14 +83,19 @@ async def get_current_user(
     if not payload or payload.get("type") != "access" or payload.get("sub") is None:
         raise InvalidTokenException()
 
-    # User id al ve kullaniciyi bul
+    # User id al, once cache'e bak (her istekte DB'ye gitmemek icin)
     user_id = int(payload["sub"])
+    user = await get_cached_user(user_id)
+    if user:
+        return user
+
     repo = UserRepository(session)
     user = await repo.get_by_id(user_id)
 
     # Kullanici hala var mi kontrolu
     if not user:
         raise InvalidTokenException()
+    await cache_user(user)
     return user
 
 
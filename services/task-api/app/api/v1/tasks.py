@@ -1,8 +1,13 @@
+from typing import Literal
+
 from fastapi import APIRouter, Query, status
 
 from app.api.dependencies import CurrentUserDep, TaskServiceDep
 from app.models.common import ApiResponse, PaginatedResponse, PaginationParams
 from app.models.task import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkUpdate,
     TaskCreate,
     TaskFilter,
     TaskPriority,
@@ -26,6 +31,50 @@ async def create_task(
     return ApiResponse(success=True, data=task)
 
 
+# /bulk route'lari /{task_id}'den once tanimlanmali
+@tasks_router.post(
+    "/bulk",
+    response_model=ApiResponse[list[TaskResponse]],
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_tasks(
+    body: TaskBulkCreate, service: TaskServiceDep, current_user: CurrentUserDep
+):
+    """
+    Birden fazla task'i tek istekte olusturur (tek INSERT, tek commit).
+    Task'lar gonderildigi sirayla doner.
+    """
+    tasks = await service.bulk_create(body.tasks, user_id=current_user.id)
+
+    return ApiResponse(success=True, data=tasks)
+
+
+@tasks_router.put("/bulk", response_model=ApiResponse[list[TaskResponse]])
+async def bulk_update_tasks(
+    body: TaskBulkUpdate, service: TaskServiceDep, current_user: CurrentUserDep
+):
+    """
+    Birden fazla task'i tek istekte gunceller (tek UPDATE, tek commit).
+    Task'lardan biri bulunamazsa hicbiri guncellenmez (404).
+    """
+    tasks = await service.bulk_update(body.tasks, user_id=current_user.id)
+
+    return ApiResponse(success=True, data=tasks)
+
+
+@tasks_router.delete("/bulk", response_model=ApiResponse[list[int]])
+async def bulk_delete_tasks(
+    body: TaskBulkDelete, service: TaskServiceDep, current_user: CurrentUserDep
+):
+    """
+    Birden fazla task'i tek istekte siler (tek DELETE, tek commit).
+    Task'lardan biri bulunamazsa hicbiri silinmez (404). Silinen ID'leri doner.
+    """
+    deleted_ids = await service.bulk_delete(body.ids, user_id=current_user.id)
+
+    return ApiResponse(success=True, data=deleted_ids)
+
+
 @tasks_router.get("/", response_model=ApiResponse[PaginatedResponse[TaskResponse]])
 async def get_all_tasks(
     service: TaskServiceDep,
@@ -34,26 +83,66 @@ async def get_all_tasks(
       priority: TaskPriority | None = None,
       search: str | None= None,
       page: int = Query(default=1, ge=1),
-      page_size: int = Query(default=10, ge=1, le=100)
+      page_size: int = Query(default=10, ge=1, le=100),
+      paginate: Literal["page", "cursor"] = Query(default="page"),
+      cursor: str | None = Query(default=None, max_length=512),
+      include_total: bool = Query(default=True),
     ):
-    """Giris yapan kullanicinin tum task'larini filtre ve sayfali olarak listeler."""
+    """
+    Giris yapan kullanicinin tum task'larini filtre ve sayfali olarak listeler.
+
+    Iki sayfalama modu vardir:
+    - page  : page/page_size ile OFFSET tabanli (varsayilan)
+    - cursor: paginate=cursor ile baslanir, sonraki sayfalar icin cevaptaki
+              next_cursor, cursor parametresiyle geri gonderilir. Derin
+              sayfalarda da hizlidir. cursor verilirse mod otomatik cursor olur.
+
+    Cok buyuk listelerde include_total=false ile toplam sayim atlanir;
+    total/total_pages None doner, sonraki sayfa icin has_more kullanilir.
+    """
     filters= TaskFilter(status=status, priority=priority, search=search)
+
+    if paginate == "cursor" or cursor:
+        tasks, total, next_cursor = await service.get_page_after(
+            user_id=current_user.id,
+            filters=filters,
+            cursor=cursor,
+            page_size=page_size,
+            with_total=include_total,
+        )
+        paginated = PaginatedResponse(
+            items=tasks,
+            total=total,
+            page=1,
+            page_size=page_size,
+            total_pages=(
+                (total + page_size - 1) // page_size if total is not None else None
+            ),
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor,
+        )
+        return ApiResponse(success=True, data=paginated)
+
     pagination = PaginationParams(page=page,page_size=page_size)
 
-    tasks, total = await service.get_all(
+    tasks, total, has_more = await service.get_all(
         user_id=current_user.id,
         filters=filters,
-        pagination=pagination
+        pagination=pagination,
+        with_total=include_total
     ) 
 
-    total_pages = (total + page_size - 1) // page_size # Yukari yuvarlama
+    total_pages = (
+        (total + page_size - 1) // page_size if total is not None else None
+    ) # Yukari yuvarlama
 
     paginated = PaginatedResponse(
         items=tasks,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        has_more=has_more
     )
 
     return ApiResponse(success=True, data=paginated)
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,6 +10,29 @@ class Settings(BaseSettings):
     debug: bool = False
     api_v1_prefix: str = "/api/v1"
     database_url: str = "sqlite+aiosqlite:///./task_management.db"
+    # Tanimliysa okumalar replica'ya gider (bkz. app.db.routing)
+    database_replica_url: str | None = None
+    read_your_writes_seconds: float = 5.0 # yazan kullanici bu sure primary'den okur
+    # Database Pool Settings (bos = surucuye gore varsayilan, bkz. app.db.pool)
+    db_pool_size: int | None = None # asyncpg: db_bulkhead kapasitesi, aiosqlite: 5
+    db_max_overflow: int | None = None # asyncpg: 5, aiosqlite: 10
+    db_pool_timeout_seconds: float = 10.0 # pool'dan baglanti bekleme siniri
+    db_pool_pre_ping: bool | None = None # asyncpg: acik, aiosqlite: kapali
+    db_pool_recycle_seconds: int | None = None # asyncpg: 1800, aiosqlite: -1 (kapali)
+    # SQLAlchemy + asyncpg prepared statement cache'leri (pgbouncer transaction modu: 0)
+    db_statement_cache_size: int = 100
+    db_statement_timeout_ms: int = 0 # PostgreSQL statement_timeout, 0 = sinirsiz
+    # Task Search Settings (bkz. app.db.search)
+    # trigram: sadece PostgreSQL (pg_trgm)
+    search_mode: Literal["fulltext", "trigram"] = "fulltext"
+    search_trigram_threshold: float = 0.3 # 0-1 arasi, dusuk = daha toleransli eslesme
+    # Bulk Task Endpoints (/tasks/bulk)
+    task_bulk_max_items: int = 100 # tek istekte en fazla islem
+    # Transactional Outbox (bkz. app.core.outbox)
+    outbox_relay_enabled: bool = True # False: event'leri baska bir relay publish eder
+    outbox_batch_size: int = 100 # relay'in bir turda publish ettigi en fazla event
+    outbox_poll_interval_seconds: float = 1.0 # notify gelmezse tablo kontrol araligi
+    outbox_max_attempts: int = 10 # bu kadar basarisiz denemeden sonra event park edilir
 
     # Yapılandırma (ConfigDict)
     model_config = SettingsConfigDict(
@@ -19,12 +44,19 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
+    jwt_decode_cache_size: int = 10_000 # dogrulanmis token cache'i, 0 = kapali
+    # Password Hashing Settings (bcrypt thread pool)
+    password_hash_workers: int = 4 # ayni anda calisan bcrypt islemi
+    password_hash_max_queue: int = 32 # pool doluyken bekleyebilecek is, fazlasi 503
     #RabbitMQ Settings
     rabbitmq_host: str = "localhost"
     rabbitmq_port: int = 5672
     rabbitmq_user: str = "taskuser"
     rabbitmq_password: str = "taskpass" 
     rabbitmq_vhost: str = "taskhost"
+    rabbitmq_channel_pool_size: int = 4 # publisher confirms acik channel sayisi
+    rabbitmq_publish_buffer_size: int = 1000 # confirm bekleyen en fazla mesaj
+    rabbitmq_publish_timeout_seconds: float = 10.0 # bir mesajin confirm bekleme siniri
     @property
     def rabbitmq_url(self) -> str:
         """RabbitMQ AMQP URL'ini dondurur."""
@@ -35,9 +67,24 @@ class Settings(BaseSettings):
     redis_db: int = 0 
     redis_password: str |None = None
     cache_ttl_seconds: int = 300 # cache ne kadar yasasin suresi 300 saniye
+    # Local (L1) Cache Settings - Redis'in onundeki process ici cache
+    local_cache_enabled: bool = False
+    local_cache_max_entries: int = 10_000
+    local_cache_max_bytes: int = 64 * 1024 * 1024 # 64 MB
+    local_cache_ttl_seconds: float = 5.0 # kacirilan invalidation'in etkisini sinirlar
+    local_cache_invalidation_channel: str = "cache:invalidate"
+    # User Principal Cache Settings - get_current_user'in DB'ye gitmemesi icin
+    user_cache_enabled: bool = True
+    user_cache_ttl_seconds: int = 300 # Redis'teki kopya
+    user_cache_local_ttl_seconds: float = 5.0 # worker ici kopya
+    user_cache_max_entries: int = 10_000
     #Rate Limiting Settings
     rate_limiting_requests: int= 100
     rate_limit_window_seconds: int = 60
+    # hybrid: worker ici bucket + periyodik Redis sync
+    rate_limit_mode: Literal["redis", "hybrid"] = "redis"
+    rate_limit_sync_interval_ms: int = 100 # hybrid modda Redis'e senkronizasyon araligi
+    rate_limit_sync_tolerance: float = 0.05 # sync'siz harcanabilecek max_requests orani
     # Resilience Retry Settings
     retry_max_attempts: int = 3
     retry_min_wait_seconds: float = 1.0
@@ -89,15 +89,56 @@ class RedisCache:
         except Exception as e:
             logger.error(f"Redis DELETE error for key {key} : {e}")
 
+    async def get_version(self, key: str) -> int:
+        """
+        Versiyon sayacini okur (namespace invalidation icin).
+        Sayac yoksa veya Redis'e ulasilamiyorsa 0 doner.
+        """
+        if not self.redis:
+            return 0
+        try:
+            value = await self.redis.get(key)
+            return int(value) if value else 0
+        except Exception as e:
+            logger.error(f"Redis GET VERSION error for key {key}: {e}")
+            return 0
+
+    async def incr(self, key: str) -> int | None:
+        """
+        Sayaci tek bir INCR ile atomik olarak artirir.
+        Versiyonlu invalidation'da kullanicinin tum cache'ini O(1) maliyetle
+        gecersiz kilar.
+        """
+        if not self.redis:
+            return None
+        try:
+            value = await self.redis.incr(key)
+            logger.debug(f"Incremented key: {key} -> {value}")
+            return value
+        except Exception as e:
+            logger.error(f"Redis INCR error for key {key}: {e}")
+            return None
+
     async def delete_pattern(self, pattern: str):
-        """Pattern'e uyan tum anahtarlari siler(invalidation icin gerekli)"""
+        """
+        Pattern'e uyan tum anahtarlari siler (bakim/temizlik icin).
+
+        KEYS yerine SCAN kullanir ki Redis'i bloklamasin. Normal yazma
+        akisinda kullanilmaz; invalidation versiyon sayaci ile yapilir.
+        """
         if not self.redis:
             return
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                await self.redis.delete(*keys)
-                logger.debug(f"Deleted{len(keys)} keys with pattern: {pattern}")
+            deleted = 0
+            batch: list[str] = []
+            async for key in self.redis.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= 1000:
+                    deleted += await self.redis.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.redis.unlink(*batch)
+            logger.debug(f"Deleted {deleted} keys with pattern: {pattern}")
         except Exception as e:
             logger.error(f"Redis DELETE PATTERN error for {pattern}:{e}")
 
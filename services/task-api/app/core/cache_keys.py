@@ -1,48 +1,121 @@
 """
 Cache key'lerini olusturmak icin yardimci fonksiyonlar.
 
+Invalidation stratejisi (versiyonlu namespace):
+    Her kullanicinin Redis'te bir versiyon sayaci vardir
+    ("tasks:user:{user_id}:version"). Liste ve detay key'leri bu versiyonu
+    icerir. Kullanici bir task yazdiginda sayac tek bir INCR ile artirilir;
+    eski versiyondaki key'lere artik hic erisilmez ve TTL ile kendiliginden silinir.
+    Boylece KEYS/SCAN ile tum keyspace'i taramaya gerek kalmaz.
 """
 
+def get_task_user_version_key(user_id: int) -> str:
+    """
+    Kullanicinin cache versiyon sayacinin key'ini olusturur.
+    Format: tasks:user:{user_id}:version
+    Ornek: get_task_user_version_key(1)
+    ->"tasks:user:1:version"
+    """
+    return f"tasks:user:{user_id}:version"
+
 def get_task_list_cache_key(
         user_id : int,
         status : str | None = None,
         priority : str | None = None,
         search : str | None = None,
-        page : int = 1
+        page : int = 1,
+        version : int = 0,
+        with_total : bool = True
 ) -> str:
     """
     Docstring for get_task_list_cache_key
     Task listesi cache key'i olusturur
-    Format: task:user {user_id};list{status}{priority}{search}{page}
-    Ornek: get_task_list_cache_key(1,"pending","high",None,1)
-    ->"tasks:user:1:list:pending:high::1"
+    Format: tasks:user:{user_id}:v{version}:list:{status}:{priority}:{search}:{page}
+    Toplam istenmediyse (with_total=False) sonuna ":nt" eklenir.
+    Ornek: get_task_list_cache_key(1,"pending","high",None,1,version=3)
+    ->"tasks:user:1:v3:list:pending:high::1"
     """
     # None degerlerini all yapalim ki key de bosluk olmasin
     status_str = status or "all"
     priority_str = priority or "all"
     search_str = search or ""
     
-    return f"tasks:user:{user_id}:list:{status_str}:{priority_str}:{search_str}:{page}"
+    key = (
+        f"tasks:user:{user_id}:v{version}:list:"
+        f"{status_str}:{priority_str}:{search_str}:{page}"
+    )
+    return key if with_total else f"{key}:nt"
 
-def get_task_detail_cache_key(user_id: int,task_id: int) -> str:
+def get_task_cursor_cache_key(
+        user_id: int,
+        status: str | None = None,
+        priority: str | None = None,
+        search: str | None = None,
+        cursor: str | None = None,
+        page_size: int = 10,
+        version: int = 0,
+        with_total: bool = True
+) -> str:
+    """
+    Cursor (keyset) sayfalamali task listesi cache key'i olusturur.
+    Format: tasks:user:{user_id}:v{version}:cursor:
+            {status}:{priority}:{search}:{page_size}:{cursor}
+    Toplam istenmediyse (with_total=False) sonuna ":nt" eklenir.
+    Ornek: get_task_cursor_cache_key(1, None, None, None, None, 20, version=3)
+    ->"tasks:user:1:v3:cursor:all:all::20:start"
+    """
+    status_str = status or "all"
+    priority_str = priority or "all"
+    search_str = search or ""
+    cursor_str = cursor or "start"
+
+    key = (
+        f"tasks:user:{user_id}:v{version}:cursor:{status_str}:{priority_str}:"
+        f"{search_str}:{page_size}:{cursor_str}"
+    )
+    return key if with_total else f"{key}:nt"
+
+def get_task_detail_cache_key(user_id: int,task_id: int, version: int = 0) -> str:
     """
     Docstring for get_task_detail_cache_key
     
     Task detay cache key'i olusturur.
-    Format: task:user:{user_id}:detail:{task_id}
+    Format: tasks:user:{user_id}:v{version}:detail:{task_id}
     ornek:
-    get_task_detail_cache_key(1, 5)
-    ->"tasks:user:1:detail:5"
+    get_task_detail_cache_key(1, 5, version=3)
+    ->"tasks:user:1:v3:detail:5"
     
     """
-    return f"tasks:user:{user_id}:detail:{task_id}"
+    return f"tasks:user:{user_id}:v{version}:detail:{task_id}"
 
 def get_task_user_pattern(user_id: int)-> str:
     """
-    Belirli bir kullanicinin tum task cache'lerini silmek icin pattern.
+    Belirli bir kullanicinin tum task cache'lerini bulmak icin pattern.
     Format: tasks:user:{user_id}:*
+    Not: Normal invalidation icin kullanilmaz (bkz. get_task_user_version_key),
+    sadece bakim/temizlik islemleri icindir.
     Kullanim:
-        await cache_delete_pattern(get_task_user_pattern(1))
+        await redis_cache.delete_pattern(get_task_user_pattern(1))
         ->user:1'in tum cache'leri silinir.'
     """
-    return f"tasks:user:{user_id}:*"
\ No newline at end of file
+    return f"tasks:user:{user_id}:*"
+
+
+def get_user_principal_cache_key(user_id: int) -> str:
+    """
+    Kimligi dogrulanmis kullanici (get_current_user) cache key'i.
+    Format: users:{user_id}:principal
+    Ornek: get_user_principal_cache_key(1)
+    ->"users:1:principal"
+    """
+    return f"users:{user_id}:principal"
+
+
+def get_user_write_marker_key(user_id: int) -> str:
+    """
+    Kullanicinin yakin zamanda yazdigini gosteren key (read-your-writes).
+    Format: db:recent_write:user:{user_id}
+    Ornek: get_user_write_marker_key(1)
+    ->"db:recent_write:user:1"
+    """
+    return f"db:recent_write:user:{user_id}"
@@ -11,9 +11,8 @@ tum log'larda ve response header'larda tasir.
 import uuid
 from contextvars import ContextVar
 from typing import Optional
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
 
 logger = logging.getLogger(__name__)
@@ -53,57 +52,69 @@ def generate_correlation_id() -> str:
     """
     return str(uuid.uuid4())
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+class CorrelationIdMiddleware:
     """
-    Her HTTP istegine correlation ID atar.
+    Her HTTP istegine correlation ID atar (saf ASGI middleware).
 
     - Gelen istekte X-Correlation-ID header'i varsa onu kullanir.
     - Yoksa yeni bir ID uretir.
     - Response header'ina ID'yi ekler.
     - Context variable'a ID'yi kaydeder.(log'lar icin)
+
+    Endpoint ayni task/context icinde calistigi icin context variable
+    asagidaki tum katmanlarda gorunur.
     """
-    async def dispatch(
-        self,
-        request:Request,
-        call_next: RequestResponseEndpoint
-    ) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Request'i isler ve correlation ID yonetimini yapar.
 
         Args:
-            request: Gelen HTTP istegi
-            call_next: Sonraki middleware/endpoint
-
-        Returns:
-            Response: HTTP yaniti (correlation ID header'i ile gonderir.)
+            scope: ASGI scope
+            receive: ASGI receive kanali
+            send: ASGI send kanali (response header'i burada eklenir)
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Gelen header'dan ID al veya yeni uret
-        correlation_id = request.headers.get(
+        request_headers = Headers(scope=scope)
+        correlation_id = request_headers.get(
             CORRELATION_ID_HEADER
-        ) or request.headers.get(
+        ) or request_headers.get(
             REQUEST_ID_HEADER
         ) or generate_correlation_id()
     
         # Context'e kaydet (loglar bu degeri kullanabilsin diye)
         set_correlation_id(correlation_id)
 
+        method, path = scope["method"], scope["path"]
+
         # Debug log
         logger.debug(
-            f"Request started: {request.method} {request.url.path}",
+            f"Request started: {method} {path}",
             extra = {"correlation_id": correlation_id}
         )
 
-        # Request'e isle
-        response = await call_next(request)
+        status_code = 500
 
-        # Response header'a ekle
-        response.headers[CORRELATION_ID_HEADER] = correlation_id
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Response header'a ekle
+                MutableHeaders(scope=message)[CORRELATION_ID_HEADER] = correlation_id
+            await send(message)
+
+        # Request'e isle
+        await self.app(scope, receive, send_with_correlation_id)
 
         # Debug log
         logger.debug(
-            f"Request Completed: {request.method} {request.url.path} "
-            f"- Status: {response.status_code}",
+            f"Request Completed: {method} {path} "
+            f"- Status: {status_code}",
             extra={"correlation_id": correlation_id}
         )
-        
-        return response
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Keyset (cursor) sayfalama icin opak cursor yardimcilari.
+
+Cursor, bir sayfanin son satirinin (created_at, id) degerini tasir ve
+istemciye opak bir string olarak verilir (URL-safe base64 JSON).
+Istemci bir sonraki sayfayi bu cursor'i geri gondererek ister.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from app.core.exceptions import TaskBadRequestException
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """
+    (created_at, id) ciftini opak cursor'a cevirir.
+
+    Ornek: encode_cursor(datetime(2026, 1, 1), 5) -> "eyJrIjogIjIwMjYt..."
+    """
+    raw = json.dumps({"k": created_at.isoformat(), "id": task_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Cursor'i (created_at, id) ciftine geri cevirir.
+
+    Raises:
+        TaskBadRequestException: Cursor bozuk veya gecersizse (400).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["k"]), int(data["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise TaskBadRequestException("Invalid pagination cursor") from e
@@ -1,9 +1,14 @@
 """
 Dapr Pub/Sub client.
 Event'leri Dapr uzerinden publish etmek icin kullanilir.
+
+Tek tek publish() her event icin bir HTTP istegi atar. Cok sayida event
+icin publish_bulk(), Dapr'in bulk publish endpoint'i ile hepsini tek
+istekte gonderir ve entry bazinda hatalari doner (bkz. app.core.outbox).
 """
 
 import httpx
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from typing import Any
 from app.core.logging import get_logger
@@ -21,6 +26,24 @@ DAPR_BASE_URL = f"http://localhost:{DAPR_HTTP_PORT}"
 PUBSUB_NAME = "taskpubsub"
 TOPIC_NAME = "task-events"
 
+
+@dataclass
+class BulkPublishResult:
+    """
+    publish_bulk sonucu.
+
+    Attributes:
+        total: Gonderilen event sayisi
+        failed: {event'in listedeki index'i: hata mesaji}
+    """
+    total: int
+    failed: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
 class DaprPubSubClient:
     """
     Dapr Pub/Sub client.
@@ -28,16 +51,23 @@ class DaprPubSubClient:
     Event'leri dapr sidecar uzerinden publish eder.
     Dapr, event'i RabbitMQ'ya (veya baska broker'a) iletir.    
     """
-    def __init__(self,pubsub_name: str = PUBSUB_NAME, timeout: float = 10.0):
+    def __init__(
+        self,
+        pubsub_name: str = PUBSUB_NAME,
+        timeout: float = 10.0,
+        base_url: str = DAPR_BASE_URL
+    ):
         """
         DaprPubSubClient instance'i olusturur.
 
         Args:
             pubsub_name: Dapr pubsub component ado
             timeout: HTTP timeout (saniye)        
+            base_url: Dapr sidecar adresi
         """
         self._pubsub_name = pubsub_name
         self._timeout = timeout
+        self._base_url = base_url
         self._client: httpx.AsyncClient | None = None
     
     async def _get_client(self) -> httpx.AsyncClient:
@@ -46,7 +76,7 @@ class DaprPubSubClient:
         """
         if self._client is None:
             self._client = httpx.AsyncClient(
-                base_url=DAPR_BASE_URL,
+                base_url=self._base_url,
                 timeout = self._timeout
             )
         return self._client
@@ -80,14 +110,8 @@ class DaprPubSubClient:
 
         url = f"/v1.0/publish/{self._pubsub_name}/{topic}"
 
-        # Correlation ID ekledigimiz kisim
-        correlation_id = get_correlation_id()
-        if correlation_id:
-            data["correlation_id"] = correlation_id
-        
-        if "timestamp" not in data:
-            data["timestamp"] = datetime.now(UTC).isoformat()
-        
+        correlation_id = self._prepare(data)
+
         headers = {}
         if metadata:
             # Dapr metadata header'lari
@@ -114,5 +138,91 @@ class DaprPubSubClient:
             )
             return False
         
+    async def publish_bulk(
+        self,
+        topic: str,
+        events: list[dict[str, Any]],
+        metadata: dict[str, str] | None = None
+    ) -> BulkPublishResult:
+        """
+        Event'leri Dapr bulk publish API'si ile tek istekte publish eder.
+
+        Dapr basarisiz entry'leri failedEntries ile doner; sadece onlar
+        basarisiz sayilir. Istegin kendisi basarisizsa (baglanti hatasi,
+        failedEntries'siz hata cevabi) tum event'ler basarisiz doner.
+
+        Args:
+            topic: Topic adi (orn: "task-events")
+            events: Event verileri (sirasi korunur)
+            metadata: Opsiyonel metadata (tum istege uygulanir)
+
+        Returns:
+            BulkPublishResult: Basarisiz event'lerin index'leri ve hatalari
+        """
+        if not events:
+            return BulkPublishResult(total=0)
+
+        client = await self._get_client()
+        url = f"/v1.0-alpha1/publish/bulk/{self._pubsub_name}/{topic}"
+
+        entries = []
+        for index, data in enumerate(events):
+            self._prepare(data)
+            entries.append({
+                "entryId": str(index),
+                "event": data,
+                "contentType": "application/json",
+            })
+        params = {f"metadata.{key}": value for key, value in (metadata or {}).items()}
+
+        logger.info(f"Dapr bulk publish: {topic} -> {len(entries)} events")
+        try:
+            response = await client.post(url, json=entries, params=params)
+        except httpx.HTTPError as e:
+            logger.error(f"Dapr bulk publish error: {topic} -> {e}")
+            return self._all_failed(len(events), str(e) or type(e).__name__)
+
+        if response.is_success:
+            return BulkPublishResult(total=len(events))
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        failed_entries = body.get("failedEntries") if isinstance(body, dict) else None
+        if not failed_entries:
+            error = body.get("message") if isinstance(body, dict) else None
+            status = f"HTTP {response.status_code}"
+            logger.error(f"Dapr bulk publish error: {topic} -> {status}")
+            return self._all_failed(len(events), error or status)
+
+        result = BulkPublishResult(total=len(events))
+        for entry in failed_entries:
+            error = entry.get("error") or "publish failed"
+            result.failed[int(entry["entryId"])] = error
+        logger.warning(
+            f"Dapr bulk publish: {topic} -> {len(result.failed)}/{len(events)} failed"
+        )
+        return result
+
+    @staticmethod
+    def _all_failed(total: int, error: str) -> BulkPublishResult:
+        return BulkPublishResult(
+            total=total, failed={index: error for index in range(total)}
+        )
+
+    @staticmethod
+    def _prepare(data: dict[str, Any]) -> str | None:
+        """Event'e correlation_id ve timestamp ekler; correlation_id'yi doner."""
+        # Correlation ID ekledigimiz kisim
+        correlation_id = get_correlation_id()
+        if correlation_id:
+            data["correlation_id"] = correlation_id
+
+        if "timestamp" not in data:
+            data["timestamp"] = datetime.now(UTC).isoformat()
+        return correlation_id
+
+
 # Global Instance
 dapr_pubsub = DaprPubSubClient()
\ No newline at end of file
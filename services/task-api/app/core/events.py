@@ -1,6 +1,11 @@
 """
 Task event publisher
 Event'leri RabbitMQ'ya publish eden is mantigi.
+
+Event'ler dogrudan Dapr'a gonderilmez; task degisikligiyle ayni
+transaction'da outbox tablosuna yazilir (transactional outbox).
+Commit sonrasi OutboxRelay (app.core.outbox) bunlari Dapr'a publish eder.
+Boylece yazma istekleri sidecar'i beklemez ve publish hatasinda event kaybolmaz.
 """
 from datetime import datetime, UTC
 from statistics import correlation
@@ -8,14 +13,15 @@ from app.core.correlation import get_correlation_id
 from app.core.logging import get_logger
 from app.core.messaging import RabbitMQClient,rabbitmq_client
 from app.models.events import TaskEventType,TaskEvent
-from app.core.dapr_pubsub import dapr_pubsub, TOPIC_NAME
+from app.core.dapr_pubsub import TOPIC_NAME
+from app.db.repositories.outbox import OutboxRepository
 logger = get_logger(__name__)
 
 class TaskEventPublisher:
     """
     Task event'lerini Dapr Pub/Sub uzerinden publish eden class.
     Artik rabbiMQ'ya baglamiyoruz.
-    Dapr sidecar'a HTTP ile event gonderiyoruz.
+    Event'ler outbox'a yazilir, OutboxRelay Dapr sidecar'a HTTP ile gonderir.
     Dapr, event'i RabbitMQ'ya (veya baska broker'a) iletiyor.
     
     1. Encapsulation: Event olusturma ve publish mantigi tek yerde
@@ -37,6 +43,7 @@ class TaskEventPublisher:
 
     async def publish_task_created(
         self,
+        outbox: OutboxRepository,
         task_id: int,
         user_id: int,
         task_data: dict
@@ -48,6 +55,7 @@ class TaskEventPublisher:
         - TaskService.create() basariyla tamamlandiginda
 
         Args:
+            outbox: Event'in yazilacagi outbox (cagiranin transaction'i)
             task_id:olusturulan task'in ID'si
             user_id: Task'i olusturan kullanici ID'si
             task_data: Task'in JSON-serializable verisi
@@ -60,14 +68,15 @@ class TaskEventPublisher:
             correlation_id=get_correlation_id(),
             data=task_data
         )
-        await self._publish(event)
+        await self.enqueue(outbox, [event])
         logger.info(
-            f"Published TaskCreated event for tas {task_id}",
+            f"Queued TaskCreated event for tas {task_id}",
             extra={"correlation_id": event.correlation_id}
         )
     
     async def publish_task_updated(
         self,
+        outbox: OutboxRepository,
         task_id: int,
         user_id: int,
         task_data: dict
@@ -76,6 +85,7 @@ class TaskEventPublisher:
         TaskUpdated event'i publish eder.
         
         Args:
+            outbox: Event'in yazilacagi outbox (cagiranin transaction'i)
             task_id: Silinen task'in ID'si
             user_id: Task'i silen kullanici
             task_data: Task'in guncel verisi
@@ -88,13 +98,14 @@ class TaskEventPublisher:
             correlation_id=get_correlation_id(),
             data=task_data
         )
-        await self._publish(event)
+        await self.enqueue(outbox, [event])
         logger.info(
-            f"Published TaskUpdated event for task {task_id}",
+            f"Queued TaskUpdated event for task {task_id}",
             extra={"correlation_id":event.correlation_id}
         )
     async def publish_task_deleted(
         self,
+        outbox: OutboxRepository,
         task_id: int,
         user_id: int,
     ) -> None:
@@ -102,6 +113,7 @@ class TaskEventPublisher:
         TaskDeleted event'i publish eder.
         
         Args:
+            outbox: Event'in yazilacagi outbox (cagiranin transaction'i)
             task_id: Silinen task'in ID'si
             user_id: Task'i silen kullanici ID'si 
         """
@@ -113,14 +125,15 @@ class TaskEventPublisher:
             correlation_id=get_correlation_id(),
             data=None
         )
-        await self._publish(event)
+        await self.enqueue(outbox, [event])
         logger.info(
-            f"Published TaskDeleted event for task {task_id}",
+            f"Queued TaskDeleted event for task {task_id}",
             extra={"correlation_id":event.correlation_id}
         )
     
     async def publish_task_completed(
         self,
+        outbox: OutboxRepository,
         task_id: int,
         user_id: int,
         task_data: dict
@@ -129,6 +142,7 @@ class TaskEventPublisher:
         TaskCompleted event'i publish eder.
 
         Args:
+            outbox: Event'in yazilacagi outbox (cagiranin transaction'i)
             task_id:tamamlanan task'in ID'si
             user_id: Task'i tamamlayan kullanicinin ID'si
             task_data: Task'in son hali
@@ -142,35 +156,67 @@ class TaskEventPublisher:
             correlation_id=get_correlation_id(),
             data=task_data
         )
-        await self._publish(event)
+        await self.enqueue(outbox, [event])
         logger.info(
-            f"Published TaskCompleted event for tas {task_id}",
+            f"Queued TaskCompleted event for tas {task_id}",
             extra= {"correlation_id":event.correlation_id }
         )
-    async def _publish(self, event: TaskEvent) -> None:
+    def build_event(
+        self,
+        event_type: TaskEventType,
+        task_id: int,
+        user_id: int,
+        task_data: dict | None = None
+    ) -> TaskEvent:
         """
-        Event'i Dapr Pub/Sub'a gonderir.
+        Publish edilmeden once event olusturur (publish_many icin).
 
         Args:
-            event: Gonderilecek event
-        
+            event_type: Event tipi
+            task_id: Etkilenen task'in ID'si
+            user_id: Islemi yapan kullanici ID'si
+            task_data: Task'in JSON-serializable verisi
+        """
+        return TaskEvent(
+            event_type=event_type,
+            task_id=task_id,
+            user_id=user_id,
+            timestamp=datetime.now(UTC),
+            correlation_id=get_correlation_id(),
+            data=task_data
+        )
+
+    async def publish_many(
+            self, outbox: OutboxRepository, events: list[TaskEvent]
+    ) -> None:
+        """
+        Birden fazla event'i tek seferde outbox'a yazar.
+
+        Ne zaman kullanilir?
+        - TaskService.bulk_* islemlerinde (tek INSERT)
+
+        Args:
+            outbox: Event'lerin yazilacagi outbox (cagiranin transaction'i)
+            events: build_event ile olusturulan event'ler
+        """
+        if not events:
+            return
+        await self.enqueue(outbox, events)
+        logger.info(
+            f"Queued {len(events)} task events",
+            extra={"correlation_id": events[0].correlation_id}
+        )
+
+    async def enqueue(self, outbox: OutboxRepository, events: list[TaskEvent]) -> None:
+        """
+        Event'leri outbox'a yazar. Commit edilmez; task degisikligiyle
+        birlikte commit edilir, publish'i OutboxRelay yapar.
+
+        Args:
+            outbox: Event'lerin yazilacagi outbox
+            events: Yazilacak event'ler
         """
-        try:
-            success= await dapr_pubsub.publish(
-                topic=self._topic,
-                data= event.to_dict()
-            )
-            if not success:
-                logger.warning(
-                    f"Event publish returned False: {event.event_type.value}",
-                    extra={"correlation_id":event.correlation_id}
-                )
-        except Exception as e:
-            #Event publish hatasi ana islemi etkilememeli
-            logger.error(
-                f"Failed to publish event {event.event_type.value}: {e}",
-                extra={"correlation_id":event.correlation_id}
-            )
+        await outbox.add_events(self._topic, events)
 
 # Global Instance
-task_event_publisher = TaskEventPublisher()
\ No newline at end of file
+task_event_publisher = TaskEventPublisher()
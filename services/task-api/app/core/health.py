@@ -12,8 +12,16 @@ from typing import Any
 from sqlalchemy import text
 from app.config import settings
 from app.core.logging import get_logger
-from app.db.database import async_session_maker
+from app.db.database import async_session_maker, engine, replica_engine
+from app.db.pool import get_pool_stats
+from app.db.routing import read_router
 from app.core.cache import redis_cache
+from app.core.tiered_cache import tiered_cache
+from app.core.user_cache import user_cache
+from app.core.security import verified_token_cache
+from app.core.query_counter import query_stats
+from app.core.outbox import outbox_relay
+from app.db.repositories.outbox import OutboxRepository
 from app.models.health import HealthStatus, HealthCheckResult
 logger = get_logger(__name__)
 
@@ -120,7 +128,7 @@ class DatabaseHealthCheck(BaseHealthCheck):
                 name=self.name,
                 status=HealthStatus.HEALTHY,
                 message="Database connection OK",
-                details={"type":"postgresql"}
+                details={"type":"postgresql", "queries": query_stats.stats()}
             )
         except Exception as e:
             return HealthCheckResult(
@@ -128,6 +136,113 @@ class DatabaseHealthCheck(BaseHealthCheck):
                 status=HealthStatus.UNHEALTHY,
                 message=str(e)
             )
+class DatabasePoolHealthCheck(BaseHealthCheck):
+    """
+    Database connection pool istatistiklerini raporlar (pool boyutlandirmasi icin).
+
+    Pool kapasitesi (size + max_overflow) db_bulkhead'in eszamanli islem
+    sinirindan kucukse veya pool tamamen doluysa DEGRADED doner.
+
+    Args:
+        name: Check adi
+        timeout: Maksimum kontrol suresi
+        critical: Kritik mi (sadece bilgi amacli, False)
+    """
+    def __init__(
+        self,
+        name: str = "database_pool",
+        timeout: float = 1.0,
+        critical: bool = False
+    ):
+        super().__init__(name, timeout, critical)
+
+    async def check(self) -> HealthCheckResult:
+        """
+        Pool durumunu doner.
+        Returns:
+            HealthCheckResult: Pool istatistikleri
+        """
+        stats = get_pool_stats(engine)
+        capacity = stats.get("capacity")
+        if replica_engine is not None:
+            stats["replica"] = get_pool_stats(replica_engine)
+            stats["read_routing"] = read_router.stats()
+
+        if capacity is not None and capacity < stats["bulkhead_max_concurrent"]:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.DEGRADED,
+                message=(
+                    f"Pool capacity {capacity} is below db_bulkhead limit "
+                    f"{stats['bulkhead_max_concurrent']}"
+                ),
+                details=stats
+            )
+        if capacity is not None and stats["checked_out"] >= capacity:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.DEGRADED,
+                message="Connection pool exhausted",
+                details=stats
+            )
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.HEALTHY,
+            message="Connection pool OK",
+            details=stats
+        )
+
+class OutboxHealthCheck(BaseHealthCheck):
+    """
+    Outbox backlog'unu ve relay istatistiklerini raporlar.
+
+    Park edilmis (max_attempts'a ulasmis) event varsa veya relay
+    etkin olup calismiyorsa DEGRADED doner.
+
+    Args:
+        name: Check adi
+        timeout: Maksimum kontrol suresi
+        critical: Kritik mi (False = event'ler outbox'ta bekler, kaybolmaz)
+    """
+    def __init__(
+        self,
+        name: str = "outbox",
+        timeout: float = 1.0,
+        critical: bool = False
+    ):
+        super().__init__(name, timeout, critical)
+
+    async def check(self) -> HealthCheckResult:
+        """
+        Outbox durumunu doner.
+        Returns:
+            HealthCheckResult: Bekleyen/park edilen event sayilari, relay istatistikleri
+        """
+        async with async_session_maker() as session:
+            details = await OutboxRepository(session).backlog(outbox_relay.max_attempts)
+        details["relay"] = outbox_relay.stats()
+
+        if details["parked"]:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.DEGRADED,
+                message=f"{details['parked']} outbox events parked after max attempts",
+                details=details
+            )
+        if settings.outbox_relay_enabled and not details["relay"]["running"]:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.DEGRADED,
+                message="Outbox relay is not running",
+                details=details
+            )
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.HEALTHY,
+            message="Outbox OK",
+            details=details
+        )
+
 class RedisHealthCheck(BaseHealthCheck):
     """
     Redis baglanti kontrolu.
@@ -174,6 +289,40 @@ class RedisHealthCheck(BaseHealthCheck):
                 message=str(e)
             )
 
+class CacheStatsHealthCheck(BaseHealthCheck):
+    """
+    L1/L2 cache istatistiklerini raporlar (L1 boyutlandirmasi icin).
+
+    Args:
+        name: Check adi
+        timeout: Maksimum kontrol suresi
+        critical: Kritik mi (sadece bilgi amacli, False)
+    """
+    def __init__(
+        self,
+        name: str = "cache",
+        timeout: float = 1.0,
+        critical: bool = False
+    ):
+        super().__init__(name, timeout, critical)
+
+    async def check(self) -> HealthCheckResult:
+        """
+        Cache hit oranlarini doner.
+        Returns:
+            HealthCheckResult: Her zaman HEALTHY, detaylarda istatistikler
+        """
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.HEALTHY,
+            message="Cache stats",
+            details={
+                "tasks": tiered_cache.stats(),
+                "users": user_cache.stats(),
+                "jwt": verified_token_cache.stats(),
+            }
+        )
+
 class DiskHealthCheck(BaseHealthCheck):
     """
     Disk Alani kontrolu.
@@ -316,5 +465,8 @@ class HealthChecker:
 # ----- GLOBAL HEALTH CHECKER -----
 health_checker = HealthChecker()
 health_checker.add_check(DatabaseHealthCheck())
+health_checker.add_check(DatabasePoolHealthCheck())
+health_checker.add_check(OutboxHealthCheck())
 health_checker.add_check(RedisHealthCheck())
+health_checker.add_check(CacheStatsHealthCheck())
 health_checker.add_check(DiskHealthCheck())
\ No newline at end of file
@@ -2,19 +2,43 @@
 RabbitMQ messaging client.
 Asenkron mesajlasma islemleri icin kullanilir.
 Event publishing ve consuming islemlerini yonetir.
+
+Publish'ler publisher confirms acik bir channel pool'u uzerinden yapilir:
+    - Her publish broker'in ack'ini bekler (nack/timeout hata firlatir).
+    - Channel'lar round-robin kullanilir; ayni channel'da birden fazla
+      publish ayni anda confirm bekleyebilir (pipelining), yani
+      confirm beklemek publish'leri siralamaz.
+    - Confirm bekleyen (in-flight) mesaj sayisi
+      settings.rabbitmq_publish_buffer_size ile sinirlidir. Broker
+      yavaslayip buffer dolunca publish() yer acilana kadar bekler
+      (backpressure); bellekte sinirsiz mesaj birikmez.
 """
 
+import asyncio
 import json
-import logging
-from types import coroutine
-from typing import Any, Awaitable, Optional
-from aio_pika import connect_robust, Message, ExchangeType
-from aio_pika.abc import AbstractRobustConnection, AbstractRobustChannel, AbstractRobustExchange
+from itertools import count
+from typing import Any
+
+from aio_pika import ExchangeType, Message, connect_robust
+from aio_pika.abc import (
+    AbstractExchange,
+    AbstractRobustChannel,
+    AbstractRobustConnection,
+)
+from pamqp.commands import Basic
+
 from app.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+EXCHANGE_NAME = "task_events"
+
+
+class MessagePublishError(Exception):
+    """Mesaj broker tarafindan onaylanmadi (nack, return veya timeout)."""
+
+
 class RabbitMQClient:
     """
     RabbitMQ baglanti ve mesajlasma islemlerini yoneten client.
@@ -23,19 +47,48 @@ class RabbitMQClient:
         - Otomatik reconnect (robus connection)
         - Exchange ve queue yonetimi
         - JSON mesaj serialization
+        - Publisher confirms + channel pool + backpressure
+
+    Args:
+        pool_size: Publish icin acilan channel sayisi
+        buffer_size: Ayni anda confirm bekleyebilecek en fazla mesaj
+        publish_timeout: Bir mesajin confirm'i icin en fazla bekleme (saniye)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        buffer_size: int | None = None,
+        publish_timeout: float | None = None
+    ):
         """RabbitMQClient instance' i olusturur."""
-        self.connection:AbstractRobusConnection | None = None
-        self.channel: Optional[AbstractRobusChannel] = None
-        self.exchange: Optional[AbstractRobusExchange] = None
-    
+        self.pool_size = pool_size or settings.rabbitmq_channel_pool_size
+        self.buffer_size = buffer_size or settings.rabbitmq_publish_buffer_size
+        self.publish_timeout = (
+            publish_timeout or settings.rabbitmq_publish_timeout_seconds
+        )
+        self.connection: AbstractRobustConnection | None = None
+        self.channels: list[AbstractRobustChannel] = []
+        self.exchanges: list[AbstractExchange] = []
+        self._next_channel = count()
+        self._buffer = asyncio.Semaphore(self.buffer_size)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.confirmed = 0
+        self.failed = 0
+        self.backpressure_waits = 0
+
+    @property
+    def exchange(self) -> AbstractExchange | None:
+        """Ilk channel'in exchange'i (geriye uyumluluk icin)."""
+        return self.exchanges[0] if self.exchanges else None
+
     async def connect(self) -> None:
         """
         RabbitMQ'ya baglanti kurar.
 
         Robus connection kullanir - baglanti koparsa otomatik yeniden baglanir.
+        pool_size kadar publisher confirms acik channel acar.
 
         Raises:
             Exception: Baglanti kurulamazsa 
@@ -44,30 +97,47 @@ class RabbitMQClient:
             # Robus connection kismi - otomatik reconnect
             self.connection = await connect_robust(settings.rabbitmq_url)
 
-            # Channel olusturma kismi
-            self.channel = await self.connection.channel()
-
-            # Default exchange olusturma kismi (topic type - esnek routing)
-            self.exchange = await self.channel.declare_exchange(
-                "task_events",
-                ExchangeType.TOPIC,
-                durable=True # Broker restart'ta exchange kaybolmasin diye
-            )
+            # Channel pool'u olusturma kismi
+            # (robust channel'lar reconnect'te yeniden acilir)
+            for _ in range(self.pool_size):
+                channel = await self.connection.channel(publisher_confirms=True)
+                # Default exchange olusturma kismi (topic type - esnek routing)
+                exchange = await channel.declare_exchange(
+                    EXCHANGE_NAME,
+                    ExchangeType.TOPIC,
+                    durable=True # Broker restart'ta exchange kaybolmasin diye
+                )
+                self.channels.append(channel)
+                self.exchanges.append(exchange)
 
-            logging.info(
-                f"Connected to RabbitMQ at {settings.rabbitmq_host}:{settings.rabbitmq_port}"
+            logger.info(
+                f"Connected to RabbitMQ at "
+                f"{settings.rabbitmq_host}:{settings.rabbitmq_port} "
+                f"({self.pool_size} channels)"
             )
         except Exception as e:
             logger.error(f"RabbitMQ connection error: {e}")
             raise
+
     async def disconnect(self) -> None:
         """
         RabbitMQ baglantisini koparir.
         """
         if self.connection:
             await self.connection.close()
-            logger.info(f"Disconnected from RabbitMQ")
-    
+            self.connection = None
+            self.channels.clear()
+            self.exchanges.clear()
+            logger.info("Disconnected from RabbitMQ")
+
+    def _pick_exchange(self) -> AbstractExchange:
+        """Acik channel'lardan siradakinin exchange'ini secer (round-robin)."""
+        for _ in range(len(self.exchanges)):
+            index = next(self._next_channel) % len(self.exchanges)
+            if not self.channels[index].is_closed:
+                return self.exchanges[index]
+        raise MessagePublishError("No open RabbitMQ channel")
+
     async def publish(
         self,
         routing_key: str,
@@ -75,7 +145,10 @@ class RabbitMQClient:
         correlation_id: str | None = None
     ) -> None:
         """
-        Exchange'e mesaj publish eder.
+        Exchange'e mesaj publish eder ve broker onayini (ack) bekler.
+
+        Buffer doluysa (confirm bekleyen mesaj sayisi buffer_size'a ulastiysa)
+        yer acilana kadar bekler.
 
         Args:
             routing_key: Mesajin routing key'idir.(ornek:"task.created","task.updated")
@@ -84,9 +157,12 @@ class RabbitMQClient:
 
         Raises:
             RuntimeError: Baglanti kurulmamissa
+            MessagePublishError: Broker mesaji onaylamazsa
         """
-        if not self.exchange:
-            raise RuntimeError("RabbitMQ connection not established. Call connect() first.")
+        if not self.exchanges:
+            raise RuntimeError(
+                "RabbitMQ connection not established. Call connect() first."
+            )
         
         # Correlation ID ekleme kismi
         if correlation_id:
@@ -100,19 +176,74 @@ class RabbitMQClient:
         amqp_message = Message(
             body= body,
             content_type="application/json",
-            correlation_id=correlation_id
+            correlation_id=correlation_id,
+            message_id=message.get("event_id")
         )
 
-        # Publish kismi
+        # Backpressure: buffer doluysa bekle
+        if self._buffer.locked():
+            self.backpressure_waits += 1
+        async with self._buffer:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                # Publish kismi (confirm gelene kadar bekler)
+                confirmation = await self._pick_exchange().publish(
+                    amqp_message, routing_key=routing_key, timeout=self.publish_timeout
+                )
+            except MessagePublishError:
+                self.failed += 1
+                raise
+            except Exception as e:
+                self.failed += 1
+                raise MessagePublishError(
+                    f"Publish to '{routing_key}' failed: {e!r}"
+                ) from e
+            finally:
+                self.in_flight -= 1
 
-        await self.exchange.publish(amqp_message, routing_key=routing_key)
+        if not isinstance(confirmation, Basic.Ack):
+            self.failed += 1
+            raise MessagePublishError(
+                f"Broker did not confirm message to '{routing_key}': {confirmation!r}"
+            )
+        self.confirmed += 1
 
         logger.debug(
             f"Published message to '{routing_key}'",
             extra={"correlation_id":correlation_id}
         )
-    
-    async def health_check() -> bool:
+
+    async def publish_many(
+        self,
+        messages: list[tuple[str, dict[str, Any]]],
+        correlation_id: str | None = None
+    ) -> list[MessagePublishError | None]:
+        """
+        Mesajlari ayni anda publish eder; confirm'ler paralel beklenir.
+
+        Args:
+            messages: (routing_key, mesaj) listesi
+            correlation_id: Request tracing icin correlation ID
+
+        Returns:
+            list: Her mesaj icin None (onaylandi) veya hata, ayni sirayla
+        """
+        results = await asyncio.gather(
+            *(
+                self.publish(routing_key, message, correlation_id)
+                for routing_key, message in messages
+            ),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, MessagePublishError
+            ):
+                raise result
+        return list(results)
+
+    async def health_check(self) -> bool:
         """
         RabbitMQ baglanti durumunu kontrol eder.
 
@@ -120,10 +251,24 @@ class RabbitMQClient:
             bool: baglanti saglikli ise True
         """
         try:
-            if self.connection and not self.connection.is_closed:
-                return True
+            return bool(self.connection and not self.connection.is_closed)
         except Exception:
             return False
 
+    def stats(self) -> dict[str, Any]:
+        """Publish istatistikleri (confirm, backpressure, in-flight)."""
+        return {
+            "channels": len(self.channels),
+            "open_channels": sum(
+                1 for channel in self.channels if not channel.is_closed
+            ),
+            "buffer_size": self.buffer_size,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "confirmed": self.confirmed,
+            "failed": self.failed,
+            "backpressure_waits": self.backpressure_waits,
+        }
+
 #Global Instance
-rabbitmq_client = RabbitMQClient()
\ No newline at end of file
+rabbitmq_client = RabbitMQClient()
@@ -6,19 +6,23 @@ FastAPI middleware'lerini barindirir.(amaci kullaniciyi etiketlemektir.)
 Calisma prensibi:
 - Request -> Middleware -> Endpoint -> Middleware -> Response
 """
-from fastapi import Request,status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.core.rate_limiter import rate_limiter
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Docstring for RateLimitMiddleware
     
-    Rate Limiting middleware sinifi
+    Rate Limiting middleware sinifi (saf ASGI middleware)
+
+    BaseHTTPMiddleware yerine dogrudan ASGI arayuzunu kullanir; istek basina
+    ekstra task ve stream sarmalama maliyeti olmaz, streaming response'lar bozulmaz.
 
     Her istekte:
     1-Kullanici identifier'ini belirle
@@ -33,15 +37,25 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         "/redoc",
         "/openapi.json"
     }
-    async def dispatch(self,request: Request, call_next):
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Her istek bu metoddan gecer."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Excluded path kontrolu
-        if request.url.path in self.EXCLUDED_PATHS:
-            return await call_next(request)
+        path = scope["path"]
+        if path in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
         
         #identifieri belirle(JWT USER ID OLARAK GUNCELLENECEK)
-        client_ip = request.client.host if request.client else "unkown"
+        client = scope.get("client")
+        client_ip = client[0] if client else "unkown"
         identifier = f"ip:{client_ip}"
 
         #Rate limit kontrolu
@@ -54,8 +68,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             "X-RateLimit-Reset-After":str(info["reset_after"])
         }
         if not allowed:
-            logger.warning(f"Rate limit exceeded for {identifier} on {request.url.path}")
-            return JSONResponse(
+            logger.warning(f"Rate limit exceeded for {identifier} on {path}")
+            response = JSONResponse(
                 status_code = status.HTTP_429_TOO_MANY_REQUESTS,
                 content ={
                     "success": False,
@@ -66,10 +80,16 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     }
                 },headers=headers
             )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            #headerlari responsa ekledigimiz kisim
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for key,value in headers.items():
+                    response_headers[key]=value
+            await send(message)
+
         #istegi gecir ve response a header ekle
-        response = await call_next(request)
-        #headerlari responsa ekledigimiz kisim
-        for key,value in headers.items():
-            response.headers[key]=value
-        
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,184 @@
+"""
+Outbox relay.
+
+TaskService event'leri task degisikligiyle ayni transaction'da
+outbox_events tablosuna yazar. Bu relay arka planda tabloyu batch'ler
+halinde okur, event'leri Dapr Pub/Sub'a publish eder ve basarili
+olanlari siler (at-least-once: publish sonrasi silme basarisiz olursa
+event tekrar gonderilir, consumer'lar tekrarlari tolere etmelidir).
+
+Her batch topic basina tek bir Dapr bulk publish istegiyle gonderilir
+(id sirasiyla). Dapr entry bazinda hata doner; sira korunsun diye topic'in
+sadece ilk basarisiz event'ten onceki kismi silinir. Basarisiz event ve
+ondan sonrakiler (publish edilmis olsalar bile) outbox'ta kalir ve bir
+sonraki turda ayni sirayla tekrar gonderilir; boylece ornegin basarisiz bir
+task.updated, ayni task'in task.deleted'indan sonra teslim edilmez.
+Sonraki event'ler tekrar gonderilebilir (event_id ile dedup edilir).
+
+Relay her uvicorn worker'inda calisir. Sira ancak tek bir relay publish
+ederse korunabilir: her tur PostgreSQL'de transaction'a bagli bir advisory
+lock (OutboxRepository.try_lock_relay) ile baslar, kilidi alamayan relay
+o turu atlar. SQLite'ta kilit yoktur; birden fazla worker PostgreSQL
+gerektirir.
+
+settings.outbox_max_attempts kez publish edilemeyen event park edilir:
+tabloda kalir (attempts/last_error ile incelenebilir) ama artik alinmaz,
+boylece zehirli bir satir sonraki event'leri sonsuza kadar bekletmez.
+Bekleyen ve park edilen event sayilari OutboxHealthCheck'te gorunur.
+
+Relay commit sonrasi notify() ile hemen uyandirilir, aksi halde
+settings.outbox_poll_interval_seconds'ta bir tabloyu kontrol eder
+(baska worker'larin yazdigi event'ler icin).
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.dapr_pubsub import dapr_pubsub
+from app.core.logging import get_logger
+from app.db.database import async_session_maker
+from app.db.entities import OutboxEventEntity
+from app.db.repositories.outbox import OutboxRepository
+
+logger = get_logger(__name__)
+
+
+class OutboxRelay:
+    """
+    Outbox tablosunu Dapr'a aktaran arka plan gorevi.
+
+    Args:
+        session_maker: Outbox'in okunacagi veritabani (varsayilan: primary)
+        batch_size: Bir turda publish edilecek en fazla event
+        poll_interval: notify() gelmezse tablonun kontrol edilme araligi (saniye)
+        max_attempts: Bu kadar basarisiz denemeden sonra event park edilir
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+        max_attempts: int | None = None,
+    ):
+        self._session_maker = session_maker or async_session_maker
+        self.batch_size = batch_size or settings.outbox_batch_size
+        self.poll_interval = poll_interval or settings.outbox_poll_interval_seconds
+        self.max_attempts = max_attempts or settings.outbox_max_attempts
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.published = 0
+        self.failed = 0
+        self.parked = 0
+        self.last_error: str | None = None
+
+    def notify(self) -> None:
+        """Yeni event yazildigini bildirir; relay beklemeden calisir."""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Relay'i arka planda baslatir."""
+        if not settings.outbox_relay_enabled or self._task:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("Outbox relay started")
+
+    async def stop(self) -> None:
+        """Relay'i durdurur. Publish edilmemis event'ler tabloda kalir."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Outbox relay stopped")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                published = await self.run_once()
+            except Exception as e:
+                logger.error(f"Outbox relay error: {e}")
+                published = 0
+
+            # Tam batch geldiyse bekleyen event olabilir, beklemeden devam et
+            if published >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def run_once(self) -> int:
+        """
+        Bir batch'i publish eder.
+
+        Returns:
+            int: Publish edilip outbox'tan silinen event sayisi
+        """
+        async with self._session_maker() as session:
+            outbox = OutboxRepository(session)
+            if not await outbox.try_lock_relay():
+                return 0  # baska bir worker'in relay'i publish ediyor
+            events = await outbox.claim_batch(self.batch_size, self.max_attempts)
+            if not events:
+                return 0
+
+            by_topic: dict[str, list[OutboxEventEntity]] = defaultdict(list)
+            for event in events:
+                by_topic[event.topic].append(event)
+
+            published_ids: list[int] = []
+            failures: dict[str, list[OutboxEventEntity]] = defaultdict(list)
+            for topic, topic_events in by_topic.items():
+                result = await dapr_pubsub.publish_bulk(
+                    topic, [dict(event.payload) for event in topic_events]
+                )
+                # Ilk basarisiz event'e kadar olanlar silinir, gerisi sirayla bekler
+                first_failed = min(result.failed, default=len(topic_events))
+                published_ids.extend(event.id for event in topic_events[:first_failed])
+                if first_failed < len(topic_events):
+                    error = result.failed[first_failed]
+                    failures[error].append(topic_events[first_failed])
+
+            if published_ids:
+                await outbox.delete_ids(published_ids)
+            for error, failed_events in failures.items():
+                await outbox.mark_failed([event.id for event in failed_events], error)
+                self.failed += len(failed_events)
+                self.last_error = error
+                logger.warning(
+                    f"{len(failed_events)} outbox events not published: {error}"
+                )
+                # mark_failed session'daki nesnelerin attempts degerini de gunceller
+                for event in failed_events:
+                    if event.attempts >= self.max_attempts:
+                        self.parked += 1
+                        logger.error(
+                            f"Outbox event {event.id} parked after "
+                            f"{self.max_attempts} attempts: {error}"
+                        )
+            await session.commit()
+
+        self.published += len(published_ids)
+        return len(published_ids)
+
+    def stats(self) -> dict[str, Any]:
+        """Relay istatistikleri."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "published": self.published,
+            "failed": self.failed,
+            "parked": self.parked,
+            "last_error": self.last_error,
+        }
+
+
+# Global Instance
+outbox_relay = OutboxRelay()
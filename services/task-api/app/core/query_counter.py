@@ -0,0 +1,115 @@
+"""
+Istek basina SQL sorgu sayaci.
+
+Her HTTP isteginde calisan SQL ifadelerini sayar; sonucu
+X-DB-Query-Count response header'ina yazar ve toplamlari
+query_stats uzerinden sunar (bkz. DatabaseHealthCheck).
+
+Sayim, tum engine'lerin before_cursor_execute event'i ile yapilir.
+Sayac istek basina bir context variable'da tutulur; SQLAlchemy async
+katmani greenlet'lere context'i aktardigi icin sorgular dogru istege yazilir.
+"""
+
+import logging
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+
+
+class QueryCounter:
+    """Bir istekteki sorgu sayisi."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+class QueryStats:
+    """Tum istekler icin toplam sorgu istatistikleri."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+
+    def record(self, count: int) -> None:
+        self.requests += 1
+        self.queries += count
+        self.max_queries = max(self.max_queries, count)
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "queries": self.queries,
+            "avg_queries_per_request": (
+                round(self.queries / self.requests, 2) if self.requests else 0.0
+            ),
+            "max_queries_per_request": self.max_queries,
+        }
+
+
+query_counter_ctx: ContextVar[QueryCounter | None] = ContextVar(
+    "query_counter", default=None
+)
+
+# Global Instance
+query_stats = QueryStats()
+
+
+def start_query_count() -> QueryCounter:
+    """Mevcut context icin yeni bir sayac baslatir ve doner."""
+    counter = QueryCounter()
+    query_counter_ctx.set(counter)
+    return counter
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = query_counter_ctx.get()
+    if counter is not None:
+        counter.count += 1
+
+
+class QueryCountMiddleware:
+    """
+    Her HTTP istegindeki SQL sorgu sayisini olcer (saf ASGI middleware).
+
+    - Response header'ina X-DB-Query-Count ekler.
+    - Istek bitince sayiyi query_stats'a kaydeder.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = start_query_count()
+
+        async def send_with_query_count(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[QUERY_COUNT_HEADER] = str(counter.count)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_query_count)
+        finally:
+            query_stats.record(counter.count)
+            logger.debug(
+                f"{scope['method']} {scope['path']} ran {counter.count} queries"
+            )
@@ -1,9 +1,79 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
 from app.core.cache import redis_cache
 from app.core.logging import get_logger
-import time
 from app.config import settings
 logger = get_logger(__name__)
 
+# Refill + consume adimini Redis icinde atomik calistiran Lua script'i.
+# KEYS[1] = bucket key
+# ARGV[1] = max_requests, ARGV[2] = refill_rate (token/sn), ARGV[3] = ttl (ms)
+# Donus: {allowed (1/0), kalan token (string, Lua float'lari integer'a kirpmasin diye)}
+TOKEN_BUCKET_SCRIPT = """
+local max_tokens = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local ttl_ms = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last_update')
+local tokens = tonumber(state[1])
+local last_update = tonumber(state[2])
+if tokens == nil then
+    tokens = max_tokens
+    last_update = now
+end
+
+local elapsed = math.max(0, now - last_update)
+tokens = math.min(max_tokens, tokens + elapsed * refill_rate)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'last_update', tostring(now))
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+return {allowed, tostring(tokens)}
+"""
+
+# Hybrid modda worker'in lokal olarak harcadigi token'lari Redis'e isleyen script.
+# Token'lar zaten verilmis oldugu icin kosulsuz dusulur; bucket eksiye inebilir
+# (en fazla -max_tokens) ki fazla harcanan kisim sonraki pencereden dusulsun.
+# KEYS[1] = bucket key
+# ARGV[1] = max_requests, ARGV[2] = refill_rate, ARGV[3] = ttl (ms),
+# ARGV[4] = harcanan token
+# Donus: guncel global token sayisi (string)
+SYNC_BUCKET_SCRIPT = """
+local max_tokens = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local ttl_ms = tonumber(ARGV[3])
+local consumed = tonumber(ARGV[4])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last_update')
+local tokens = tonumber(state[1])
+local last_update = tonumber(state[2])
+if tokens == nil then
+    tokens = max_tokens
+    last_update = now
+end
+
+local elapsed = math.max(0, now - last_update)
+tokens = math.min(max_tokens, tokens + elapsed * refill_rate)
+tokens = math.max(-max_tokens, tokens - consumed)
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'last_update', tostring(now))
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+return tostring(tokens)
+"""
+
 class RateLimiter:
     """
     Token Bucket algoritmasi kullanilarak rate limiting yapar.
@@ -18,8 +88,12 @@ class RateLimiter:
     Redis Key Formati:
         ratelimit::{identifier}
 
-    Redis value(JSON):
-        {"tokens":95.5,"last_update":1706012345.123}
+    Redis value(HASH):
+        tokens=95.5, last_update=1706012345.123
+
+    Refill ve token dusme islemi tek bir Lua script cagrisi (EVALSHA) ile
+    Redis icinde atomik yapilir. Boylece istek basina tek round trip olur
+    ve paralel istekler birbirinin token dusmesini ezemez.
     """
     def __init__(
         self,
@@ -39,6 +113,9 @@ class RateLimiter:
         #Token yenileme hizi = max_requests/window_seconds
         #ornek:100 token/ 60 saniye = 1.67 token/saniye
         self.refill_rate = self.max_requests/self.window_seconds
+
+        self._scripts: dict = {}
+        self._script_client = None
     
     def _get_key(self,identifier: str) -> str:
         """
@@ -51,15 +128,38 @@ class RateLimiter:
             Redis Key: "ratelimit:{identifier}"
         """
         return f"ratelimit:{identifier}"
+    def _get_script(self, source: str = TOKEN_BUCKET_SCRIPT):
+        """
+        Lua script'ini dondurur (varsayilan: token bucket).
+
+        register_script, script'i ilk cagrida SCRIPT LOAD ile yukler ve sonra
+        sadece SHA ile (EVALSHA) cagirir; Redis yeniden baslarsa otomatik tekrar yukler.
+        Redis client degisirse (reconnect, test) script'ler yeniden kaydedilir.
+        """
+        if self._script_client is not redis_cache.redis:
+            self._scripts = {}
+            self._script_client = redis_cache.redis
+        if source not in self._scripts:
+            self._scripts[source] = redis_cache.redis.register_script(source)
+        return self._scripts[source]
+
+    async def start(self) -> None:
+        """Arka plan islerini baslatir (Redis modunda yapacak is yok)."""
+
+    async def stop(self) -> None:
+        """Arka plan islerini durdurur (Redis modunda yapacak is yok)."""
+
     async def is_allowed(self, identifier:str) -> tuple[bool, dict]:
         """
         Istegin rate limit'e takilip takilmadigini kontrol eder.
 
-        Token Bucket algoritmasi:
+        Token Bucket algoritmasi (Redis icinde, atomik):
         1-Mevcut token sayisini al.
         2-Son guncellemeden bu yana gecen sureye gore token ekle.
         3-Token >= 1 ise: izin ver,1 token dus
         4-Token < 1 ise: Reddet
+
+        Redis'e ulasilamazsa istek engellenmez (fail-open).
         
         Args:
             identifier: Kullanici ip ya da id adresi
@@ -73,41 +173,29 @@ class RateLimiter:
             -limit: int(maksimum token)
         """
         key = self._get_key(identifier)
-        now = time.time()
-
-        # Redisten mevcut durum aliyoruz.
-        data = await redis_cache.get(key)
 
-        if data is None:
-            #ilk istek atilir(kova dolu baslar.)
-            tokens = self.max_requests
-            last_update = now
+        if redis_cache.redis is None:
+            #Redis yok, limitleme yapamiyoruz (ilk istek gibi davran)
+            allowed, tokens = True, float(self.max_requests - 1)
         else:
-            tokens = data["tokens"]
-            last_update = data["last_update"]
-        
-        # Gecen sureye gore token ekle (refill)
-        time_passed = now - last_update
-        tokens = min(
-            self.max_requests, #maksimumu gecemez.
-            tokens + (time_passed * self.refill_rate)
-        )
+            try:
+                result = await self._get_script()(
+                    keys=[key],
+                    args=[
+                        self.max_requests,
+                        self.refill_rate,
+                        self.window_seconds * 2 * 1000,
+                    ],
+                )
+                allowed, tokens = bool(int(result[0])), float(result[1])
+            except Exception as e:
+                logger.error(f"Rate limiter script error for {identifier}: {e}")
+                allowed, tokens = True, float(self.max_requests - 1)
 
-        # Token kontrolu
-        if tokens >= 1:
-            tokens -= 1
-            allowed = True
-        else:
-            allowed = False
-        
-        # Guncel Durumu Redis'e kaydet
-        await redis_cache.set(
-            key,
-            {"tokens" : tokens, "last_update" : now},
-            ttl= self.window_seconds * 2
-        )
-        
-        # Bilgi dict'i hazirla.
+        return allowed, self._build_info(identifier, allowed, tokens)
+
+    def _build_info(self, identifier: str, allowed: bool, tokens: float) -> dict:
+        """Header'larda kullanilan bilgi dict'ini hazirlar."""
         reset_after = (1-tokens) / self.refill_rate if tokens < 1 else 0
 
         info = {
@@ -120,6 +208,157 @@ class RateLimiter:
         if not allowed:
             logger.warning(f"Rate Limit exceeded for {identifier}")
         
-        return allowed, info
+        return info
+
+@dataclass
+class _LocalBucket:
+    """Hybrid modda bir identifier'in worker icindeki durumu."""
+    tokens: float          # Global bucket'in lokal tahmini
+    last_refill: float     # Lokal refill zamani (monotonic)
+    last_sync: float       # Son Redis senkronizasyonu (monotonic)
+    pending: int = 0       # Son sync'ten beri lokal olarak harcanan token
+
+
+class HybridRateLimiter(RateLimiter):
+    """
+    Worker ici token bucket + periyodik Redis senkronizasyonu.
+
+    Calisma mantigi:
+    1-Her worker identifier basina lokal bir bucket tutar ve istegi
+      network'e gitmeden lokal bucket'tan karsilar.
+    2-Harcanan token'lar `pending` olarak birikir ve Redis'teki global
+      bucket'a toplu olarak islenir:
+        - her `sync_interval_ms` milisaniyede bir (arka plan gorevi),
+        - `pending` tolerans sinirina ulasinca,
+        - bucket tukenmeye yaklasinca (karar vermeden once).
+    3-Sync sonrasi lokal bucket global degere esitlenir, boylece diger
+      worker'larin harcamalari da gorulur.
+
+    Dogruluk: Her worker senkronize olmadan en fazla
+    `tolerance * max_requests` token harcayabilir; N worker icin global
+    limit en fazla N * tolerance * max_requests kadar asilabilir.
+    """
+    def __init__(
+        self,
+        max_requests: int | None = None,
+        window_seconds: int | None = None,
+        sync_interval_ms: int | None = None,
+        tolerance: float | None = None
+    ):
+        super().__init__(max_requests, window_seconds)
+        sync_interval_ms = sync_interval_ms or settings.rate_limit_sync_interval_ms
+        self.sync_interval = sync_interval_ms / 1000
+        if tolerance is None:
+            tolerance = settings.rate_limit_sync_tolerance
+        # Senkronize olmadan harcanabilecek maksimum token (en az 1)
+        self.sync_threshold = max(1, int(self.max_requests * tolerance))
+        self._buckets: dict[str, _LocalBucket] = {}
+        self._flusher: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Periyodik senkronizasyon gorevini baslatir."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Gorevi durdurur ve bekleyen harcamalari Redis'e isler."""
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Rate limiter flush error: {e}")
+
+    async def flush(self) -> None:
+        """Bekleyen harcamalari Redis'e isler, uzun suredir bos bucket'lari siler."""
+        now = time.monotonic()
+        for identifier, bucket in list(self._buckets.items()):
+            if bucket.pending:
+                await self._sync(identifier, bucket)
+            elif now - bucket.last_sync > self.window_seconds:
+                # Hic istek gelmeyen identifier'lar bellekte birikmesin
+                del self._buckets[identifier]
+
+    async def _sync(self, identifier: str, bucket: _LocalBucket) -> None:
+        """Lokal harcamayi global bucket'a isler ve lokal tahmini gunceller."""
+        consumed = bucket.pending
+        bucket.pending = 0
+        bucket.last_sync = time.monotonic()
+        if redis_cache.redis is None:
+            return
+        try:
+            result = await self._get_script(SYNC_BUCKET_SCRIPT)(
+                keys=[self._get_key(identifier)],
+                args=[
+                    self.max_requests,
+                    self.refill_rate,
+                    self.window_seconds * 2 * 1000,
+                    consumed,
+                ],
+            )
+        except Exception as e:
+            logger.error(f"Rate limiter sync error for {identifier}: {e}")
+            return
+        # Script calisirken gelen lokal harcamalari da dus
+        bucket.tokens = float(result) - bucket.pending
+        bucket.last_refill = time.monotonic()
+
+    def _refill(self, bucket: _LocalBucket, now: float) -> None:
+        bucket.tokens = min(
+            self.max_requests,
+            bucket.tokens + (now - bucket.last_refill) * self.refill_rate
+        )
+        bucket.last_refill = now
+
+    async def is_allowed(self, identifier: str) -> tuple[bool, dict]:
+        """
+        Istegi lokal bucket'tan karsilar; sadece gerektiginde Redis'e gider.
+
+        Args:
+            identifier: Kullanici ip ya da id adresi
+        Returns:
+            tuple[bool,dict]: (izin_var_mi, bilgi_dict)
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(identifier)
+        if bucket is None:
+            # Ilk gorus: global durumu ogrenmek icin senkronize ol
+            bucket = _LocalBucket(
+                tokens=self.max_requests, last_refill=now, last_sync=0.0
+            )
+            self._buckets[identifier] = bucket
+            await self._sync(identifier, bucket)
+        else:
+            self._refill(bucket, now)
+            near_exhaustion = bucket.tokens < self.sync_threshold + 1
+            stale = now - bucket.last_sync >= self.sync_interval
+            if bucket.pending >= self.sync_threshold or (near_exhaustion and stale):
+                await self._sync(identifier, bucket)
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            bucket.pending += 1
+            allowed = True
+        else:
+            allowed = False
+
+        return allowed, self._build_info(identifier, allowed, bucket.tokens)
+
+
+def create_rate_limiter() -> RateLimiter:
+    """settings.rate_limit_mode'a gore limiter olusturur ("redis" | "hybrid")."""
+    if settings.rate_limit_mode == "hybrid":
+        return HybridRateLimiter()
+    return RateLimiter()
 
-rate_limiter = RateLimiter()
\ No newline at end of file
+rate_limiter = create_rate_limiter()
\ No newline at end of file
@@ -1,9 +1,15 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
 import jwt
 
 from app.config import settings
+from app.core.resilience import Bulkhead
 
 # ---  SIFRE ISLEMLERI (BCRYPT) ---
 
@@ -20,6 +26,57 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
+# --- EVENT LOOP DISINDA SIFRE ISLEMLERI ---
+# bcrypt bilerek yavastir (~100-300 ms) ve calisirken GIL'i birakir. Event loop'ta
+# calistirirsak o worker'daki tum istekler bekler; bu yuzden ayri, boyutu sinirli
+# bir thread pool'da calistiriyoruz. Bulkhead pool'da calisan + kuyrukta bekleyen
+# is sayisini sinirlar; doluysa BulkheadFullError (503) firlatilir.
+# Pool ilk kullanimda olusturulur; shutdown sonrasi (or. testlerde ikinci
+# lifespan) yeniden olusturulur.
+
+_password_executor: ThreadPoolExecutor | None = None
+password_bulkhead = Bulkhead(
+    max_concurrent=settings.password_hash_workers + settings.password_hash_max_queue,
+    name="password_hashing",
+)
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            thread_name_prefix="password-hash",
+        )
+    return _password_executor
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password'u thread pool'da calistirir (event loop'u bloklamaz)."""
+    async with password_bulkhead:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_password_executor(), hash_password, password
+        )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password'u thread pool'da calistirir (event loop'u bloklamaz)."""
+    async with password_bulkhead:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_password_executor(), verify_password, plain_password, hashed_password
+        )
+
+
+def shutdown_password_executor() -> None:
+    """Uygulama kapanirken thread pool'u kapatir."""
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
+
 # --- TOKEN ISLEMLERI (JWT) ---
 
 
@@ -43,8 +100,77 @@ def create_refresh_token(user_id: int) -> str:
     )
 
 
-def decode_token(token: str) -> dict | None:
-    """Token'i dogrular ve icindeki veriyi (payload) cozer"""
+class VerifiedTokenCache:
+    """
+    Dogrulanmis JWT payload'larini tutan, boyutu sinirli process ici cache.
+
+    Istemciler ayni access token'i dakikalarca tekrar kullanir; her istekte
+    imza dogrulama + JSON parse yapmak yerine dogrulanmis payload'i token'in
+    SHA-256 ozetiyle saklariz. Entry token'in `exp` zamaninda gecersiz olur.
+    Sadece basariyla dogrulanan token'lar cache'lenir.
+
+    Args:
+        max_entries: Maksimum token sayisi (0 = cache kapali)
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # digest -> (payload, exp)
+        self._data: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, digest: bytes) -> dict | None:
+        """Suresi dolmamis payload'in kopyasini doner."""
+        item = self._data.get(digest)
+        if item is None:
+            self.misses += 1
+            return None
+        payload, exp = item
+        if exp <= time.time():
+            del self._data[digest]
+            self.misses += 1
+            return None
+        self._data.move_to_end(digest)
+        self.hits += 1
+        return dict(payload)
+
+    def set(self, digest: bytes, payload: dict) -> None:
+        """Payload'i `exp` zamanina kadar saklar; doluysa en eskisini cikarir."""
+        exp = payload.get("exp")
+        if self.max_entries <= 0 or exp is None:
+            return
+        self._data[digest] = (dict(payload), float(exp))
+        self._data.move_to_end(digest)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Tum entry'leri siler (orn. secret key degistiginde)."""
+        self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+verified_token_cache = VerifiedTokenCache(max_entries=settings.jwt_decode_cache_size)
+
+
+def _decode_token_uncached(token: str) -> dict | None:
+    """Token'i her seferinde imzasiyla dogrular ve payload'i cozer."""
     try:
         decoded_payload = jwt.decode(
             token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
@@ -53,3 +179,16 @@ def decode_token(token: str) -> dict | None:
     except (jwt.PyJWTError, Exception):
         # Token Gecersiz, suresi dolmus veya bozulmussa
         return None
+
+
+def decode_token(token: str) -> dict | None:
+    """Token'i dogrular ve payload'i cozer (dogrulanmis token'lar cache'lenir)"""
+    digest = VerifiedTokenCache.digest(token)
+    payload = verified_token_cache.get(digest)
+    if payload is not None:
+        return payload
+
+    payload = _decode_token_uncached(token)
+    if payload is not None:
+        verified_token_cache.set(digest, payload)
+    return payload
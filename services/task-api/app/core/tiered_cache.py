@@ -0,0 +1,254 @@
+"""
+Iki katmanli (L1 + L2) cache.
+
+L1: Worker process'i icinde, entry sayisi ve byte ile sinirli, TTL'li LRU cache.
+L2: Redis (redis_cache).
+
+Calisma mantigi:
+    get -> L1'de varsa network'e hic gitmeden doner.
+        -> yoksa Redis'e bakar, bulursa L1'e de yazar.
+    set -> Redis'e ve L1'e yazar.
+    incr/delete -> Redis'te uygular, L1'den siler ve key'i Redis pub/sub
+                   kanalina yayinlar. Ayni kanali dinleyen tum uvicorn
+                   worker'lari key'i kendi L1'lerinden siler.
+
+Versiyonlu invalidation (bkz. cache_keys) ile birlikte sadece versiyon
+sayaclari degisir; bu yuzden yayinlanan mesaj sayisi yazma sayisi kadardir.
+L1 TTL'i kisa tutulur ki kacirilan bir pub/sub mesajinin etkisi sinirli kalsin.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.config import settings
+from app.core.cache import DateTimeEncoder, redis_cache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LocalLRUCache:
+    """
+    Process ici LRU cache.
+
+    Degerler JSON string olarak tutulur; boylece boyut hesabi kolaydir ve
+    cagiranlar ayni objeyi paylasip birbirini etkilemez.
+
+    Args:
+        max_entries: Maksimum entry sayisi
+        max_bytes: Tum degerlerin toplam maksimum boyutu (byte)
+        ttl_seconds: Varsayilan yasam suresi
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # key -> (json_value, expires_at)
+        self._data: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> str | None:
+        """Key'i doner ve en son kullanilan olarak isaretler. Suresi dolmussa siler."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Degeri yazar, sinirlar asilirsa en eski kullanilanlari cikarir."""
+        size = len(value)
+        if size > self.max_bytes:
+            # Tek basina sigmayan degerleri L1'e hic koymuyoruz
+            self._remove(key)
+            return
+        self._remove(key)
+        expires_at = time.monotonic() + min(ttl or self.ttl_seconds, self.ttl_seconds)
+        self._data[key] = (value, expires_at)
+        self._bytes += size
+
+        while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key, (oldest_value, _) = self._data.popitem(last=False)
+            self._bytes -= len(oldest_value)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._bytes -= len(item[0])
+
+
+class TieredCache:
+    """
+    redis_cache'in onune opsiyonel bir L1 cache koyan class.
+
+    L1 kapaliysa (settings.local_cache_enabled=False) tum cagrilar
+    dogrudan redis_cache'e gider; sadece L2 istatistikleri tutulur.
+    """
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        channel: str | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        self.enabled = settings.local_cache_enabled if enabled is None else enabled
+        self.channel = channel or settings.local_cache_invalidation_channel
+        self.local = LocalLRUCache(
+            max_entries=max_entries or settings.local_cache_max_entries,
+            max_bytes=max_bytes or settings.local_cache_max_bytes,
+            ttl_seconds=ttl_seconds or settings.local_cache_ttl_seconds,
+        )
+        self._listener: asyncio.Task | None = None
+        self.l1_hits = 0
+        self.l1_misses = 0
+        self.l2_hits = 0
+        self.l2_misses = 0
+
+    # ----- LIFECYCLE ----- #
+
+    async def start(self) -> None:
+        """Pub/sub invalidation dinleyicisini baslatir (L1 aciksa)."""
+        if not self.enabled or redis_cache.redis is None or self._listener:
+            return
+        pubsub = redis_cache.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(pubsub))
+        logger.info(f"L1 cache invalidation listener started on '{self.channel}'")
+
+    async def stop(self) -> None:
+        """Dinleyiciyi durdurur ve L1'i bosaltir."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.local.clear()
+
+    async def _listen(self, pubsub) -> None:
+        """Kanala gelen her key'i L1'den siler."""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self.local.delete(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Dinleyici olurse L1'e guvenemeyiz, kapatiyoruz.
+            logger.error(f"L1 cache invalidation listener stopped: {e}")
+            self.local.clear()
+            self.enabled = False
+        finally:
+            await pubsub.aclose()
+
+    # ----- CACHE ISLEMLERI ----- #
+
+    async def get(self, key: str) -> Any | None:
+        """Once L1'e, sonra Redis'e bakar."""
+        if self.enabled:
+            raw = self.local.get(key)
+            if raw is not None:
+                self.l1_hits += 1
+                return json.loads(raw)
+            self.l1_misses += 1
+
+        value = await redis_cache.get(key)
+        if value is None:
+            self.l2_misses += 1
+            return None
+        self.l2_hits += 1
+        if self.enabled:
+            self.local.set(key, json.dumps(value, cls=DateTimeEncoder))
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Redis'e ve L1'e yazar."""
+        await redis_cache.set(key, value, ttl)
+        if self.enabled:
+            self.local.set(key, json.dumps(value, cls=DateTimeEncoder), ttl)
+
+    async def get_version(self, key: str) -> int:
+        """Versiyon sayacini okur; L1 aciksa sayac da L1'de tutulur."""
+        if self.enabled:
+            raw = self.local.get(key)
+            if raw is not None:
+                self.l1_hits += 1
+                return int(raw)
+            self.l1_misses += 1
+
+        version = await redis_cache.get_version(key)
+        if self.enabled:
+            self.local.set(key, str(version))
+        return version
+
+    async def incr(self, key: str) -> int | None:
+        """Sayaci artirir ve tum worker'lara invalidation yayinlar."""
+        value = await redis_cache.incr(key)
+        await self._invalidate(key)
+        return value
+
+    async def delete(self, key: str) -> None:
+        """Key'i siler ve tum worker'lara invalidation yayinlar."""
+        await redis_cache.delete(key)
+        await self._invalidate(key)
+
+    async def _invalidate(self, key: str) -> None:
+        if not self.enabled:
+            return
+        self.local.delete(key)
+        if redis_cache.redis is None:
+            return
+        try:
+            await redis_cache.redis.publish(self.channel, key)
+        except Exception as e:
+            logger.error(f"Redis PUBLISH error for key {key}: {e}")
+
+    # ----- ISTATISTIK ----- #
+
+    def stats(self) -> dict[str, Any]:
+        """L1/L2 hit oranlarini ve L1 doluluk bilgisini doner."""
+        l1_total = self.l1_hits + self.l1_misses
+        l2_total = self.l2_hits + self.l2_misses
+        return {
+            "l1_enabled": self.enabled,
+            "l1_hits": self.l1_hits,
+            "l1_misses": self.l1_misses,
+            "l1_hit_ratio": round(self.l1_hits / l1_total, 4) if l1_total else 0.0,
+            "l1_entries": len(self.local),
+            "l1_bytes": self.local.size_bytes,
+            "l1_evictions": self.local.evictions,
+            "l2_hits": self.l2_hits,
+            "l2_misses": self.l2_misses,
+            "l2_hit_ratio": round(self.l2_hits / l2_total, 4) if l2_total else 0.0,
+        }
+
+
+# Global Instance
+tiered_cache = TieredCache()
@@ -0,0 +1,92 @@
+"""
+Kimligi dogrulanmis kullanici (principal) cache'i.
+
+get_current_user her istekte JWT'den user id'yi cozup DB'den kullaniciyi
+cekiyordu; yani her task okumasi ekstra bir SQL sorgusu demekti.
+Bu modul kullaniciyi iki katmanda saklar:
+    - worker ici L1 (kisa TTL, settings.user_cache_local_ttl_seconds)
+    - Redis (settings.user_cache_ttl_seconds)
+
+Kullanici degistiginde/silindiginde (bkz. TaskUnitOfWork.commit)
+invalidate_cached_user cagrilir; key Redis'ten silinir ve pub/sub ile
+tum worker'larin L1'inden atilir.
+
+Not: hashed_password cache'e yazilmaz. Buradan donen UserEntity bir
+session'a bagli degildir, sadece okuma icin kullanilmalidir.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from app.config import settings
+from app.core.cache_keys import get_user_principal_cache_key
+from app.core.tiered_cache import TieredCache
+from app.db.entities import UserEntity
+
+# Kullanicilar icin L1 her zaman acik (TTL kisa, invalidation pub/sub ile)
+user_cache = TieredCache(
+    enabled=True,
+    max_entries=settings.user_cache_max_entries,
+    ttl_seconds=settings.user_cache_local_ttl_seconds,
+)
+
+
+def _serialize_user(user: UserEntity) -> dict[str, Any]:
+    """Cache'e yazilacak alanlari secer (sifre hash'i haric)."""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "full_name": user.full_name,
+        "is_active": user.is_active,
+        "is_superuser": user.is_superuser,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    }
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _deserialize_user(data: dict[str, Any]) -> UserEntity:
+    """Cache verisinden session'a bagli olmayan bir UserEntity olusturur."""
+    return UserEntity(
+        id=data["id"],
+        email=data["email"],
+        full_name=data["full_name"],
+        is_active=data["is_active"],
+        is_superuser=data["is_superuser"],
+        created_at=_parse_datetime(data["created_at"]),
+        updated_at=_parse_datetime(data["updated_at"]),
+    )
+
+
+async def get_cached_user(user_id: int) -> UserEntity | None:
+    """
+    Kullaniciyi cache'ten getirir.
+
+    Args:
+        user_id: Kullanici ID'si
+    Returns:
+        UserEntity | None: Cache'te yoksa (veya cache kapaliysa) None
+    """
+    if not settings.user_cache_enabled:
+        return None
+    data = await user_cache.get(get_user_principal_cache_key(user_id))
+    return _deserialize_user(data) if data else None
+
+
+async def cache_user(user: UserEntity) -> None:
+    """Kullaniciyi L1 ve Redis'e yazar."""
+    if not settings.user_cache_enabled:
+        return
+    await user_cache.set(
+        get_user_principal_cache_key(user.id),
+        _serialize_user(user),
+        ttl=settings.user_cache_ttl_seconds,
+    )
+
+
+async def invalidate_cached_user(user_id: int) -> None:
+    """Kullaniciyi tum worker'larin cache'inden siler."""
+    await user_cache.delete(get_user_principal_cache_key(user_id))
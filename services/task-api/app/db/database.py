@@ -1,11 +1,18 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config import settings
+from app.db.pool import create_database_engine
 
-# Engine olusturma
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+# Engine olusturma (pool ayarlari icin bkz. app.db.pool)
+engine = create_database_engine(settings.database_url)
+
+# Read replica engine (opsiyonel, bkz. app.db.routing)
+replica_engine = (
+    create_database_engine(settings.database_replica_url)
+    if settings.database_replica_url else None
+)
 
 # session maker
 
@@ -15,9 +22,26 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+replica_session_maker = (
+    async_sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None else None
+)
+
 # Dependency Injection
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
+
+
+async def get_replica_db_session() -> AsyncGenerator[AsyncSession | None, None]:
+    """
+    Replica tanimliysa replica session'i verir, degilse None (okumalar primary'de).
+    Session ilk sorguya kadar baglanti almaz.
+    """
+    if replica_session_maker is None:
+        yield None
+        return
+    async with replica_session_maker() as session:
+        yield session
@@ -1,5 +1,6 @@
 from .base import Base, TimestampMixin
+from .outbox import OutboxEventEntity
 from .task import TaskEntity
 from .user import UserEntity
 
-__all__ = ["Base", "TimestampMixin", "TaskEntity", "UserEntity"]
+__all__ = ["Base", "TimestampMixin", "OutboxEventEntity", "TaskEntity", "UserEntity"]
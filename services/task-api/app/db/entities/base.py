@@ -9,6 +9,10 @@ class Base(DeclarativeBase):
 
 
 class TimestampMixin:
+    # Sunucuda uretilen degerler (id, updated_at vb.) INSERT/UPDATE'in
+    # RETURNING'i ile alinir; commit sonrasi ayrica SELECT gerekmez.
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
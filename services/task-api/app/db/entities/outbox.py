@@ -0,0 +1,27 @@
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class OutboxEventEntity(Base):
+    """
+    Publish edilmeyi bekleyen event (transactional outbox).
+
+    Task degisikligiyle ayni transaction'da yazilir; OutboxRelay satirlari
+    id sirasiyla Dapr'a publish eder ve basarili olanlari siler.
+    """
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    topic: Mapped[str] = mapped_column(String(255))
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    # Basarisiz publish denemeleri (izleme icin)
+    attempts: Mapped[int] = mapped_column(default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
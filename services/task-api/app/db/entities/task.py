@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,6 +11,13 @@ from .base import Base, TimestampMixin
 
 class TaskEntity(Base, TimestampMixin):
     __tablename__ = "tasks"
+    # Sorgularin hepsi user_id ile filtreler (TaskUserSpecification);
+    # index'ler gercek erisim yollarina gore kompozit tutulur.
+    __table_args__ = (
+        Index("ix_tasks_user_id_status", "user_id", "status"),
+        Index("ix_tasks_user_id_priority", "user_id", "priority"),
+        Index("ix_tasks_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -0,0 +1,164 @@
+"""
+Database connection pool ayarlari ve istatistikleri.
+
+Engine ayarlari (pool boyutu, overflow, pre-ping, recycle, statement cache,
+statement timeout) Settings'ten okunur. Ayarlanmamis degerler icin surucuye
+gore varsayilanlar kullanilir:
+    - asyncpg  : pool_size = db_bulkhead kapasitesi, pre-ping acik,
+                 baglantilar 30 dk'da bir yenilenir.
+    - aiosqlite: dosya uzerinde kucuk bir pool, pre-ping/recycle gereksiz.
+                 ":memory:" veritabaninda SQLAlchemy'nin varsayilani kullanilir.
+
+Pool, baglanti alma suresini olcen bir AsyncAdaptedQueuePool ile kurulur;
+get_pool_stats() checked-out, overflow ve bekleme surelerini doner
+(bkz. DatabasePoolHealthCheck). Pool kapasitesi (size + overflow)
+db_bulkhead'in izin verdigi eszamanli islem sayisindan kucukse,
+bulkhead'den gecen istekler pool'da beklemeye baslar.
+"""
+
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.config import settings
+from app.core.resilience import db_bulkhead
+from app.db.search import get_connect_args
+
+
+class PoolMetrics:
+    """Baglanti alma (checkout) sureleri ve timeout sayisi."""
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+            return
+        self.acquisitions += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (
+                round(self.total_wait / self.acquisitions * 1000, 3)
+                if self.acquisitions else 0.0
+            ),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Pool'dan baglanti alma suresini olcen AsyncAdaptedQueuePool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # Yeni pool ayni metrikleri kullanmaya devam etsin
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def _is_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def create_database_engine(database_url: str) -> AsyncEngine:
+    """
+    database_url'in surucusune gore ayarlanmis bir AsyncEngine olusturur.
+
+    Ornek: engine = create_database_engine(settings.database_url)
+    """
+    url = make_url(database_url)
+    connect_args = get_connect_args(database_url)
+
+    if _is_memory_sqlite(database_url):
+        # Tek baglantiyla (StaticPool) yasar, pool ayari uygulanmaz
+        return create_async_engine(url, echo=settings.debug)
+
+    if url.get_backend_name() == "postgresql":
+        defaults = {"pool_size": db_bulkhead.max_concurrent, "max_overflow": 5,
+                    "pre_ping": True, "recycle": 1800}
+    else:
+        defaults = {"pool_size": 5, "max_overflow": 10,
+                    "pre_ping": False, "recycle": -1}
+
+    if url.get_driver_name() == "asyncpg":
+        # SQLAlchemy'nin prepared statement cache'i URL parametresiyle,
+        # asyncpg'nin kendi cache'i connect argumaniyla ayarlanir
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.db_statement_cache_size)}
+        )
+        connect_args["statement_cache_size"] = settings.db_statement_cache_size
+        if settings.db_statement_timeout_ms:
+            server_settings = connect_args.setdefault("server_settings", {})
+            server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        connect_args=connect_args,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=_setting_or(settings.db_pool_size, defaults["pool_size"]),
+        max_overflow=_setting_or(settings.db_max_overflow, defaults["max_overflow"]),
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_pre_ping=_setting_or(settings.db_pool_pre_ping, defaults["pre_ping"]),
+        pool_recycle=_setting_or(settings.db_pool_recycle_seconds, defaults["recycle"]),
+    )
+
+
+def _setting_or(value, default):
+    """Settings'te bos birakilan (None) degerler icin surucu varsayilanini kullanir."""
+    return default if value is None else value
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """
+    Engine pool'unun anlik durumunu doner.
+
+    Returns:
+        dict: pool sinifi, size, checked_out, overflow, capacity (sinirsizsa None),
+              bekleme sureleri ve db_bulkhead karsilastirmasi
+    """
+    pool = engine.pool
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        # max_overflow < 0: overflow sinirsiz, kapasite yok
+        capacity = None if pool._max_overflow < 0 else pool.size() + pool._max_overflow
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            capacity=capacity,
+        )
+        stats["bulkhead_max_concurrent"] = db_bulkhead.max_concurrent
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.stats())
+    return stats
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.resilience import with_db_retry
@@ -5,6 +7,19 @@ from app.db.entities.base import Base
 from app.db.repositories.specifications import PaginationSpecification, Specification
 
 
+@dataclass
+class PageResult[T]:
+    """
+    find_page sonucu.
+
+    total: Filtreye uyan toplam kayit; with_total=False ise None
+    has_more: Bu sayfadan sonra kayit var mi
+    """
+    items: list[T]
+    total: int | None
+    has_more: bool
+
+
 class BaseRepository[T: Base]:
     def __init__(self, session: AsyncSession, model: type[T]):
         self.session = session
@@ -72,6 +87,63 @@ class BaseRepository[T: Base]:
         for spec in specifications:
             if not isinstance(spec, PaginationSpecification): # pagination count'u etkilemesin diye
                 query=spec.apply(query)
+        # Siralama (ornegin arama alakasi) count'u etkilemez, PostgreSQL'de hata verir
+        query = query.order_by(None)
         
         result = await self.session.execute(query)
-        return result.scalar() or 0
\ No newline at end of file
+        return result.scalar() or 0
+    @with_db_retry
+    async def find_page(
+        self, *specifications: Specification[T], with_total: bool = True
+    ) -> PageResult[T]:
+        """
+        Sayfa satirlarini ve toplam sayiyi tek sorguda doner.
+
+        with_total=True: Toplam, COUNT(*) OVER() ile ayni sorguda hesaplanir
+            (count() + find() gibi iki round trip ve filtrelerin iki kez
+            calistirilmasi yerine). Sayfa bos gelirse (son sayfadan sonrasi)
+            toplam icin count()'a dusulur.
+        with_total=False: Toplam hic hesaplanmaz; sayfa boyutundan bir fazla
+            satir cekilerek sadece has_more bulunur. Cok buyuk sonuc
+            kumelerinde tum eslesen satirlari saymaktan kacinmak icindir.
+
+        Not: Keyset (cursor) sayfalamada COUNT(*) OVER() sadece cursor'dan
+        sonraki satirlari sayar; orada with_total=False kullanilmalidir.
+        """
+        pagination = next(
+            (s for s in specifications if isinstance(s, PaginationSpecification)), None
+        )
+
+        if not with_total:
+            query = select(self.model)
+            for spec in specifications:
+                query = spec.apply(query)
+            if pagination:
+                query = query.limit(pagination.page_size + 1)
+
+            result = await self.session.execute(query)
+            items = list(result.scalars().all())
+            has_more = pagination is not None and len(items) > pagination.page_size
+            if has_more:
+                items = items[: pagination.page_size]
+            return PageResult(items=items, total=None, has_more=has_more)
+
+        query = select(self.model, func.count().over().label("total_count"))
+        for spec in specifications:
+            query = spec.apply(query)
+
+        result = await self.session.execute(query)
+        rows = result.all()
+        items = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0].total_count
+        elif pagination and pagination.page > 1:
+            total = await self.count(*specifications)
+        else:
+            total = 0
+
+        seen = len(items)
+        if pagination:
+            seen += (pagination.page - 1) * pagination.page_size
+        return PageResult(items=items, total=total, has_more=seen < total)
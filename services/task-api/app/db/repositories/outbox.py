@@ -0,0 +1,95 @@
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.entities import OutboxEventEntity
+from app.models.events import TaskEvent
+
+from .base import BaseRepository
+
+# pg_try_advisory_xact_lock anahtari (tum relay'ler ayni kilidi paylasir)
+RELAY_LOCK_KEY = 0x6F7574626F78  # "outbox"
+
+
+class OutboxRepository(BaseRepository[OutboxEventEntity]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, OutboxEventEntity)
+
+    async def add_events(self, topic: str, events: list[TaskEvent]) -> None:
+        """
+        Event'leri outbox'a yazar (commit edilmez, cagiranin transaction'ina dahildir).
+        Tek bir executemany INSERT calistirilir; ID'ler geri okunmaz.
+        """
+        if not events:
+            return
+        await self.session.execute(
+            insert(OutboxEventEntity),
+            [{"topic": topic, "payload": event.to_dict()} for event in events],
+        )
+
+    async def try_lock_relay(self) -> bool:
+        """
+        Transaction sonuna kadar surecek relay kilidini almayi dener.
+
+        PostgreSQL'de pg_try_advisory_xact_lock kullanilir; kilit commit veya
+        rollback'te birakilir. Boylece ayni anda sadece bir worker'in relay'i
+        publish eder ve event sirasi korunur. Diger veritabanlarinda (SQLite,
+        tek process) her zaman True doner.
+
+        Returns:
+            bool: Kilit alindiysa True
+        """
+        if self.session.bind.dialect.name != "postgresql":
+            return True
+        return bool(await self.session.scalar(
+            select(func.pg_try_advisory_xact_lock(RELAY_LOCK_KEY))
+        ))
+
+    async def claim_batch(
+        self, limit: int, max_attempts: int
+    ) -> list[OutboxEventEntity]:
+        """
+        Park edilmemis en eski `limit` event'i kilitleyerek getirir.
+        max_attempts kez basarisiz olan event'ler (park edilmis) alinmaz.
+        Satirlar atlanmaz (SKIP LOCKED yok): kilitli bir satir varsa beklenir,
+        aksi halde sonraki event'ler oncekilerden once publish edilebilirdi.
+        """
+        query = (
+            select(OutboxEventEntity)
+            .where(OutboxEventEntity.attempts < max_attempts)
+            .order_by(OutboxEventEntity.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+    async def delete_ids(self, ids: list[int]) -> None:
+        """Publish edilen event'leri siler."""
+        await self.session.execute(
+            delete(OutboxEventEntity).where(OutboxEventEntity.id.in_(ids))
+        )
+
+    async def mark_failed(self, ids: list[int], error: str) -> None:
+        """Publish edilemeyen event'lerin deneme sayisini artirir."""
+        await self.session.execute(
+            update(OutboxEventEntity)
+            .where(OutboxEventEntity.id.in_(ids))
+            .values(attempts=OutboxEventEntity.attempts + 1, last_error=error[:1000])
+        )
+
+    async def backlog(self, max_attempts: int) -> dict[str, int]:
+        """
+        Outbox'taki event sayilari (tek sorgu).
+
+        Returns:
+            dict: pending (publish bekleyen) ve parked (max_attempts'a ulasmis)
+        """
+        parked = OutboxEventEntity.attempts >= max_attempts
+        result = await self.session.execute(
+            select(
+                func.count().filter(~parked).label("pending"),
+                func.count().filter(parked).label("parked"),
+            ).select_from(OutboxEventEntity)
+        )
+        row = result.one()
+        return {"pending": row.pending, "parked": row.parked}
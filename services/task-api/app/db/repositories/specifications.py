@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Generic, TypeVar
 
-from sqlalchemy import asc, desc, or_
+from sqlalchemy import asc, desc, tuple_
 from sqlalchemy.sql import Select
 
+from app.config import settings
+from app.db import search as task_search
 from app.db.entities.task import TaskEntity, TaskPriority, TaskStatus
 
 #Generic tip tanimi (hangi model ile calisacagimi temsil eder)
@@ -55,17 +58,38 @@ class TaskUserSpecification(Specification[TaskEntity]):
         return query.where(TaskEntity.user_id==self.user_id)
     
 class TaskSearchSpecification(Specification[TaskEntity]):
-    """Başlık veya açıklama içerisinde kelime bazlı arama yapar"""
-    def __init__(self,search: str):
-        self.search = f"%{search}%"
-    
+    """
+    Başlık veya açıklama içerisinde kelime bazlı arama yapar.
+
+    Veritabanina gore full-text search kullanir (bkz. app.db.search):
+    PostgreSQL'de tsvector + GIN, SQLite'ta FTS5. mode="trigram" ise
+    PostgreSQL'de pg_trgm benzerlik aramasi yapilir (diger veritabanlarinda
+    full-text'e duser). ranked=True ise sonuclar alakaya gore siralanir;
+    kendi siralamasi olan sayfalamada (keyset) ranked=False verilmelidir.
+    """
+    def __init__(
+        self,
+        search: str,
+        ranked: bool = True,
+        backend: task_search.SearchBackend | None = None,
+        mode: task_search.SearchMode | None = None,
+    ):
+        self.search = search
+        self.ranked = ranked
+        self.backend = backend or task_search.get_search_backend()
+        self.mode = mode or settings.search_mode
+        self.tokens = task_search.search_tokens(search)
+
     def apply(self, query: Select)-> Select:
-        return query.where(
-            or_(
-                TaskEntity.title.ilike(self.search),
-                TaskEntity.description.ilike(self.search)
-            )
-        )
+        if self.backend == "postgres" and self.mode == "trigram":
+            return task_search.apply_trigram(query, self.search, self.ranked)
+        # Kelime cikmayan ifadelerde (ornegin sadece noktalama) ILIKE'a dus
+        if self.backend == "like" or not self.tokens:
+            return task_search.apply_like(query, self.search)
+        if self.backend == "postgres":
+            return task_search.apply_postgres(query, self.tokens, self.ranked)
+        return task_search.apply_sqlite(query, self.tokens, self.ranked)
+
 class PaginationSpecification(Specification[TaskEntity]):
     """Veritabanı sonuçlarını sayfalara böler(offset ve limit mantığıyla)"""
     def __init__(self,page:int, page_size:int):
@@ -76,6 +100,28 @@ class PaginationSpecification(Specification[TaskEntity]):
         offset = (self.page -1) * self.page_size
         return query.offset(offset).limit(self.page_size)
 
+class KeysetPaginationSpecification(PaginationSpecification):
+    """
+    Cursor (keyset) tabanli sayfalama.
+
+    Sonuclar (created_at, id) ile yeniden eskiye siralanir ve bir onceki
+    sayfanin son satirindan (`after`) sonrasi getirilir. OFFSET gibi onceki
+    satirlari tarayip atmadigi icin derin sayfalar da ilk sayfa kadar ucuzdur.
+    PaginationSpecification'dan turedigi icin count() tarafindan yok sayilir.
+    """
+    def __init__(self, limit: int, after: tuple[datetime, int] | None = None):
+        super().__init__(page=1, page_size=limit)
+        self.after = after
+
+    def apply(self, query: Select) -> Select:
+        if self.after is not None:
+            created_at, task_id = self.after
+            key = tuple_(TaskEntity.created_at, TaskEntity.id)
+            query = query.where(key < tuple_(created_at, task_id))
+        return query.order_by(
+            TaskEntity.created_at.desc(), TaskEntity.id.desc()
+        ).limit(self.page_size)
+
 class OrderBySpecification(Specification[TaskEntity]):
     """Sonuçları belirli bir kolona göre artan veya azalan şekilde sıralar."""
     def __init__(self, field: str, descending: bool = False):
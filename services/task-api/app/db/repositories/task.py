@@ -1,7 +1,10 @@
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import case, delete, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.entities import TaskEntity
+from app.models.task import TaskStatus
 
 from .base import BaseRepository
 
@@ -15,4 +18,76 @@ class TaskRepository(BaseRepository[TaskEntity]):
         query = select(TaskEntity).where(TaskEntity.user_id == user_id)
         result = await self.session.execute(query)
 
-        return list(result.scalars().all())
\ No newline at end of file
+        return list(result.scalars().all())
+
+    async def get_statuses(
+        self, user_id: int, task_ids: list[int]
+    ) -> dict[int, TaskStatus]:
+        """Kullaniciya ait olan task'larin {id: status} eslemesini doner."""
+        query = select(TaskEntity.id, TaskEntity.status).where(
+            TaskEntity.user_id == user_id, TaskEntity.id.in_(task_ids)
+        )
+        result = await self.session.execute(query)
+        return {task_id: status for task_id, status in result.all()}
+
+    async def bulk_create(self, rows: list[dict[str, Any]]) -> list[TaskEntity]:
+        """
+        Task'lari tek bir cok satirli INSERT ... RETURNING ile olusturur.
+        Donen liste rows ile ayni siradadir.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            # PostgreSQL RETURNING sirasini garanti etmez; SQLAlchemy siralamayi
+            # tek INSERT icinde (sentinel kolonuyla) saglar
+            query = insert(TaskEntity).returning(
+                TaskEntity, sort_by_parameter_order=True
+            )
+            result = await self.session.scalars(query, rows)
+            return list(result.all())
+
+        # sort_by_parameter_order, SQLite'ta autoincrement PK ile satir satir
+        # INSERT'e duser. ID'ler VALUES sirasiyla verildigi icin RETURNING
+        # sonucunu ID'ye gore siralamak yeterlidir.
+        result = await self.session.scalars(
+            insert(TaskEntity).returning(TaskEntity), rows
+        )
+        return sorted(result.all(), key=lambda entity: entity.id)
+
+    async def bulk_update(
+        self, user_id: int, changes: dict[int, dict[str, Any]]
+    ) -> list[TaskEntity]:
+        """
+        Farkli alanlari degisen task'lari tek bir UPDATE ... RETURNING ile gunceller.
+
+        Her kolon CASE id WHEN ... ile yazilir; bir task'ta gonderilmeyen
+        alanlar eski degerinde kalir. Sadece user_id'ye ait task'lar guncellenir.
+
+        Args:
+            changes: {task_id: {alan: yeni deger}}
+        """
+        values = {}
+        for key in {key for fields in changes.values() for key in fields}:
+            column = getattr(TaskEntity, key)
+            whens = {
+                task_id: literal(fields[key], column.type)
+                for task_id, fields in changes.items() if key in fields
+            }
+            values[key] = case(whens, value=TaskEntity.id, else_=column)
+
+        where = (TaskEntity.user_id == user_id, TaskEntity.id.in_(changes))
+        if not values:
+            result = await self.session.scalars(select(TaskEntity).where(*where))
+            return list(result.all())
+
+        result = await self.session.scalars(
+            update(TaskEntity).where(*where).values(values).returning(TaskEntity)
+        )
+        return list(result.all())
+
+    async def bulk_delete(self, user_id: int, task_ids: list[int]) -> list[int]:
+        """user_id'ye ait task'lari tek bir DELETE ile siler, silinen ID'leri doner."""
+        result = await self.session.scalars(
+            delete(TaskEntity)
+            .where(TaskEntity.user_id == user_id, TaskEntity.id.in_(task_ids))
+            .returning(TaskEntity.id)
+        )
+        return list(result.all())
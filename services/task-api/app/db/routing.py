@@ -0,0 +1,89 @@
+"""
+Okuma trafiginin read replica'ya yonlendirilmesi.
+
+settings.database_replica_url tanimliysa TaskService'in salt okunur
+metotlari (get_all, get_page_after, get_by_id) replica'ya gider.
+Replica primary'nin gerisinde olabilecegi icin read-your-writes
+korunur: bir kullanici yazdiktan sonra settings.read_your_writes_seconds
+boyunca o kullanicinin okumalari primary'de kalir.
+
+Yazma isareti iki yerde tutulur:
+    - worker ici sozluk (Redis olmadan da calisir)
+    - Redis'te TTL'li bir key (diger uvicorn worker'lari da gorsun diye)
+Replica tanimli degilse isaret hic konmaz (okumalar zaten primary'de).
+
+Not: Pencere, replica'nin beklenen en buyuk gecikmesinden uzun olmalidir.
+"""
+
+import math
+import time
+
+from app.config import settings
+from app.core.cache import redis_cache
+from app.core.cache_keys import get_user_write_marker_key
+
+
+class ReadRouter:
+    """
+    Kullanici bazli read-your-writes takibi.
+
+    Args:
+        window_seconds: Yazmadan sonra okumalarin primary'de kalacagi sure
+        enabled: False ise yazmalar isaretlenmez (replica yokken Redis'e
+            gereksiz SET atilmasin diye)
+    """
+
+    # Sozluk bu boyutu asinca suresi dolmus kayitlar temizlenir
+    PRUNE_THRESHOLD = 10_000
+
+    def __init__(self, window_seconds: float | None = None, enabled: bool = True):
+        if window_seconds is None:
+            window_seconds = settings.read_your_writes_seconds
+        self.window_seconds = window_seconds
+        self.enabled = enabled
+        self._recent_writes: dict[int, float] = {}
+        self.primary_reads = 0
+        self.replica_reads = 0
+
+    async def mark_write(self, user_id: int) -> None:
+        """Kullanicinin yazdigini isaretler (commit sonrasi cagrilir)."""
+        if not self.enabled or self.window_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._recent_writes) >= self.PRUNE_THRESHOLD:
+            self._recent_writes = {
+                uid: until for uid, until in self._recent_writes.items() if until > now
+            }
+        self._recent_writes[user_id] = now + self.window_seconds
+        await redis_cache.set(
+            get_user_write_marker_key(user_id), 1, ttl=math.ceil(self.window_seconds)
+        )
+
+    async def use_primary(self, user_id: int) -> bool:
+        """Kullanici pencere icinde yazdiysa True (okuma primary'ye gitmeli)."""
+        until = self._recent_writes.get(user_id)
+        if until is not None:
+            if until > time.monotonic():
+                self.primary_reads += 1
+                return True
+            self._recent_writes.pop(user_id, None)
+
+        # Baska bir worker'da yapilan yazmalar
+        if await redis_cache.get(get_user_write_marker_key(user_id)):
+            self.primary_reads += 1
+            return True
+
+        self.replica_reads += 1
+        return False
+
+    def stats(self) -> dict:
+        """Primary/replica'ya yonlendirilen okuma sayilari."""
+        return {
+            "window_seconds": self.window_seconds,
+            "primary_reads": self.primary_reads,
+            "replica_reads": self.replica_reads,
+        }
+
+
+# Global Instance
+read_router = ReadRouter(enabled=bool(settings.database_replica_url))
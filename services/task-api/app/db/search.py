@@ -0,0 +1,231 @@
+"""
+Task'lar icin full-text search.
+
+ILIKE '%term%' index kullanamaz ve tablo buyudukce dogrusal yavaslar.
+Bu modul veritabanina gore index'li bir arama yolu secer:
+    - PostgreSQL: tasks.search_vector (generated tsvector kolonu) + GIN index,
+                  sonuclar ts_rank ile siralanir.
+    - SQLite    : tasks_fts FTS5 shadow tablosu (external content), trigger'larla
+                  tasks ile senkron tutulur; sonuclar bm25 (rank) ile siralanir.
+    - Digerleri : ILIKE'a geri duser.
+
+Backend settings.database_url'den otomatik secilir. Tablolar create_all ile
+olusturulurken gerekli DDL asagidaki event'lerle eklenir; mevcut veritabanlari
+icin bkz. alembic 8e3f2a61c7b9_add_task_full_text_search.
+
+Arama ifadesi kelimelere bolunur ve her kelime on ek (prefix) olarak aranir:
+"rep tes" -> "rep*" VE "tes*".
+
+Trigram modu (settings.search_mode="trigram", sadece PostgreSQL):
+Kelime parcalari ("voic") ve yazim hatalari ("reprot") tsvector lexeme'leriyle
+eslesmez. Bu modda pg_trgm'in word_similarity'si kullanilir; title ve
+description uzerindeki GIN trigram index'leri `<%` operatorunu hizlandirir.
+Esik settings.search_trigram_threshold'dur ve baglanti acilirken
+pg_trgm.word_similarity_threshold olarak ayarlanir (bkz. app.db.pool).
+pg_trgm extension'i, trigram index'leri ve esik ayarlari sadece bu modda
+uygulanir; fulltext modunda CREATE EXTENSION yetkisi gerekmez.
+"""
+
+import re
+from typing import Literal
+
+from sqlalchemy import (
+    DDL,
+    Select,
+    String,
+    column,
+    event,
+    func,
+    literal,
+    literal_column,
+    or_,
+    table,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.config import settings
+from app.db.entities.task import TaskEntity
+
+SearchBackend = Literal["postgres", "sqlite", "like"]
+SearchMode = Literal["fulltext", "trigram"]
+
+# Dil bagimsiz (stemming yok); generated kolon ile ayni olmali
+TS_CONFIG = "simple"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_search_vector = literal_column("tasks.search_vector", TSVECTOR)
+_tasks_fts = table("tasks_fts", column("rowid"), column("tasks_fts"), column("rank"))
+
+
+def get_search_backend(database_url: str | None = None) -> SearchBackend:
+    """
+    database_url'e gore arama backend'ini secer.
+
+    Ornek: get_search_backend("postgresql+asyncpg://...") -> "postgres"
+    """
+    url = database_url or settings.database_url
+    if url.startswith("postgresql"):
+        return "postgres"
+    if url.startswith("sqlite"):
+        return "sqlite"
+    return "like"
+
+
+def search_tokens(term: str) -> list[str]:
+    """Arama ifadesini kelimelere boler; FTS operatorleri (", *, -, :) atilir."""
+    return _TOKEN_RE.findall(term.lower())
+
+
+def apply_like(query: Select, term: str) -> Select:
+    """Index'siz ILIKE aramasi (eski davranis)."""
+    pattern = f"%{term}%"
+    return query.where(
+        or_(TaskEntity.title.ilike(pattern), TaskEntity.description.ilike(pattern))
+    )
+
+
+def apply_postgres(query: Select, tokens: list[str], ranked: bool) -> Select:
+    """search_vector @@ to_tsquery ile arar, ranked ise ts_rank'e gore siralar."""
+    ts_query = func.to_tsquery(TS_CONFIG, " & ".join(f"{token}:*" for token in tokens))
+    query = query.where(_search_vector.bool_op("@@")(ts_query))
+    if ranked:
+        query = query.order_by(func.ts_rank(_search_vector, ts_query).desc())
+    return query
+
+
+def apply_trigram(query: Select, term: str, ranked: bool) -> Select:
+    """
+    pg_trgm ile benzerlik aramasi yapar, ranked ise benzerlige gore siralar.
+
+    `term <% kolon`, word_similarity(term, kolon) esigi astiginda dogrudur
+    ve GIN trigram index'ini kullanir.
+    """
+    pattern = literal(term, String)
+    query = query.where(
+        or_(
+            pattern.op("<%")(TaskEntity.title),
+            pattern.op("<%")(TaskEntity.description),
+        )
+    )
+    if ranked:
+        score = func.greatest(
+            func.word_similarity(pattern, TaskEntity.title),
+            func.word_similarity(pattern, func.coalesce(TaskEntity.description, "")),
+        )
+        query = query.order_by(score.desc())
+    return query
+
+
+def apply_sqlite(query: Select, tokens: list[str], ranked: bool) -> Select:
+    """tasks_fts ile join edip MATCH ile arar, ranked ise bm25'e gore siralar."""
+    fts_query = " ".join(f'"{token}"*' for token in tokens)
+    query = query.join(_tasks_fts, _tasks_fts.c.rowid == TaskEntity.id).where(
+        _tasks_fts.c.tasks_fts.match(fts_query)
+    )
+    if ranked:
+        # FTS5 rank kolonu bm25 skorudur; kucuk olan daha alakali
+        query = query.order_by(_tasks_fts.c.rank)
+    return query
+
+
+def get_connect_args(database_url: str | None = None) -> dict:
+    """
+    Engine icin arama ile ilgili connect_args.
+
+    asyncpg'de trigram modunda esik her baglantida server_settings ile ayarlanir.
+    """
+    url = database_url or settings.database_url
+    if not url.startswith("postgresql+asyncpg"):
+        return {}
+    if settings.search_mode != "trigram":
+        return {}
+    threshold = str(settings.search_trigram_threshold)
+    return {
+        "server_settings": {
+            "pg_trgm.similarity_threshold": threshold,
+            "pg_trgm.word_similarity_threshold": threshold,
+        }
+    }
+
+
+# ----- DDL (create_all icin) ----- #
+
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content='tasks', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+    AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+POSTGRES_FTS_DDL = [
+    f"""
+    ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector "
+    "ON tasks USING gin (search_vector)",
+]
+
+# Sadece trigram modunda (create_all aninda settings.search_mode'a bakilir)
+POSTGRES_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm "
+    "ON tasks USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_description_trgm "
+    "ON tasks USING gin (description gin_trgm_ops)",
+]
+
+
+def _trigram_mode(ddl, target, bind, **kw) -> bool:
+    return settings.search_mode == "trigram"
+
+
+for _statement in SQLITE_FTS_DDL:
+    event.listen(
+        TaskEntity.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+for _statement in POSTGRES_FTS_DDL:
+    event.listen(
+        TaskEntity.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+for _statement in POSTGRES_TRIGRAM_DDL:
+    event.listen(
+        TaskEntity.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql", callable_=_trigram_mode),
+    )
+event.listen(
+    TaskEntity.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"),
+)
@@ -1,11 +1,55 @@
 from abc import ABC
 from typing import Self
 
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.db.repositories.outbox import OutboxRepository
 from app.db.repositories.task import TaskRepository
 from app.db.repositories.user import UserRepository
 from app.core.resilience import with_db_retry
+from app.core.user_cache import invalidate_cached_user
+from app.db.entities import UserEntity
+
+CHANGED_USER_IDS = "changed_user_ids"
+WRITTEN_OBJECTS = "written_objects"
+
+
+@event.listens_for(Session, "after_flush")
+def _track_changed_users(session: Session, flush_context) -> None:
+    """
+    Flush edilen (guncellenen/silinen) kullanicilarin ID'lerini session.info'ya yazar.
+    Commit sonrasi bu kullanicilar user cache'ten dusurulur.
+    """
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, UserEntity):
+            session.info.setdefault(CHANGED_USER_IDS, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_written_objects(session: Session, flush_context) -> None:
+    """
+    Flush ile eklenen/guncellenen nesneleri session.info'ya yazar.
+    Commit sonrasi sadece bu nesnelerin eksik (expired) alanlari yuklenir.
+    """
+    written = session.info.setdefault(WRITTEN_OBJECTS, {})
+    for obj in (*session.new, *session.dirty):
+        written[id(obj)] = obj
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_tracked_writes(session: Session, previous_transaction) -> None:
+    """
+    Rollback'te izlenen kullanici ve nesneleri temizler.
+    Geri alinan flush'lar sonraki commit'te cache'i dusurmemeli ve refresh edilmemeli.
+    Savepoint rollback'inde dis transaction'in yazdiklari korunur.
+    """
+    if previous_transaction.nested:
+        return
+    session.info.pop(CHANGED_USER_IDS, None)
+    session.info.pop(WRITTEN_OBJECTS, None)
+
 
 class BaseUnitOfWork(ABC):
     """
@@ -21,6 +65,10 @@ class BaseUnitOfWork(ABC):
         await self.session.commit()
         pass
     
+    async def flush(self):
+        """Bekleyen degisiklikleri commit etmeden veritabanina yazar (ID'ler olusur)."""
+        await self.session.flush()
+
     async def rollback(self):
         """Hata Durumunda yapilan degisiklikleri geri alir."""
         await self.session.rollback()
@@ -46,18 +94,33 @@ class TaskUnitOfWork(BaseUnitOfWork):
         super().__init__(session)
         self.tasks = TaskRepository(session)
         self.users = UserRepository(session)
+        self.outbox = OutboxRepository(session)
     
     @with_db_retry
     async def commit(self):
         """
-        Degisiklikleri kaydeder ve veritabanindan gelen guncel bilgileri(ID vb.)
-        nesnelere geri yukler(refresh).
+        Degisiklikleri kaydeder.
+        Degisen veya silinen kullanicilari user cache'ten duser.
+
+        Sunucuda uretilen degerler (ID, updated_at vb.) INSERT/UPDATE'in
+        RETURNING'i ile gelir (bkz. TimestampMixin eager_defaults). Sadece
+        bu commit'te yazilan ve hala expired alani kalan nesneler, sadece o
+        alanlar icin refresh edilir; degismeyen yuklu nesnelere dokunulmaz.
         """
         await super().commit()
-        
-        for obj in self.session.identity_map.values():
-            try:
-                await self.session.refresh(obj)
-            except Exception:
-                #Bazi nesneler(silinenler vs.) refresh edilemez onlari atlamaliyiz.
-                continue
\ No newline at end of file
+
+        for user_id in self.session.info.pop(CHANGED_USER_IDS, set()):
+            await invalidate_cached_user(user_id)
+
+        for obj in self.session.info.pop(WRITTEN_OBJECTS, {}).values():
+            state = inspect(obj)
+            if (
+                state.transient
+                or state.deleted
+                or state.detached
+                or not state.expired_attributes
+            ):
+                continue
+            await self.session.refresh(
+                obj, attribute_names=list(state.expired_attributes)
+            )
\ No newline at end of file
@@ -6,14 +6,21 @@ from app.api.v1.auth import auth_router as auth_router
 from app.api.v1.tasks import tasks_router as tasks_router
 from app.config import settings
 from app.core.cache import redis_cache
+from app.core.tiered_cache import tiered_cache
+from app.core.user_cache import user_cache
 from app.core.exceptions import AppException
 from app.core.handlers import app_exception_handler, generic_exception_handler
 from app.core.logging import get_logger, setup_logging
 from app.core.middleware import RateLimitMiddleware
+from app.core.rate_limiter import rate_limiter
+from app.core.security import shutdown_password_executor
 from app.api.v1.health import router as health_router
 from app.core.correlation import CorrelationIdMiddleware
+from app.core.query_counter import QueryCountMiddleware
 from app.core.messaging import rabbitmq_client
 from app.core.dapr_client import dapr_client
+from app.core.dapr_pubsub import dapr_pubsub
+from app.core.outbox import outbox_relay
 
 setup_logging()
 
@@ -24,16 +31,26 @@ logger.info("Starting my little tiny app...(finally i made it)")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await redis_cache.connect()
+    await tiered_cache.start()
+    await user_cache.start()
+    await rate_limiter.start()
     await rabbitmq_client.connect()
+    await outbox_relay.start()
     logger.info("Database tables created")
 
     yield
 
     #Shutdown
     logger.info("Shutting down application...")
+    await outbox_relay.stop()
+    await dapr_pubsub.close()
     await dapr_client.close()  # YENİ
     await rabbitmq_client.disconnect()
+    await rate_limiter.stop()
+    await user_cache.stop()
+    await tiered_cache.stop()
     await redis_cache.disconnect()
+    shutdown_password_executor()
 
 app = FastAPI(
     title=settings.app_name,
@@ -43,6 +60,7 @@ app = FastAPI(
 )
 
 # ------- MIDDLEWARE KAYDI BASLATILIYOR... -------- #
+app.add_middleware(QueryCountMiddleware)
 app.add_middleware(CorrelationIdMiddleware)
 app.add_middleware(RateLimitMiddleware)
 
@@ -24,7 +24,11 @@ class PaginationParams(BaseModel):
 class PaginatedResponse(BaseModel, Generic[T]):
     """Sayfalama icin response modeli """
     items: list[T]
-    total: int
+    # include_total=false istendiginde toplam hesaplanmaz (None)
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    has_more: bool = False
+    # Sadece cursor modunda dolu; son sayfada None
+    next_cursor: str | None = None
@@ -2,10 +2,11 @@
 Event veri modelleri.
 Task event'lerinin tip ver veri yapilarini tamamlar.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
+from uuid import uuid4
 
 class TaskEventType(str, Enum):
     """
@@ -38,6 +39,9 @@ class TaskEvent:
         timestamp: Event zamani
         correlation_id: Request tracing ID
         data: Task verisi (opsiyonel olucak)
+        event_id: Event'in benzersiz ID'si. Olusturulurken bir kez uretilir ve
+            outbox payload'inda saklanir; relay retry'lari ve broker tekrar
+            teslimleri ayni ID'yi tasir, consumer'lar duplicate'i buna gore atlar.
     """
     event_type: TaskEventType
     task_id: int
@@ -45,6 +49,7 @@ class TaskEvent:
     timestamp: datetime
     correlation_id: str | None = None
     data: dict[str, Any] |None = None
+    event_id: str = field(default_factory=lambda: str(uuid4()))
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -54,6 +59,7 @@ class TaskEvent:
             dict: Serialize edilmis event
         """
         return{
+            "event_id": self.event_id,
             "event_type": self.event_type.value,
             "task_id":self.task_id,
             "user_id":self.user_id,
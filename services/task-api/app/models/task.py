@@ -1,7 +1,9 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.config import settings
 
 
 class TaskStatus(str, Enum):
@@ -49,4 +51,47 @@ class TaskFilter(BaseModel):
     """Task Filtreleme parametreleri"""
     status: TaskStatus | None = None
     priority: TaskPriority | None = None
-    search: str | None = None
\ No newline at end of file
+    search: str | None = None
+
+
+def _unique_ids(ids: list[int]) -> list[int]:
+    if len(set(ids)) != len(ids):
+        raise ValueError("Duplicate task ids")
+    return ids
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    """Toplu guncellemede tek task; sadece gonderilen alanlar degisir."""
+    id: int
+
+
+class TaskBulkCreate(BaseModel):
+    """POST /tasks/bulk govdesi"""
+    tasks: list[TaskCreate] = Field(
+        ..., min_length=1, max_length=settings.task_bulk_max_items
+    )
+
+
+class TaskBulkUpdate(BaseModel):
+    """PUT /tasks/bulk govdesi"""
+    tasks: list[TaskBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=settings.task_bulk_max_items
+    )
+
+    @field_validator("tasks")
+    @classmethod
+    def unique_task_ids(
+        cls, tasks: list[TaskBulkUpdateItem]
+    ) -> list[TaskBulkUpdateItem]:
+        _unique_ids([task.id for task in tasks])
+        return tasks
+
+
+class TaskBulkDelete(BaseModel):
+    """DELETE /tasks/bulk govdesi"""
+    ids: list[int] = Field(..., min_length=1, max_length=settings.task_bulk_max_items)
+
+    @field_validator("ids")
+    @classmethod
+    def unique_ids(cls, ids: list[int]) -> list[int]:
+        return _unique_ids(ids)
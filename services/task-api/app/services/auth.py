@@ -16,8 +16,8 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from app.db.entities import UserEntity
 from app.db.unit_of_work import TaskUnitOfWork
@@ -47,6 +47,7 @@ class AuthService:
             UserResponse: Kaydedilen kullanicinin bilgilerini iceren nesne.
         Raises:
             UserAlreadyExistsException: E-posta adresi zaten sistemde kayitliysa.
+            BulkheadFullError: Sifre hash pool'u doluysa (503).
         """
         logger.info(f"Registering user:{user_in.email}")
 
@@ -55,7 +56,7 @@ class AuthService:
         if existing_user:
             raise UserAlreadyExistException(email=user_in.email)
 
-        hashed_password = hash_password(user_in.password)
+        hashed_password = await hash_password_async(user_in.password)
         new_user = UserEntity(
             email=user_in.email,
             hashed_password=hashed_password,
@@ -79,6 +80,7 @@ class AuthService:
         :rtype: UserResponse
         raises:
             InvalidCredentialsException: Email Bulunamazsa veya sifre yanlissa.
+            BulkheadFullError: Sifre hash pool'u doluysa (503).
         """
         logger.info(f"Login attempt:{user_in.email}")
 
@@ -88,7 +90,7 @@ class AuthService:
             raise InvalidCredentialsException()
 
         # sifreyi dogrula
-        if not verify_password(user_in.password, user.hashed_password):
+        if not await verify_password_async(user_in.password, user.hashed_password):
             raise InvalidCredentialsException()
 
         return TokenResponse(
@@ -1,18 +1,24 @@
 
 # --- CACHE IMPORTLARI ---
 from asyncio import create_task
-from app.core.cache import redis_cache
+from app.core.tiered_cache import tiered_cache
 from app.core.cache_keys import (
+    get_task_cursor_cache_key,
     get_task_detail_cache_key,
     get_task_list_cache_key,
-    get_task_user_pattern,
+    get_task_user_version_key,
 )
+from app.core.cursor import decode_cursor, encode_cursor
 from app.core.events import task_event_publisher
+from app.core.outbox import outbox_relay
+from app.models.events import TaskEventType
 from app.models.task import TaskStatus
 from app.core.exceptions import TaskNotFoundException
 from app.core.logging import get_logger
 from app.db.entities import TaskEntity
+from app.db.routing import read_router
 from app.db.repositories.specifications import (
+    KeysetPaginationSpecification,
     PaginationSpecification,
     Specification,
     TaskPrioritySpecification,
@@ -24,14 +30,70 @@ from app.db.repositories.specifications import (
 #--- UNIT OF PATTERN IMPORTLARI
 from app.db.unit_of_work import TaskUnitOfWork
 from app.models.common import PaginationParams
-from app.models.task import TaskCreate, TaskFilter, TaskResponse, TaskUpdate
+from app.models.task import (
+    TaskBulkUpdateItem,
+    TaskCreate,
+    TaskFilter,
+    TaskResponse,
+    TaskUpdate,
+)
 
 logger = get_logger(__name__)
 
 
 class TaskService:
-    def __init__(self, uow: TaskUnitOfWork):
+    def __init__(self, uow: TaskUnitOfWork, read_uow: TaskUnitOfWork | None = None):
         self.uow = uow
+        # Read replica (opsiyonel); None ise tum okumalar primary'den yapilir
+        self.read_uow = read_uow
+
+    async def _reader(self, user_id: int) -> TaskUnitOfWork:
+        """
+        Salt okunur sorgular icin unit of work secer.
+        Kullanici yakin zamanda yazdiysa (read-your-writes) primary kullanilir.
+        """
+        if self.read_uow is None or await read_router.use_primary(user_id):
+            return self.uow
+        return self.read_uow
+
+    async def _get_cache_version(self, user_id: int) -> int:
+        """Kullanicinin guncel cache versiyonunu doner (key'lere eklenir)."""
+        return await tiered_cache.get_version(get_task_user_version_key(user_id))
+
+    async def _invalidate_user_cache(self, user_id: int) -> None:
+        """
+        Kullanicinin tum task cache'ini gecersiz kilar.
+        Versiyonu tek bir INCR ile artirir; eski key'ler TTL ile silinir.
+        """
+        await tiered_cache.incr(get_task_user_version_key(user_id))
+
+    async def _commit_write(self, user_id: int) -> None:
+        """
+        Task degisikligini ve outbox event'lerini tek transaction'da commit eder.
+        Ardindan read-your-writes isaretini koyar, cache'i gecersiz kilar ve
+        outbox relay'i uyandirir (publish istegi beklemez).
+        """
+        await self.uow.commit()
+        await read_router.mark_write(user_id)
+        await self._invalidate_user_cache(user_id)
+        outbox_relay.notify()
+
+    def _build_filter_specs(
+            self, user_id: int, filters: TaskFilter | None, ranked: bool = True
+    ) -> list[Specification]:
+        """
+        Kullanici ve filtre specification'larini olusturur.
+        ranked=False ise arama sonuclari alakaya gore siralanmaz (keyset icin).
+        """
+        specs: list[Specification] = [TaskUserSpecification(user_id)]
+        if filters:
+            if filters.status:
+                specs.append(TaskStatusSpecification(filters.status))
+            if filters.priority:
+                specs.append(TaskPrioritySpecification(filters.priority))
+            if filters.search:
+                specs.append(TaskSearchSpecification(filters.search, ranked=ranked))
+        return specs
 
     async def create(self, task_in: TaskCreate, user_id: int) -> TaskResponse:
         """Yeni task olusturur ve user_id'yi otomatik atar"""
@@ -39,17 +101,18 @@ class TaskService:
         # pydantic modeli veritabani nesnesine donusturdugumuz asama
         new_task = TaskEntity(**task_in.model_dump(), user_id=user_id)
         created_task = await self.uow.tasks.create(new_task)
-        await self.uow.commit()
-        # ---CACHE INVALIDATION---
-        await redis_cache.delete_pattern(get_task_user_pattern(user_id))
+        # ID olussun diye flush; event task ile ayni transaction'da outbox'a yazilir
+        await self.uow.flush()
 
-        # Event publish
+        # Event publish (outbox)
         task_response= TaskResponse.model_validate(created_task)
         await task_event_publisher.publish_task_created(
+            self.uow.outbox,
             task_id=created_task.id,
             user_id=user_id,
             task_data= task_response.model_dump(mode='json')
         )
+        await self._commit_write(user_id)
 
         return task_response
 
@@ -57,9 +120,18 @@ class TaskService:
             self,
               user_id: int,
               filters:TaskFilter,
-              pagination:PaginationParams | None = None
-              ) -> tuple[list[TaskResponse],int]:
-        """Sadece kullaniciya ait filtrelenmis ve sayfalanmis tasklari(cache'li) getirir."""
+              pagination:PaginationParams | None = None,
+              with_total: bool = True
+              ) -> tuple[list[TaskResponse], int | None, bool]:
+        """
+        Sadece kullaniciya ait filtrelenmis ve sayfalanmis tasklari(cache'li) getirir.
+
+        Sayfa ve toplam sayi tek sorguda gelir (bkz. BaseRepository.find_page).
+        with_total=False ise toplam hesaplanmaz (None doner), sadece has_more doner.
+
+        Returns:
+            (tasklar, toplam, has_more)
+        """
         logger.info(f"Fetching All Tasks for user {user_id}")
 
         # ---Cache KEY olusturalim.
@@ -68,46 +140,104 @@ class TaskService:
             status=filters.status.value if filters.status else None,
             priority=filters.priority.value if filters.priority else None,
             search=filters.search,
-            page=pagination.page if pagination else 1
+            page=pagination.page if pagination else 1,
+            version=await self._get_cache_version(user_id),
+            with_total=with_total
         )
 
         # --- CACHE'den denetelim
-        cached_data = await redis_cache.get(cache_key)
+        cached_data = await tiered_cache.get(cache_key)
         if cached_data:
             logger.debug(f"Cache HIT for key:{cache_key}")
             items= [TaskResponse.model_validate(item) for item in cached_data["items"]]
-            return items, cached_data["total"]
+            return items, cached_data["total"], cached_data["has_more"]
         logger.debug(f"Cache MISS for key: {cache_key}")
 
         # --- DB'DEN CEK
-        specs:list[Specification] = [TaskUserSpecification(user_id)]
-        
-        if filters:
-            if filters.status:
-                specs.append(TaskStatusSpecification(filters.status))
-            if filters.priority:
-                specs.append(TaskPrioritySpecification(filters.priority))
-            if filters.search:
-                specs.append(TaskSearchSpecification(filters.search))
-        
-        #toplam sayiyi aliyoruz.
-        total = await self.uow.tasks.count(*specs)
+        specs = self._build_filter_specs(user_id, filters)
 
         if pagination:
             specs.append(PaginationSpecification(pagination.page, pagination.page_size))
-        
-        entities = await self.uow.tasks.find(*specs)
 
-        task_responses = [TaskResponse.model_validate(e) for e in entities]
+        # Satirlar ve toplam sayi tek sorguda
+        reader = await self._reader(user_id)
+        page = await reader.tasks.find_page(*specs, with_total=with_total)
+
+        task_responses = [TaskResponse.model_validate(e) for e in page.items]
 
         #---cache'e kaydedelim.
         cached_data = {
             "items": [t.model_dump() for t in task_responses],  # ✅ Mevcut listeyi kullan
-            "total": total
+            "total": page.total,
+            "has_more": page.has_more
         }
-        await redis_cache.set(cache_key,cached_data)
+        await tiered_cache.set(cache_key,cached_data)
 
-        return task_responses, total
+        return task_responses, page.total, page.has_more
+
+    async def get_page_after(
+            self,
+            user_id: int,
+            filters: TaskFilter,
+            cursor: str | None = None,
+            page_size: int = 10,
+            with_total: bool = True
+    ) -> tuple[list[TaskResponse], int | None, str | None]:
+        """
+        Kullanicinin tasklarini cursor (keyset) ile sayfalayarak getirir (cache'li).
+
+        Siralama created_at ve id'ye gore yeniden eskiyedir. OFFSET kullanilmadigi
+        icin derin sayfalar da ilk sayfa kadar ucuzdur.
+
+        Args:
+            cursor: Bir onceki cevaptaki next_cursor; None ise ilk sayfa
+            page_size: Sayfa basina kayit
+            with_total: False ise toplam sayi hic hesaplanmaz (None doner)
+        Returns:
+            (tasklar, toplam, next_cursor). Son sayfada next_cursor None'dir.
+        Raises:
+            TaskBadRequestException: Cursor gecersizse (400).
+        """
+        logger.info(f"Fetching tasks after cursor for user {user_id}")
+        after = decode_cursor(cursor) if cursor else None
+
+        cache_key = get_task_cursor_cache_key(
+            user_id=user_id,
+            status=filters.status.value if filters.status else None,
+            priority=filters.priority.value if filters.priority else None,
+            search=filters.search,
+            cursor=cursor,
+            page_size=page_size,
+            version=await self._get_cache_version(user_id),
+            with_total=with_total
+        )
+        cached_data = await tiered_cache.get(cache_key)
+        if cached_data:
+            logger.debug(f"Cache HIT for key:{cache_key}")
+            items = [TaskResponse.model_validate(item) for item in cached_data["items"]]
+            return items, cached_data["total"], cached_data["next_cursor"]
+        logger.debug(f"Cache MISS for key: {cache_key}")
+
+        # Keyset (created_at, id) siralamasi arama alakasiyla karistirilmamali
+        specs = self._build_filter_specs(user_id, filters, ranked=False)
+        # COUNT(*) OVER() cursor'dan sonrasini sayacagi icin toplam ayri sorgulanir
+        reader = await self._reader(user_id)
+        total = await reader.tasks.count(*specs) if with_total else None
+
+        page = await reader.tasks.find_page(
+            *specs, KeysetPaginationSpecification(page_size, after), with_total=False
+        )
+        last = page.items[-1] if page.items else None
+        next_cursor = encode_cursor(last.created_at, last.id) if page.has_more else None
+
+        task_responses = [TaskResponse.model_validate(e) for e in page.items]
+        await tiered_cache.set(cache_key, {
+            "items": [t.model_dump() for t in task_responses],
+            "total": total,
+            "next_cursor": next_cursor,
+        })
+
+        return task_responses, total, next_cursor
 
     async def get_by_id(self, task_id: int, user_id: int) -> TaskResponse:
         """Sadece kullanicinin kendisine ait belirli bir taski getirir"""
@@ -116,15 +246,17 @@ class TaskService:
         #1-Cache key olusturalim
         cache_key = get_task_detail_cache_key(
             user_id=user_id,
-            task_id=task_id
+            task_id=task_id,
+            version=await self._get_cache_version(user_id)
         )
         #2-Cache den getirmeyi deneyelim once
-        cached_data = await redis_cache.get(cache_key)
+        cached_data = await tiered_cache.get(cache_key)
         if cached_data:
             logger.debug(f"Cache HIT for task {task_id}")
             return TaskResponse.model_validate(cached_data)
         #3-DB'DEN CEKELIM.
-        entity = await self.uow.tasks.get_by_id(task_id)
+        reader = await self._reader(user_id)
+        entity = await reader.tasks.get_by_id(task_id)
 
         if not entity:
             raise TaskNotFoundException(task_id=task_id)
@@ -135,7 +267,7 @@ class TaskService:
             raise TaskNotFoundException(task_id=task_id)
         
         valid_data = TaskResponse.model_validate(entity).model_dump()
-        await redis_cache.set(cache_key,valid_data)
+        await tiered_cache.set(cache_key,valid_data)
 
         return TaskResponse.model_validate(entity)
 
@@ -160,12 +292,12 @@ class TaskService:
             setattr(entity, key, value)
 
         updated_entity = await self.uow.tasks.update(entity)
-        await self.uow.commit()
-        await redis_cache.delete_pattern(get_task_user_pattern(user_id))
+        await self.uow.flush()
 
-        #Event Publish
+        #Event Publish (outbox)
         task_response= TaskResponse.model_validate(updated_entity)
         await task_event_publisher.publish_task_updated(
+            self.uow.outbox,
             task_id=updated_entity.id,
             user_id=user_id,
             task_data=task_response.model_dump(mode='json')
@@ -173,10 +305,12 @@ class TaskService:
         # Eger status completed'a cekildiyse ekstra event
         if old_status != TaskStatus.COMPLETED and updated_entity.status == TaskStatus.COMPLETED:
             await task_event_publisher.publish_task_completed(
+                self.uow.outbox,
                 task_id=updated_entity.id,
                 user_id=user_id,
                 task_data=task_response.model_dump(mode='json')
             )
+        await self._commit_write(user_id)
 
         return task_response
 
@@ -193,11 +327,103 @@ class TaskService:
             raise TaskNotFoundException(task_id=task_id)
 
         await self.uow.tasks.delete(entity)
-        await self.uow.commit()
-        await redis_cache.delete_pattern(get_task_user_pattern(user_id))
 
-        # Event Publish
+        # Event Publish (outbox)
         await task_event_publisher.publish_task_deleted(
+            self.uow.outbox,
             task_id=task_id,
             user_id=user_id
-        )
\ No newline at end of file
+        )
+        await self._commit_write(user_id)
+
+    # --- BULK ISLEMLER ---
+    # Her biri tek SQL ifadesi + tek commit calistirir; cache bir kez
+    # gecersiz kilinir ve event'ler tek INSERT ile outbox'a yazilir.
+    # Islemler ya hep ya hic: bir task bulunamazsa hicbiri uygulanmaz.
+
+    async def bulk_create(
+            self, tasks_in: list[TaskCreate], user_id: int
+    ) -> list[TaskResponse]:
+        """Birden fazla task'i tek INSERT ile olusturur."""
+        logger.info(f"Bulk creating {len(tasks_in)} tasks for user {user_id}")
+        created = await self.uow.tasks.bulk_create(
+            [{**task_in.model_dump(), "user_id": user_id} for task_in in tasks_in]
+        )
+        task_responses = [TaskResponse.model_validate(entity) for entity in created]
+        await task_event_publisher.publish_many(self.uow.outbox, [
+            task_event_publisher.build_event(
+                TaskEventType.CREATED, task.id, user_id, task.model_dump(mode='json')
+            )
+            for task in task_responses
+        ])
+        await self._commit_write(user_id)
+        return task_responses
+
+    async def bulk_update(
+        self, tasks_in: list[TaskBulkUpdateItem], user_id: int
+    ) -> list[TaskResponse]:
+        """
+        Birden fazla task'i tek UPDATE ile gunceller.
+
+        Raises:
+            TaskNotFoundException: Task'lardan biri yoksa veya kullaniciya ait degilse.
+        """
+        logger.info(f"Bulk updating {len(tasks_in)} tasks for user {user_id}")
+        changes = {
+            task_in.id: task_in.model_dump(exclude_unset=True, exclude={"id"})
+            for task_in in tasks_in
+        }
+
+        # Sahiplik kontrolu ve completed event'i icin eski status'ler
+        old_statuses = await self.uow.tasks.get_statuses(user_id, list(changes))
+        for task_id in changes:
+            if task_id not in old_statuses:
+                raise TaskNotFoundException(task_id=task_id)
+
+        updated = await self.uow.tasks.bulk_update(user_id, changes)
+
+        # Kontrol ile UPDATE arasinda silinen task'lar RETURNING'de gelmez
+        by_id = {entity.id: TaskResponse.model_validate(entity) for entity in updated}
+        missing = [task_id for task_id in changes if task_id not in by_id]
+        if missing:
+            await self.uow.rollback()
+            raise TaskNotFoundException(task_id=missing[0])
+        task_responses = [by_id[task_id] for task_id in changes]
+
+        events = []
+        for task in task_responses:
+            task_data = task.model_dump(mode='json')
+            events.append(task_event_publisher.build_event(
+                TaskEventType.UPDATED, task.id, user_id, task_data
+            ))
+            completed = task.status == TaskStatus.COMPLETED
+            if completed and old_statuses[task.id] != TaskStatus.COMPLETED:
+                events.append(task_event_publisher.build_event(
+                    TaskEventType.COMPLETED, task.id, user_id, task_data
+                ))
+        await task_event_publisher.publish_many(self.uow.outbox, events)
+        await self._commit_write(user_id)
+
+        return task_responses
+
+    async def bulk_delete(self, task_ids: list[int], user_id: int) -> list[int]:
+        """
+        Birden fazla task'i tek DELETE ile siler.
+
+        Raises:
+            TaskNotFoundException: Task'lardan biri yoksa veya kullaniciya ait degilse.
+        """
+        logger.info(f"Bulk deleting {len(task_ids)} tasks for user {user_id}")
+        deleted = set(await self.uow.tasks.bulk_delete(user_id, task_ids))
+
+        missing = [task_id for task_id in task_ids if task_id not in deleted]
+        if missing:
+            await self.uow.rollback()
+            raise TaskNotFoundException(task_id=missing[0])
+
+        await task_event_publisher.publish_many(self.uow.outbox, [
+            task_event_publisher.build_event(TaskEventType.DELETED, task_id, user_id)
+            for task_id in task_ids
+        ])
+        await self._commit_write(user_id)
+        return task_ids
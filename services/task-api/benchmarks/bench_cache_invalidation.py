@@ -0,0 +1,108 @@
+"""
+Cache invalidation benchmark'i.
+
+Eski yontem (KEYS tasks:user:{id}:* + DEL) ile yeni yontemi
+(versiyon sayacina tek INCR) farkli keyspace boyutlarinda karsilastirir.
+KEYS tum keyspace'i taradigi icin maliyeti key sayisiyla dogru orantili
+buyur; INCR ise keyspace boyutundan bagimsizdir.
+
+Kullanim (task-api klasorunden, calisan bir Redis ile):
+    python -m benchmarks.bench_cache_invalidation
+    python -m benchmarks.bench_cache_invalidation --sizes 10000 100000 --repeat 5
+    # Redis olmadan duman testi
+    python -m benchmarks.bench_cache_invalidation --fake --sizes 10000
+
+UYARI: Hedef Redis veritabani (settings.redis_db) FLUSHDB ile temizlenir.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.cache import redis_cache
+from app.core.cache_keys import (
+    get_task_detail_cache_key,
+    get_task_user_pattern,
+    get_task_user_version_key,
+)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+USER_ID = 1
+USER_KEYS = 20  # Yazan kullanicinin cache'teki key sayisi
+
+
+async def populate(size: int) -> None:
+    """Keyspace'i `size` adet dolgu key'i ile doldurur."""
+    redis = redis_cache.redis
+    await redis.flushdb()
+    try:
+        # Gercek Redis'te en hizli yol (key:0..key:N-1)
+        await redis.execute_command("DEBUG", "POPULATE", size, "filler")
+    except Exception:
+        pipe = redis.pipeline(transaction=False)
+        for i in range(size):
+            pipe.set(f"filler:{i}", "x")
+            if i % 10_000 == 0:
+                await pipe.execute()
+        await pipe.execute()
+
+
+async def seed_user_keys() -> None:
+    """Yazan kullanici icin detay key'leri olusturur."""
+    for task_id in range(USER_KEYS):
+        await redis_cache.redis.set(get_task_detail_cache_key(USER_ID, task_id), "{}")
+
+
+async def keys_invalidation() -> None:
+    """Eski yontem: KEYS + DEL (baseline commit'teki delete_pattern)."""
+    keys = await redis_cache.redis.keys(get_task_user_pattern(USER_ID))
+    if keys:
+        await redis_cache.redis.delete(*keys)
+
+
+async def versioned_invalidation() -> None:
+    """Yeni yontem: versiyon sayacina tek INCR."""
+    await redis_cache.incr(get_task_user_version_key(USER_ID))
+
+
+async def measure(func, repeat: int) -> float:
+    """Fonksiyonu `repeat` kez calistirir, median sureyi (ms) doner."""
+    samples = []
+    for _ in range(repeat):
+        await seed_user_keys()
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main(sizes: list[int], repeat: int, fake: bool) -> None:
+    if fake:
+        import fakeredis
+
+        redis_cache.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    else:
+        await redis_cache.connect()
+    if redis_cache.redis is None:
+        raise SystemExit("Redis'e baglanilamadi.")
+
+    print(f"{'keys':>12} | {'KEYS+DEL (ms)':>14} | {'INCR (ms)':>10}")
+    print("-" * 43)
+    for size in sizes:
+        await populate(size)
+        keys_ms = await measure(keys_invalidation, repeat)
+        incr_ms = await measure(versioned_invalidation, repeat)
+        print(f"{size:>12,} | {keys_ms:>14.3f} | {incr_ms:>10.3f}")
+
+    await redis_cache.redis.flushdb()
+    await redis_cache.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fake", action="store_true", help="fakeredis kullan")
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat, args.fake))
@@ -0,0 +1,125 @@
+"""
+Login storm load test'i.
+
+Arka planda surekli /auth/login istekleri gonderilirken GET /api/v1/tasks/
+gecikmesini (p50/p99) olcer. Iki mod karsilastirilir:
+- inline: bcrypt event loop icinde calisir (eski davranis)
+- pool  : bcrypt sinirli thread pool'da calisir (app.core.security)
+
+Beklenen: inline modda login storm sirasinda /tasks p99'u bcrypt suresi kadar
+artar; pool modunda storm olmayan duruma yakin kalir.
+
+Kullanim (task-api klasorunden):
+    python -m benchmarks.bench_login_storm
+    python -m benchmarks.bench_login_storm --logins 16 --samples 300
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.security import verify_password
+from app.db.database import get_db_session
+from app.db.entities import Base
+from app.main import app
+from app.services import auth as auth_service
+
+USER = {"email": "bench@example.com", "password": "benchpassword123"}
+
+
+async def inline_verify(plain_password: str, hashed_password: str) -> bool:
+    """Eski davranis: bcrypt dogrudan event loop'ta."""
+    return verify_password(plain_password, hashed_password)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure_tasks(
+    client: AsyncClient, headers: dict, samples: int
+) -> list[float]:
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        response = await client.get("/api/v1/tasks/", headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+async def login_storm(client: AsyncClient, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        await client.post("/api/v1/auth/login", json=USER)
+
+
+async def run_phase(client, headers, samples: int, logins: int) -> list[float]:
+    stop = asyncio.Event()
+    stormers = [asyncio.create_task(login_storm(client, stop)) for _ in range(logins)]
+    try:
+        return await measure_tasks(client, headers, samples)
+    finally:
+        stop.set()
+        await asyncio.gather(*stormers)
+
+
+async def main(samples: int, logins: int) -> None:
+    logging.disable(logging.CRITICAL)
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def bench_session():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = bench_session
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/api/v1/auth/register", json=USER)
+        login = await client.post("/api/v1/auth/login", json=USER)
+        token = login.json()["data"]["access_token"]
+        headers = {"Authorization": f"bearer {token}"}
+        for i in range(20):
+            await client.post(
+                "/api/v1/tasks/", json={"title": f"Task {i}"}, headers=headers
+            )
+
+        pooled_verify = auth_service.verify_password_async
+        print(f"{'mode':<8} | {'storm':<5} | {'p50 (ms)':>9} | {'p99 (ms)':>9}")
+        print("-" * 42)
+        for mode, verify in (("inline", inline_verify), ("pool", pooled_verify)):
+            auth_service.verify_password_async = verify
+            for storm in (0, logins):
+                latencies = await run_phase(client, headers, samples, storm)
+                print(
+                    f"{mode:<8} | {storm:<5} | {statistics.median(latencies):>9.2f} | "
+                    f"{percentile(latencies, 99):>9.2f}"
+                )
+        auth_service.verify_password_async = pooled_verify
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--logins", type=int, default=8, help="paralel login istemcisi")
+    args = parser.parse_args()
+    asyncio.run(main(args.samples, args.logins))
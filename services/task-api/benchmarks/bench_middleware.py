@@ -0,0 +1,147 @@
+"""
+Middleware microbenchmark'i.
+
+GET /api/v1/tasks/ uzerinde saniyedeki istek sayisini (RPS) iki durumda olcer:
+- before: BaseHTTPMiddleware tabanli eski CorrelationId + RateLimit middleware'leri
+- after : saf ASGI middleware'ler (app.core.correlation / app.core.middleware)
+
+Sadece middleware maliyetini olcmek icin auth ve TaskService dependency'leri
+sabit cevap donen stub'larla degistirilir; DB ve Redis kullanilmaz.
+
+Kullanim (task-api klasorunden):
+    python -m benchmarks.bench_middleware
+    python -m benchmarks.bench_middleware --requests 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.dependencies import get_current_user, get_task_service
+from app.api.v1.tasks import tasks_router
+from app.config import settings
+from app.core.correlation import (
+    CORRELATION_ID_HEADER,
+    REQUEST_ID_HEADER,
+    CorrelationIdMiddleware,
+    generate_correlation_id,
+    set_correlation_id,
+)
+from app.core.middleware import RateLimitMiddleware
+from app.core.rate_limiter import rate_limiter
+
+# ----- ESKI (BaseHTTPMiddleware) IMPLEMENTASYONLAR ----- #
+
+class LegacyCorrelationIdMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        correlation_id = (
+            request.headers.get(CORRELATION_ID_HEADER)
+            or request.headers.get(REQUEST_ID_HEADER)
+            or generate_correlation_id()
+        )
+        set_correlation_id(correlation_id)
+        response = await call_next(request)
+        response.headers[CORRELATION_ID_HEADER] = correlation_id
+        return response
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in RateLimitMiddleware.EXCLUDED_PATHS:
+            return await call_next(request)
+        client_ip = request.client.host if request.client else "unkown"
+        allowed, info = await rate_limiter.is_allowed(f"ip:{client_ip}")
+        headers = {
+            "X-RateLimit-Limit": str(info["limit"]),
+            "X-RateLimit-Remaining": str(info["remaining"]),
+            "X-RateLimit-Reset-After": str(info["reset_after"]),
+        }
+        if not allowed:
+            return JSONResponse(status_code=429, content={}, headers=headers)
+        response = await call_next(request)
+        for key, value in headers.items():
+            response.headers[key] = value
+        return response
+
+
+# ----- STUB DEPENDENCY'LER ----- #
+
+class StubTaskService:
+    async def get_all(self, user_id, filters, pagination=None, with_total=True):
+        return [], 0, False
+
+
+async def stub_current_user():
+    return SimpleNamespace(id=1, is_superuser=False)
+
+
+async def stub_task_service():
+    return StubTaskService()
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(tasks_router, prefix=settings.api_v1_prefix)
+    app.dependency_overrides[get_current_user] = stub_current_user
+    app.dependency_overrides[get_task_service] = stub_task_service
+    if legacy:
+        app.add_middleware(LegacyCorrelationIdMiddleware)
+        app.add_middleware(LegacyRateLimitMiddleware)
+    else:
+        app.add_middleware(CorrelationIdMiddleware)
+        app.add_middleware(RateLimitMiddleware)
+    return app
+
+
+async def run(app: FastAPI, total: int, concurrency: int) -> float:
+    """`total` istegi `concurrency` paralellikte gonderir, RPS doner."""
+    url = f"{settings.api_v1_prefix}/tasks/"
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        # Isinma
+        for _ in range(50):
+            await client.get(url)
+
+        per_worker = total // concurrency
+
+        async def worker():
+            for _ in range(per_worker):
+                response = await client.get(url)
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+    return (per_worker * concurrency) / elapsed
+
+
+async def main(total: int, concurrency: int, rounds: int) -> None:
+    logging.disable(logging.CRITICAL)
+    # Rate limiter her istegi kabul etsin (Redis baglantisi yok -> fail-open)
+    before = max(
+        [await run(build_app(True), total, concurrency) for _ in range(rounds)]
+    )
+    after = max(
+        [await run(build_app(False), total, concurrency) for _ in range(rounds)]
+    )
+
+    print(f"before (BaseHTTPMiddleware): {before:>10.0f} req/s")
+    print(f"after  (pure ASGI)         : {after:>10.0f} req/s")
+    print(f"speedup                    : {after / before:>10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.rounds))
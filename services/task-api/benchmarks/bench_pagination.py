@@ -0,0 +1,145 @@
+"""
+Sayfalama benchmark'i: OFFSET/LIMIT vs keyset (cursor).
+
+Tek bir kullaniciya ait N (varsayilan 1M) task'lik bir SQLite tablosu
+olusturur ve farkli sayfa derinliklerinde bir sayfayi getirme suresini olcer:
+- offset: PaginationSpecification (OFFSET onceki tum satirlari tarar)
+- keyset: KeysetPaginationSpecification ((created_at, id) < cursor)
+
+Beklenen: offset suresi sayfa derinligiyle dogru orantili artar, keyset
+suresi sayfa 1 ile ayni kalir. Keyset (user_id, created_at, id)
+index'ini kullanir (bkz. TaskEntity.__table_args__).
+
+Kullanim (task-api klasorunden):
+    python -m benchmarks.bench_pagination
+    python -m benchmarks.bench_pagination --rows 200000 --pages 1 100 5000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.entities import Base, TaskEntity, UserEntity
+from app.db.repositories.specifications import (
+    KeysetPaginationSpecification,
+    PaginationSpecification,
+    TaskUserSpecification,
+)
+from app.db.repositories.task import TaskRepository
+from app.models.task import TaskPriority, TaskStatus
+
+USER_ID = 1
+CHUNK = 50_000
+
+
+async def seed(session_maker, rows: int) -> None:
+    """Kullaniciyi ve `rows` adet task'i toplu insert ile olusturur."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    async with session_maker() as session:
+        session.add(
+            UserEntity(id=USER_ID, email="bench@example.com", hashed_password="x")
+        )
+        await session.flush()
+        for start in range(0, rows, CHUNK):
+            batch = [
+                {
+                    "user_id": USER_ID,
+                    "title": f"Task {i}",
+                    "status": TaskStatus.PENDING,
+                    "priority": TaskPriority.MEDIUM,
+                    "created_at": base + timedelta(seconds=i),
+                    "updated_at": base + timedelta(seconds=i),
+                }
+                for i in range(start, min(start + CHUNK, rows))
+            ]
+            await session.execute(insert(TaskEntity), batch)
+        await session.commit()
+
+
+async def cursor_for_page(
+    session, page: int, page_size: int
+) -> tuple[datetime, int] | None:
+    """Istenen sayfadan onceki son satirin (created_at, id) degerini bulur.
+
+    Olculen sureye dahil edilmez.
+    """
+    if page == 1:
+        return None
+    query = (
+        select(TaskEntity.created_at, TaskEntity.id)
+        .where(TaskEntity.user_id == USER_ID)
+        .order_by(TaskEntity.created_at.desc(), TaskEntity.id.desc())
+        .offset((page - 1) * page_size - 1)
+        .limit(1)
+    )
+    row = (await session.execute(query)).one()
+    return row.created_at, row.id
+
+
+async def timed(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main(rows: int, pages: list[int], page_size: int, repeat: int) -> None:
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    start = time.perf_counter()
+    await seed(session_maker, rows)
+    print(f"seeded {rows:,} tasks in {time.perf_counter() - start:.1f}s\n")
+
+    print(f"{'page':>8} | {'offset (ms)':>12} | {'keyset (ms)':>12}")
+    print("-" * 38)
+    async with session_maker() as session:
+        repo = TaskRepository(session)
+        for page in pages:
+            if (page - 1) * page_size >= rows:
+                continue
+            after = await cursor_for_page(session, page, page_size)
+
+            async def offset_page():
+                await repo.find(
+                    TaskUserSpecification(USER_ID),
+                    PaginationSpecification(page, page_size),
+                )
+
+            async def keyset_page():
+                await repo.find(
+                    TaskUserSpecification(USER_ID),
+                    KeysetPaginationSpecification(page_size, after),
+                )
+
+            offset_ms = await timed(offset_page, repeat)
+            keyset_ms = await timed(keyset_page, repeat)
+            print(f"{page:>8,} | {offset_ms:>12.3f} | {keyset_ms:>12.3f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--pages", type=int, nargs="+", default=[1, 100, 1_000, 10_000, 49_999]
+    )
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.pages, args.page_size, args.repeat))
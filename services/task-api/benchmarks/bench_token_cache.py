@@ -0,0 +1,65 @@
+"""
+JWT decode cache benchmark'i.
+
+Gercekci bir trafik simule edilir: `--users` adet aktif kullanici, her biri
+kendi access token'ini tekrar tekrar kullanir. Ayni istek akisi hem cache'siz
+(_decode_token_uncached) hem cache'li (decode_token) olarak cozulur;
+hit orani ve harcanan CPU suresi (process_time) raporlanir.
+
+Kullanim (task-api klasorunden):
+    python -m benchmarks.bench_token_cache
+    python -m benchmarks.bench_token_cache --users 5000 --requests 200000
+"""
+
+import argparse
+import random
+import time
+
+from app.core import security
+from app.core.security import (
+    VerifiedTokenCache,
+    _decode_token_uncached,
+    create_access_token,
+    decode_token,
+)
+
+
+def run(decode, stream: list[str]) -> float:
+    """Akistaki tum token'lari cozer, harcanan CPU suresini (sn) doner."""
+    start = time.process_time()
+    for token in stream:
+        assert decode(token) is not None
+    return time.process_time() - start
+
+
+def main(users: int, requests: int, cache_size: int) -> None:
+    tokens = [create_access_token(user_id) for user_id in range(users)]
+    rng = random.Random(42)
+    stream = [rng.choice(tokens) for _ in range(requests)]
+
+    security.verified_token_cache = VerifiedTokenCache(max_entries=cache_size)
+
+    uncached = run(_decode_token_uncached, stream)
+    cached = run(decode_token, stream)
+    stats = security.verified_token_cache.stats()
+
+    print(
+        f"requests     : {requests:,} "
+        f"({users:,} distinct tokens, cache={cache_size:,})"
+    )
+    print(f"hit ratio    : {stats['hit_ratio']:.2%}")
+    for label, seconds in (("uncached CPU", uncached), ("cached CPU  ", cached)):
+        print(
+            f"{label} : {seconds * 1000:10.1f} ms "
+            f"({seconds / requests * 1e6:.2f} us/req)"
+        )
+    print(f"CPU saved    : {(1 - cached / uncached):.2%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--cache-size", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.users, args.requests, args.cache_size)
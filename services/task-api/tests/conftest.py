@@ -5,6 +5,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.user_cache import user_cache
 from app.db.database import get_db_session
 from app.db.entities import Base
 from app.main import app
@@ -65,6 +66,26 @@ async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncSession, Non
 
     # Override'ı temizle
     app.dependency_overrides.clear()
+    # Her testte ID'ler bastan basladigi icin kullanici cache'i tasinmasin
+    user_cache.local.clear()
+
+
+@pytest.fixture(scope="function")
+async def fake_redis():
+    """redis_cache'i in-memory FakeRedis ile degistirir (gercek Redis gerekmez)."""
+    fakeredis = pytest.importorskip("fakeredis")
+    from app.core.cache import redis_cache
+
+    redis = fakeredis.FakeAsyncRedis(
+        server=fakeredis.FakeServer(), decode_responses=True
+    )
+    original = redis_cache.redis
+    redis_cache.redis = redis
+
+    yield redis
+
+    redis_cache.redis = original
+    await redis.aclose()
 
 
 @pytest.fixture(scope="function")
@@ -13,9 +13,14 @@ Bu testler gerçek HTTP istekleri yaparak:
 
 - Protected endpoint erişimi
 
+- Kullanıcı cache'i ve invalidation
+
 """
 
 from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.db.unit_of_work import TaskUnitOfWork
 
 
 class TestRegister:
@@ -165,3 +170,43 @@ class TestRefreshToken:
         )
 
         assert response.status_code == 401
+
+
+class TestCurrentUserCache:
+    """get_current_user cache testleri"""
+
+    async def test_repeated_requests_skip_user_query(
+        self, client: AsyncClient, auth_headers, test_engine
+    ):
+        """Ilk istekten sonra kullanici DB'den tekrar okunmaz."""
+        await client.get("/api/v1/auth/me", headers=auth_headers)
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = await client.get("/api/v1/auth/me", headers=auth_headers)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert not any("FROM users" in s for s in statements)
+
+    async def test_user_change_invalidates_cache(
+        self, client: AsyncClient, auth_headers, test_session
+    ):
+        """Kullanici guncellenince cache'teki eski hali kullanilmaz."""
+        me = await client.get("/api/v1/auth/me", headers=auth_headers)
+        user_id = me.json()["data"]["id"]
+
+        uow = TaskUnitOfWork(test_session)
+        user = await uow.users.get_by_id(user_id)
+        user.full_name = "Renamed User"
+        await uow.commit()
+
+        response = await client.get("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.json()["data"]["full_name"] == "Renamed User"
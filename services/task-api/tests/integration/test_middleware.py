@@ -0,0 +1,130 @@
+"""
+Middleware integration testleri.
+
+Bu testler:
+- Correlation ID header'inin uretilmesini/tasinmasini
+- Context variable'in endpoint'e ulasmasini
+- Rate limit header'larini ve 429 cevabini
+- Streaming response'larin bozulmadigini
+- Istek basina SQL sorgu sayisi header'ini
+denetler.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.core import middleware
+from app.core.correlation import (
+    CORRELATION_ID_HEADER,
+    CorrelationIdMiddleware,
+    get_correlation_id,
+)
+from app.core.middleware import RateLimitMiddleware
+from app.core.query_counter import QUERY_COUNT_HEADER
+from app.core.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+async def middleware_client():
+    """Iki middleware'i de kullanan kucuk bir uygulama."""
+    app = FastAPI()
+
+    @app.get("/echo")
+    async def echo():
+        return {"correlation_id": get_correlation_id()}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i};"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(CorrelationIdMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+class TestCorrelationIdMiddleware:
+    """Correlation ID middleware testleri"""
+
+    async def test_generates_correlation_id(self, middleware_client):
+        """Header yoksa yeni ID uretilir ve endpoint ayni ID'yi gorur."""
+        response = await middleware_client.get("/echo")
+
+        correlation_id = response.headers[CORRELATION_ID_HEADER]
+        assert correlation_id
+        assert response.json()["correlation_id"] == correlation_id
+
+    async def test_propagates_incoming_correlation_id(self, middleware_client):
+        """Gelen ID aynen kullanilir."""
+        response = await middleware_client.get(
+            "/echo", headers={CORRELATION_ID_HEADER: "abc-123"}
+        )
+
+        assert response.headers[CORRELATION_ID_HEADER] == "abc-123"
+        assert response.json()["correlation_id"] == "abc-123"
+
+
+class TestRateLimitMiddleware:
+    """Rate limit middleware testleri"""
+
+    async def test_adds_rate_limit_headers(self, middleware_client):
+        """Basarili cevaba rate limit header'lari eklenir."""
+        response = await middleware_client.get("/echo")
+
+        assert response.status_code == 200
+        assert "X-RateLimit-Limit" in response.headers
+        assert "X-RateLimit-Remaining" in response.headers
+        assert "X-RateLimit-Reset-After" in response.headers
+
+    async def test_returns_429_when_limit_exceeded(
+        self, middleware_client, fake_redis, monkeypatch
+    ):
+        """Limit asilinca ayni 429 govdesi doner."""
+        monkeypatch.setattr(
+            middleware, "rate_limiter", RateLimiter(max_requests=1, window_seconds=60)
+        )
+
+        await middleware_client.get("/echo")
+        response = await middleware_client.get("/echo")
+
+        assert response.status_code == 429
+        body = response.json()
+        assert body["success"] is False
+        assert body["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+        assert "retry_after" in body["error"]
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+
+    async def test_streaming_response_passes_through(self, middleware_client):
+        """Streaming response parcalari ve header'lari korunur."""
+        response = await middleware_client.get("/stream")
+
+        assert response.text == "chunk-0;chunk-1;chunk-2;"
+        assert "X-RateLimit-Limit" in response.headers
+        assert CORRELATION_ID_HEADER in response.headers
+
+
+class TestQueryCountMiddleware:
+    """X-DB-Query-Count header testleri"""
+
+    async def test_update_request_query_count(self, client: AsyncClient, auth_headers):
+        """Task guncelleme: SELECT + UPDATE RETURNING + outbox INSERT, refresh yok"""
+        created = await client.post(
+            "/api/v1/tasks/", json={"title": "Count me"}, headers=auth_headers
+        )
+        task_id = created.json()["data"]["id"]
+
+        response = await client.put(
+            f"/api/v1/tasks/{task_id}", json={"title": "Counted"}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers[QUERY_COUNT_HEADER] == "3"
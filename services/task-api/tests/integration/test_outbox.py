@@ -0,0 +1,308 @@
+"""
+Transactional outbox testleri.
+
+Task yazmalari event'leri ayni transaction'da outbox_events'e yazar;
+OutboxRelay bunlari Dapr'a publish edip siler.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event as sa_event
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.dapr_pubsub import BulkPublishResult, dapr_pubsub
+from app.core.outbox import OutboxRelay
+from app.db.entities import OutboxEventEntity
+from app.db.repositories.outbox import OutboxRepository
+
+
+async def outbox_rows(session: AsyncSession) -> list[OutboxEventEntity]:
+    session.expire_all()
+    result = await session.scalars(
+        select(OutboxEventEntity).order_by(OutboxEventEntity.id)
+    )
+    return list(result.all())
+
+
+@pytest.fixture
+def relay(test_engine) -> OutboxRelay:
+    session_maker = async_sessionmaker(
+        bind=test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    return OutboxRelay(session_maker=session_maker, batch_size=10)
+
+
+@pytest.fixture
+def advisory_lock(monkeypatch) -> list:
+    """
+    try_lock_relay'i PostgreSQL advisory lock'u gibi davranan bir sahteyle
+    degistirir: kilit tek session'da olur, transaction bitince birakilir.
+    """
+    holders: list = []
+
+    async def fake_try_lock_relay(self) -> bool:
+        if holders:
+            return False
+        holders.append(self.session)
+
+        @sa_event.listens_for(
+            self.session.sync_session, "after_transaction_end", once=True
+        )
+        def release(session, transaction):
+            holders.clear()
+
+        return True
+
+    monkeypatch.setattr(OutboxRepository, "try_lock_relay", fake_try_lock_relay)
+    return holders
+
+
+@pytest.fixture
+def published(monkeypatch) -> list[list[dict]]:
+    """dapr_pubsub.publish_bulk'u gonderilen batch'leri kaydeden sahteyle degistirir."""
+    batches: list[list[dict]] = []
+
+    async def fake_publish_bulk(topic: str, events: list[dict], metadata=None):
+        batches.append(events)
+        return BulkPublishResult(total=len(events))
+
+    monkeypatch.setattr(dapr_pubsub, "publish_bulk", fake_publish_bulk)
+    return batches
+
+
+class TestOutboxWrites:
+    """Event'lerin task degisikligiyle birlikte outbox'a yazilmasi"""
+
+    async def test_task_write_adds_outbox_event(
+            self, client: AsyncClient, auth_headers, test_session, published
+    ):
+        response = await client.post(
+            "/api/v1/tasks/", json={"title": "Outboxed"}, headers=auth_headers
+        )
+        task_id = response.json()["data"]["id"]
+
+        rows = await outbox_rows(test_session)
+        assert len(rows) == 1
+        assert rows[0].topic == "task-events"
+        assert rows[0].payload["event_type"] == "task.created"
+        assert rows[0].payload["task_id"] == task_id
+        assert rows[0].payload["data"]["title"] == "Outboxed"
+        # Istek sirasinda Dapr'a gidilmez
+        assert published == []
+
+    async def test_completing_task_adds_updated_and_completed(
+            self, client: AsyncClient, auth_headers, test_session
+    ):
+        response = await client.post(
+            "/api/v1/tasks/", json={"title": "Finish me"}, headers=auth_headers
+        )
+        task_id = response.json()["data"]["id"]
+        await client.put(
+            f"/api/v1/tasks/{task_id}",
+            json={"status": "completed"},
+            headers=auth_headers,
+        )
+
+        rows = await outbox_rows(test_session)
+        assert [row.payload["event_type"] for row in rows] == [
+            "task.created", "task.updated", "task.completed"
+        ]
+
+    async def test_rolled_back_write_adds_no_event(
+            self, client: AsyncClient, auth_headers, test_session
+    ):
+        response = await client.request(
+            "DELETE", "/api/v1/tasks/bulk", json={"ids": [999999]}, headers=auth_headers
+        )
+
+        assert response.status_code == 404
+        assert await outbox_rows(test_session) == []
+
+
+class TestOutboxRelay:
+    """OutboxRelay.run_once testleri"""
+
+    async def test_relay_publishes_in_order_and_deletes(
+            self, client: AsyncClient, auth_headers, test_session, relay, published
+    ):
+        await client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"title": f"Relay {i}"} for i in range(3)]},
+            headers=auth_headers,
+        )
+
+        assert await relay.run_once() == 3
+        # Tek bulk publish istegi, id sirasiyla
+        assert len(published) == 1
+        assert [event["data"]["title"] for event in published[0]] == [
+            "Relay 0", "Relay 1", "Relay 2"
+        ]
+        assert await outbox_rows(test_session) == []
+        assert await relay.run_once() == 0
+
+    async def test_failed_publish_is_retried(
+            self, client: AsyncClient, auth_headers, test_session, relay, monkeypatch
+    ):
+        await client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"title": f"Retry {i}"} for i in range(3)]},
+            headers=auth_headers,
+        )
+        sent: list[str] = []
+
+        async def flaky_publish_bulk(topic: str, events: list[dict], metadata=None):
+            result = BulkPublishResult(total=len(events))
+            for index, event in enumerate(events):
+                if event["data"]["title"] == "Retry 1":
+                    result.failed[index] = "sidecar down"
+                else:
+                    sent.append(event["data"]["title"])
+            return result
+
+        monkeypatch.setattr(dapr_pubsub, "publish_bulk", flaky_publish_bulk)
+
+        # Basarisiz entry ve sonrakiler sira korunsun diye outbox'ta kalir
+        assert await relay.run_once() == 1
+        rows = await outbox_rows(test_session)
+        assert [row.payload["data"]["title"] for row in rows] == ["Retry 1", "Retry 2"]
+        assert rows[0].attempts == 1
+        assert rows[0].last_error == "sidecar down"
+        assert rows[1].attempts == 0
+        assert relay.stats()["failed"] == 1
+        sent.clear()
+
+        async def ok_publish_bulk(topic: str, events: list[dict], metadata=None):
+            sent.extend(event["data"]["title"] for event in events)
+            return BulkPublishResult(total=len(events))
+
+        monkeypatch.setattr(dapr_pubsub, "publish_bulk", ok_publish_bulk)
+        assert await relay.run_once() == 2
+        assert sent == ["Retry 1", "Retry 2"]
+        assert await outbox_rows(test_session) == []
+
+    async def test_poison_event_is_parked(
+            self, client: AsyncClient, auth_headers, test_session, relay, monkeypatch
+    ):
+        await client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"title": f"Poison {i}"} for i in range(2)]},
+            headers=auth_headers,
+        )
+        sent: list[str] = []
+
+        async def poison_publish_bulk(topic: str, events: list[dict], metadata=None):
+            result = BulkPublishResult(total=len(events))
+            for index, event in enumerate(events):
+                if event["data"]["title"] == "Poison 0":
+                    result.failed[index] = "bad payload"
+                else:
+                    sent.append(event["data"]["title"])
+            return result
+
+        monkeypatch.setattr(dapr_pubsub, "publish_bulk", poison_publish_bulk)
+        relay.max_attempts = 2
+
+        assert await relay.run_once() == 0
+        assert await relay.run_once() == 0
+        assert relay.stats()["parked"] == 1
+        sent.clear()
+
+        # Park edilen event artik alinmaz, sonrakiler publish edilir
+        assert await relay.run_once() == 1
+        assert sent == ["Poison 1"]
+        rows = await outbox_rows(test_session)
+        assert [row.payload["data"]["title"] for row in rows] == ["Poison 0"]
+        assert rows[0].attempts == 2
+        assert await OutboxRepository(test_session).backlog(relay.max_attempts) == {
+            "pending": 0, "parked": 1
+        }
+
+    async def test_concurrent_relays_keep_order(
+            self, client: AsyncClient, auth_headers, test_session, test_engine,
+            relay, advisory_lock, monkeypatch
+    ):
+        """Basarisiz batch tekrar denenmeden diger relay sonrakileri gondermemeli"""
+        await client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"title": f"Order {i}"} for i in range(3)]},
+            headers=auth_headers,
+        )
+        sent: list[str] = []
+        gate = asyncio.Event()
+        fail = {"Order 1"}
+
+        async def slow_publish_bulk(topic: str, events: list[dict], metadata=None):
+            await gate.wait()
+            result = BulkPublishResult(total=len(events))
+            for index, event in enumerate(events):
+                title = event["data"]["title"]
+                if title in fail:
+                    result.failed[index] = "sidecar down"
+                else:
+                    sent.append(title)
+            return result
+
+        monkeypatch.setattr(dapr_pubsub, "publish_bulk", slow_publish_bulk)
+        session_maker = async_sessionmaker(
+            bind=test_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        other = OutboxRelay(session_maker=session_maker, batch_size=10)
+
+        first = asyncio.create_task(relay.run_once())
+        await asyncio.sleep(0.05)
+        # Kilit ilk relay'de: ikincisi publish etmeden turu atlar
+        assert await asyncio.wait_for(other.run_once(), timeout=1) == 0
+        assert sent == []
+
+        gate.set()
+        assert await first == 1
+        assert sent == ["Order 0", "Order 2"]
+        sent.clear()
+        fail.clear()
+
+        # Basarisiz event ve sonrasi, kilidi alan relay tarafindan sirayla gonderilir
+        assert await other.run_once() == 2
+        assert sent == ["Order 1", "Order 2"]
+        assert await outbox_rows(test_session) == []
+
+
+class TestRelayLock:
+    """OutboxRepository.try_lock_relay"""
+
+    async def test_postgres_uses_advisory_xact_lock(self):
+        statements: list = []
+
+        async def scalar(statement):
+            statements.append(statement)
+            return True
+
+        session = SimpleNamespace(
+            bind=SimpleNamespace(dialect=SimpleNamespace(name="postgresql")),
+            scalar=scalar,
+        )
+
+        assert await OutboxRepository(session).try_lock_relay() is True
+        sql = str(statements[0].compile(dialect=postgresql.dialect()))
+        assert "pg_try_advisory_xact_lock" in sql
+
+    async def test_other_databases_always_lock(self, test_session):
+        assert await OutboxRepository(test_session).try_lock_relay() is True
+
+    async def test_claim_batch_does_not_skip_locked_rows(self):
+        statements: list = []
+
+        async def scalars(statement):
+            statements.append(statement)
+            return SimpleNamespace(all=lambda: [])
+
+        session = SimpleNamespace(scalars=scalars)
+        await OutboxRepository(session).claim_batch(10, max_attempts=3)
+
+        sql = str(statements[0].compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE" in sql
+        assert "SKIP LOCKED" not in sql
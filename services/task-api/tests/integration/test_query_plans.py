@@ -0,0 +1,140 @@
+"""
+Task sorgularinin EXPLAIN testleri.
+
+Tohumlanmis bir veri seti uzerinde her Specification kombinasyonu icin
+(find ve count) EXPLAIN QUERY PLAN calistirir. Herhangi bir sorgu tasks
+tablosunu index kullanmadan tararsa (sequential scan) test basarisiz olur.
+"""
+
+import itertools
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.db.entities import TaskEntity, UserEntity
+from app.db.repositories.specifications import (
+    KeysetPaginationSpecification,
+    PaginationSpecification,
+    TaskPrioritySpecification,
+    TaskSearchSpecification,
+    TaskStatusSpecification,
+    TaskUserSpecification,
+)
+from app.models.task import TaskPriority, TaskStatus
+
+USERS = 20
+TASKS_PER_USER = 50
+
+
+class Explain(Executable, ClauseElement):
+    """Bir Select'i EXPLAIN QUERY PLAN ile saran ifade."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "sqlite")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN QUERY PLAN " + compiler.process(element.statement, **kw)
+
+
+FILTERS = {
+    "status": TaskStatusSpecification(TaskStatus.PENDING),
+    "priority": TaskPrioritySpecification(TaskPriority.HIGH),
+    "search": TaskSearchSpecification("report"),
+}
+PAGINATIONS = {
+    "none": None,
+    "offset": PaginationSpecification(3, 10),
+    "keyset": KeysetPaginationSpecification(
+        10, (datetime(2026, 1, 1, tzinfo=UTC), 500)
+    ),
+}
+
+
+def filter_combinations():
+    """user + filtrelerin tum alt kumeleri."""
+    for size in range(len(FILTERS) + 1):
+        for names in itertools.combinations(FILTERS, size):
+            yield pytest.param(names, id="+".join(("user", *names)))
+
+
+def spec_combinations():
+    """Filtre kombinasyonlari x sayfalama modlari."""
+    for param in filter_combinations():
+        (names,) = param.values
+        for pagination in PAGINATIONS:
+            yield pytest.param(names, pagination, id=f"{param.id}+{pagination}")
+
+
+@pytest.fixture
+async def seeded_session(test_session):
+    """Birden fazla kullanici ve task'la doldurulmus, ANALYZE edilmis DB."""
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    for u in range(USERS):
+        user = UserEntity(email=f"plan{u}@example.com", hashed_password="x")
+        test_session.add(user)
+        await test_session.flush()
+        for i in range(TASKS_PER_USER):
+            test_session.add(TaskEntity(
+                user_id=user.id,
+                title=f"Weekly report {i}" if i % 5 == 0 else f"Task {i}",
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)],
+            ))
+    await test_session.commit()
+    await test_session.execute(text("ANALYZE"))
+    return test_session
+
+
+async def explain(session, query) -> list[str]:
+    result = await session.execute(Explain(query))
+    return [row.detail for row in result]
+
+
+def sequential_scans(plan: list[str]) -> list[str]:
+    """'SCAN tasks' olup index kullanmayan adimlari doner."""
+    return [
+        step for step in plan
+        if step.startswith("SCAN tasks") and "INDEX" not in step
+    ]
+
+
+@pytest.mark.parametrize(("filters", "pagination"), list(spec_combinations()))
+async def test_find_uses_index(seeded_session, filters, pagination):
+    specs = [TaskUserSpecification(1), *(FILTERS[name] for name in filters)]
+    if PAGINATIONS[pagination] is not None:
+        specs.append(PAGINATIONS[pagination])
+
+    # BaseRepository.find_page ile ayni sorgu: keyset with_total=False ile
+    # (limit + 1), digerleri COUNT(*) OVER() ile cagrilir (bkz. TaskService)
+    if pagination == "keyset":
+        query = select(TaskEntity)
+    else:
+        query = select(TaskEntity, func.count().over().label("total_count"))
+    for spec in specs:
+        query = spec.apply(query)
+    if pagination == "keyset":
+        query = query.limit(PAGINATIONS[pagination].page_size + 1)
+
+    plan = await explain(seeded_session, query)
+    assert not sequential_scans(plan), plan
+
+
+@pytest.mark.parametrize("filters", list(filter_combinations()))
+async def test_count_uses_index(seeded_session, filters):
+    specs = [TaskUserSpecification(1), *(FILTERS[name] for name in filters)]
+
+    # BaseRepository.count ile ayni sorgu (sayfalama count'u etkilemez)
+    query = select(func.count()).select_from(TaskEntity)
+    for spec in specs:
+        query = spec.apply(query)
+
+    plan = await explain(seeded_session, query)
+    assert not sequential_scans(plan), plan
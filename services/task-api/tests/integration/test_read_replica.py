@@ -0,0 +1,106 @@
+"""
+Read replica yonlendirmesi integration testleri.
+
+Replica olarak ayri (bos) bir SQLite dosyasi kullanilir; replikasyon olmadigi
+icin replica'dan yapilan okumalar yeni yazilari goremez. Boylece okumanin
+hangi veritabanina gittigi cevaptan anlasilir.
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.database import get_replica_db_session
+from app.db.entities import Base, TaskEntity
+from app.db.routing import read_router
+from app.main import app
+
+
+@pytest.fixture
+async def replica_session(
+        client: AsyncClient, tmp_path, monkeypatch
+) -> AsyncGenerator[AsyncSession, None]:
+    """Bos bir replica veritabani olusturur, get_replica_db_session'i override eder."""
+    monkeypatch.setattr(read_router, "enabled", True)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_maker() as session:
+        async def override() -> AsyncGenerator[AsyncSession, None]:
+            yield session
+
+        app.dependency_overrides[get_replica_db_session] = override
+        yield session
+
+    read_router._recent_writes.clear()
+    await engine.dispose()
+
+
+async def create_task(client: AsyncClient, headers: dict, title: str) -> dict:
+    response = await client.post(
+        "/api/v1/tasks/", json={"title": title}, headers=headers
+    )
+    assert response.status_code == 201
+    return response.json()["data"]
+
+
+class TestReadReplicaRouting:
+    """Okumalarin replica'ya, yazmalarin primary'ye gitmesi"""
+
+    async def test_writes_go_to_primary(self, client, auth_headers, replica_session):
+        await create_task(client, auth_headers, "Primary only")
+
+        replica_count = await replica_session.scalar(select(func.count(TaskEntity.id)))
+        assert replica_count == 0
+
+    async def test_read_your_writes_reads_from_primary(
+            self, client, auth_headers, replica_session
+    ):
+        task = await create_task(client, auth_headers, "Just written")
+
+        # Yazan kullanici pencere icinde primary'den okur
+        response = await client.get(f"/api/v1/tasks/{task['id']}", headers=auth_headers)
+        assert response.status_code == 200
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+        items = response.json()["data"]["items"]
+        assert [t["title"] for t in items] == ["Just written"]
+
+    async def test_reads_go_to_replica_after_window(
+            self, client, auth_headers, replica_session, monkeypatch
+    ):
+        monkeypatch.setattr(read_router, "window_seconds", 0)
+        task = await create_task(client, auth_headers, "Not replicated")
+
+        # Pencere yok: okuma (henuz replike edilmemis) replica'ya gider
+        response = await client.get(f"/api/v1/tasks/{task['id']}", headers=auth_headers)
+        assert response.status_code == 404
+
+        response = await client.get(
+            "/api/v1/tasks/", params={"paginate": "cursor"}, headers=auth_headers
+        )
+        assert response.json()["data"]["items"] == []
+
+    async def test_without_replica_reads_from_primary(
+            self, client, auth_headers, monkeypatch
+    ):
+        monkeypatch.setattr(read_router, "window_seconds", 0)
+        task = await create_task(client, auth_headers, "No replica")
+
+        response = await client.get(f"/api/v1/tasks/{task['id']}", headers=auth_headers)
+        assert response.status_code == 200
+
+    async def test_without_replica_writes_are_not_marked(
+            self, client, auth_headers, fake_redis
+    ):
+        await create_task(client, auth_headers, "No marker")
+
+        assert read_router._recent_writes == {}
+        assert await fake_redis.keys("db:recent_write:*") == []
@@ -9,6 +9,10 @@ denetlemektedir.
 
 from httpx import AsyncClient
 
+from app.config import settings
+from app.db.repositories.task import TaskRepository
+from app.models.task import TaskStatus
+
 
 class TestCreateTask:
     """POST /api/v1/tasks testleri"""
@@ -98,6 +102,153 @@ class TestGetTasks:
         assert "My Task 2" in titles
 
 
+class TestListTotals:
+    """GET /api/v1/tasks toplam/has_more testleri"""
+
+    async def test_total_and_has_more(self, client: AsyncClient, auth_headers):
+        """Sayfali listede toplam ve has_more dogru donmeli"""
+        for i in range(3):
+            await client.post(
+                "/api/v1/tasks/", json={"title": f"Task {i}"}, headers=auth_headers
+            )
+
+        response = await client.get(
+            "/api/v1/tasks/", params={"page_size": 2}, headers=auth_headers
+        )
+
+        page = response.json()["data"]
+        assert page["total"] == 3
+        assert page["total_pages"] == 2
+        assert page["has_more"] is True
+
+    async def test_include_total_false_skips_count(
+            self, client: AsyncClient, auth_headers
+    ):
+        """include_total=false ile toplam None, has_more dolu donmeli"""
+        for i in range(3):
+            await client.post(
+                "/api/v1/tasks/", json={"title": f"Task {i}"}, headers=auth_headers
+            )
+
+        response = await client.get(
+            "/api/v1/tasks/",
+            params={"page": 2, "page_size": 2, "include_total": "false"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        page = response.json()["data"]
+        assert page["total"] is None
+        assert page["total_pages"] is None
+        assert page["has_more"] is False
+        assert len(page["items"]) == 1
+
+
+class TestSearchTasks:
+    """GET /api/v1/tasks?search= full-text search testleri"""
+
+    async def _titles(self, client, auth_headers, search):
+        response = await client.get(
+            "/api/v1/tasks/", params={"search": search}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        return [task["title"] for task in response.json()["data"]["items"]]
+
+    async def test_search_matches_title_and_description(
+        self, client: AsyncClient, auth_headers
+    ):
+        """Baslik ve aciklamadaki kelimeler (ve on ekleri) bulunmali"""
+        await client.post(
+            "/api/v1/tasks/", json={"title": "Quarterly report"}, headers=auth_headers
+        )
+        await client.post(
+            "/api/v1/tasks/",
+            json={"title": "Groceries", "description": "Buy milk and report receipts"},
+            headers=auth_headers,
+        )
+        await client.post("/api/v1/tasks/", json={"title": "Gym"}, headers=auth_headers)
+
+        titles = await self._titles(client, auth_headers, "repo")
+        assert sorted(titles) == ["Groceries", "Quarterly report"]
+        # Baslikta gecen kelime daha alakali
+        assert titles[0] == "Quarterly report"
+
+        assert await self._titles(client, auth_headers, "quarterly report") == [
+            "Quarterly report"
+        ]
+
+    async def test_search_index_follows_updates_and_deletes(
+        self, client: AsyncClient, auth_headers
+    ):
+        """Guncellenen/silinen task'lar arama sonuclarina yansimali"""
+        created = await client.post(
+            "/api/v1/tasks/", json={"title": "Draft invoice"}, headers=auth_headers
+        )
+        task_id = created.json()["data"]["id"]
+
+        await client.put(
+            f"/api/v1/tasks/{task_id}",
+            json={"title": "Final contract"},
+            headers=auth_headers,
+        )
+        assert await self._titles(client, auth_headers, "invoice") == []
+        titles = await self._titles(client, auth_headers, "contract")
+        assert titles == ["Final contract"]
+
+        await client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+        assert await self._titles(client, auth_headers, "contract") == []
+
+    async def test_search_with_fts_operators_does_not_fail(
+        self, client: AsyncClient, auth_headers
+    ):
+        """FTS operator karakterleri hata vermemeli"""
+        await client.post(
+            "/api/v1/tasks/", json={"title": "A-B test"}, headers=auth_headers
+        )
+
+        assert await self._titles(client, auth_headers, '"a-b*:') == ["A-B test"]
+        assert await self._titles(client, auth_headers, "!!!") == []
+
+
+class TestCursorPagination:
+    """GET /api/v1/tasks?paginate=cursor testleri"""
+
+    async def test_cursor_pages_cover_all_tasks(
+            self, client: AsyncClient, auth_headers
+    ):
+        """Cursor ile tum sayfalar gezildiginde her task bir kez gelmeli"""
+        for i in range(5):
+            await client.post(
+                "/api/v1/tasks/", json={"title": f"Task {i}"}, headers=auth_headers
+            )
+
+        seen = []
+        params = {"paginate": "cursor", "page_size": 2}
+        while True:
+            response = await client.get(
+                "/api/v1/tasks/", params=params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            page = response.json()["data"]
+            assert page["total"] == 5
+            seen.extend(task["id"] for task in page["items"])
+            if page["next_cursor"] is None:
+                break
+            params = {"cursor": page["next_cursor"], "page_size": 2}
+
+        assert len(seen) == 5
+        # Yeniden eskiye sirali
+        assert seen == sorted(seen, reverse=True)
+
+    async def test_invalid_cursor_fails(self, client: AsyncClient, auth_headers):
+        """Bozuk cursor 400 donmeli"""
+        response = await client.get(
+            "/api/v1/tasks/", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        )
+
+        assert response.status_code == 400
+
+
 class TestGetTaskById:
     """GET /api/v1/tasks{task_id} ile task getirme testleridir."""
 
@@ -194,6 +345,158 @@ class TestDeleteTask:
         assert response.status_code == 404
 
 
+class TestBulkTasks:
+    """/api/v1/tasks/bulk testleri"""
+
+    async def create_many(self, client: AsyncClient, headers, count: int) -> list[dict]:
+        response = await client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [
+                {"title": f"Bulk {i}", "priority": "low"} for i in range(count)
+            ]},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        return response.json()["data"]
+
+    async def test_bulk_create_single_insert(self, client: AsyncClient, auth_headers):
+        """Tum task'lar tek INSERT ile, gonderilen sirayla olusur"""
+        # Kullaniciyi cache'e al; sayimda sadece task sorgulari kalsin
+        await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        response = await client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"title": f"Bulk {i}"} for i in range(25)]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 201
+        tasks = response.json()["data"]
+        assert [t["title"] for t in tasks] == [f"Bulk {i}" for i in range(25)]
+        assert len({t["id"] for t in tasks}) == 25
+        # tasks INSERT + outbox INSERT
+        assert response.headers["X-DB-Query-Count"] == "2"
+
+        listed = await client.get(
+            "/api/v1/tasks/", params={"page_size": 100}, headers=auth_headers
+        )
+        assert listed.json()["data"]["total"] == 25
+
+    async def test_bulk_create_limit(self, client: AsyncClient, auth_headers):
+        response = await client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"title": "x"}] * (settings.task_bulk_max_items + 1)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    async def test_bulk_update_mixed_fields(self, client: AsyncClient, auth_headers):
+        """Farkli alanlari degisen task'lar tek UPDATE ile guncellenir"""
+        first, second, third = await self.create_many(client, auth_headers, 3)
+
+        response = await client.put(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [
+                {"id": first["id"], "title": "Renamed"},
+                {"id": second["id"], "status": "completed", "priority": "high"},
+                {"id": third["id"], "description": "Described"},
+            ]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        # get_statuses + UPDATE ... RETURNING + outbox INSERT
+        assert response.headers["X-DB-Query-Count"] == "3"
+        updated = {t["id"]: t for t in response.json()["data"]}
+        assert updated[first["id"]]["title"] == "Renamed"
+        assert updated[first["id"]]["priority"] == "low"
+        assert updated[second["id"]]["status"] == "completed"
+        assert updated[second["id"]]["priority"] == "high"
+        assert updated[second["id"]]["title"] == "Bulk 1"
+        assert updated[third["id"]]["description"] == "Described"
+
+        detail = await client.get(f"/api/v1/tasks/{second['id']}", headers=auth_headers)
+        assert detail.json()["data"]["status"] == "completed"
+
+    async def test_bulk_update_unknown_task_changes_nothing(
+        self, client: AsyncClient, auth_headers
+    ):
+        (task,) = await self.create_many(client, auth_headers, 1)
+
+        response = await client.put(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [
+                {"id": task["id"], "title": "Nope"}, {"id": 999999, "title": "x"}
+            ]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+        detail = await client.get(f"/api/v1/tasks/{task['id']}", headers=auth_headers)
+        assert detail.json()["data"]["title"] == "Bulk 0"
+
+    async def test_bulk_update_task_deleted_concurrently(
+        self, client: AsyncClient, auth_headers, monkeypatch
+    ):
+        (task,) = await self.create_many(client, auth_headers, 1)
+        get_statuses = TaskRepository.get_statuses
+
+        async def stale_get_statuses(self, user_id, task_ids):
+            # Kontrolden sonra UPDATE'ten once silinmis bir task gibi davranir
+            statuses = await get_statuses(self, user_id, task_ids)
+            return {**statuses, 999999: TaskStatus.PENDING}
+
+        monkeypatch.setattr(TaskRepository, "get_statuses", stale_get_statuses)
+        response = await client.put(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [
+                {"id": task["id"], "title": "Nope"}, {"id": 999999, "title": "x"}
+            ]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+        detail = await client.get(f"/api/v1/tasks/{task['id']}", headers=auth_headers)
+        assert detail.json()["data"]["title"] == "Bulk 0"
+
+    async def test_bulk_update_duplicate_ids(self, client: AsyncClient, auth_headers):
+        response = await client.put(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"id": 1, "title": "a"}, {"id": 1, "title": "b"}]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    async def test_bulk_delete(self, client: AsyncClient, auth_headers):
+        tasks = await self.create_many(client, auth_headers, 4)
+        ids = [t["id"] for t in tasks[:3]]
+
+        response = await client.request(
+            "DELETE", "/api/v1/tasks/bulk", json={"ids": ids}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"] == ids
+        # DELETE ... RETURNING + outbox INSERT
+        assert response.headers["X-DB-Query-Count"] == "2"
+        listed = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert [t["id"] for t in listed.json()["data"]["items"]] == [tasks[3]["id"]]
+
+    async def test_bulk_delete_unknown_task_rolls_back(
+        self, client: AsyncClient, auth_headers
+    ):
+        (task,) = await self.create_many(client, auth_headers, 1)
+
+        response = await client.request(
+            "DELETE", "/api/v1/tasks/bulk", json={"ids": [task["id"], 999999]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+        detail = await client.get(f"/api/v1/tasks/{task['id']}", headers=auth_headers)
+        assert detail.status_code == 200
+
+
 class TestTaskAuthorization:
     """Task ownership/authorization testleri"""
 
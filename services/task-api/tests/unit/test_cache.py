@@ -0,0 +1,95 @@
+"""
+Cache katmaninin testleri.
+
+Bu testler:
+- Versiyonlu cache key formatini
+- INCR ile namespace invalidation'i
+- Yazma sonrasi liste cache'inin bayatlamadigini
+denetler.
+"""
+
+from httpx import AsyncClient
+
+from app.core.cache import redis_cache
+from app.core.cache_keys import (
+    get_task_detail_cache_key,
+    get_task_list_cache_key,
+    get_task_user_version_key,
+)
+
+
+class TestCacheKeys:
+    """Cache key format testleri"""
+
+    def test_list_key_contains_version(self):
+        """Liste key'i versiyonu icerir."""
+        key = get_task_list_cache_key(1, "pending", "high", None, 1, version=3)
+
+        assert key == "tasks:user:1:v3:list:pending:high::1"
+
+    def test_detail_key_contains_version(self):
+        """Detay key'i versiyonu icerir."""
+        key = get_task_detail_cache_key(1, 5, version=3)
+
+        assert key == "tasks:user:1:v3:detail:5"
+
+    def test_different_versions_produce_different_keys(self):
+        """Versiyon degisince key de degisir."""
+        assert get_task_detail_cache_key(1, 5, version=0) != get_task_detail_cache_key(
+            1, 5, version=1
+        )
+
+
+class TestVersionedInvalidation:
+    """INCR tabanli invalidation testleri"""
+
+    async def test_version_defaults_to_zero(self, fake_redis):
+        """Sayac yoksa versiyon 0'dir."""
+        version = await redis_cache.get_version(get_task_user_version_key(1))
+
+        assert version == 0
+
+    async def test_incr_bumps_version(self, fake_redis):
+        """INCR versiyonu bir artirir."""
+        key = get_task_user_version_key(1)
+
+        await redis_cache.incr(key)
+        await redis_cache.incr(key)
+
+        assert await redis_cache.get_version(key) == 2
+
+    async def test_incr_does_not_touch_other_users(self, fake_redis):
+        """Bir kullanicinin invalidation'i digerlerini etkilemez."""
+        await redis_cache.incr(get_task_user_version_key(1))
+
+        assert await redis_cache.get_version(get_task_user_version_key(2)) == 0
+
+    async def test_write_invalidates_cached_list(
+        self, client: AsyncClient, auth_headers, fake_redis
+    ):
+        """Yeni task olusturulunca eski liste cache'i okunmaz."""
+        await client.post(
+            "/api/v1/tasks/", json={"title": "Task 1"}, headers=auth_headers
+        )
+        first = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert first.json()["data"]["total"] == 1
+
+        await client.post(
+            "/api/v1/tasks/", json={"title": "Task 2"}, headers=auth_headers
+        )
+        second = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert second.json()["data"]["total"] == 2
+
+    async def test_write_does_not_scan_keyspace(
+        self, client: AsyncClient, auth_headers, fake_redis
+    ):
+        """Yazma islemi KEYS/SCAN yerine sadece sayaci artirir."""
+        await client.post(
+            "/api/v1/tasks/", json={"title": "Task 1"}, headers=auth_headers
+        )
+        user_id = (await client.get("/api/v1/auth/me", headers=auth_headers)).json()[
+            "data"
+        ]["id"]
+
+        assert await fake_redis.get(get_task_user_version_key(user_id)) == "1"
@@ -0,0 +1,120 @@
+"""
+DaprPubSubClient.publish_bulk testleri.
+
+Dapr sidecar yerine lokal bir stub HTTP sunucusu kullanilir.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.core.dapr_pubsub import DaprPubSubClient
+
+
+class StubSidecar:
+    """
+    Bulk publish isteklerini kaydeden stub sidecar.
+    data["fail"] olan entry'leri failedEntries ile reddeder.
+    """
+
+    def __init__(self):
+        self.requests: list[tuple[str, list[dict]]] = []
+        self.status_override: int | None = None
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append((self.path, body))
+                if stub.status_override:
+                    self._reply(
+                        stub.status_override, {"message": "sidecar unavailable"}
+                    )
+                    return
+                failed = [
+                    {"entryId": entry["entryId"], "error": "rejected"}
+                    for entry in body if entry["event"].get("fail")
+                ]
+                if failed:
+                    self._reply(500, {
+                        "failedEntries": failed,
+                        "errorCode": "ERR_PUBSUB_PUBLISH_MESSAGE",
+                    })
+                else:
+                    self._reply(204, None)
+
+            def _reply(self, status: int, payload: dict | None):
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def sidecar():
+    stub = StubSidecar()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+async def client(sidecar):
+    dapr = DaprPubSubClient(base_url=sidecar.url, timeout=2.0)
+    yield dapr
+    await dapr.close()
+
+
+class TestPublishBulk:
+    """DaprPubSubClient.publish_bulk"""
+
+    async def test_all_events_in_one_request(self, client, sidecar):
+        result = await client.publish_bulk("task-events", [{"n": i} for i in range(5)])
+
+        assert result.ok
+        assert len(sidecar.requests) == 1
+        path, entries = sidecar.requests[0]
+        assert path == "/v1.0-alpha1/publish/bulk/taskpubsub/task-events"
+        assert [entry["entryId"] for entry in entries] == ["0", "1", "2", "3", "4"]
+        assert [entry["event"]["n"] for entry in entries] == [0, 1, 2, 3, 4]
+        assert all("timestamp" in entry["event"] for entry in entries)
+
+    async def test_per_entry_failures(self, client):
+        result = await client.publish_bulk(
+            "task-events", [{"n": 0}, {"n": 1, "fail": True}, {"n": 2}]
+        )
+
+        assert result.failed == {1: "rejected"}
+
+    async def test_request_failure_fails_all_entries(self, client, sidecar):
+        sidecar.status_override = 503
+
+        result = await client.publish_bulk("task-events", [{"n": 0}, {"n": 1}])
+
+        assert result.failed == {0: "sidecar unavailable", 1: "sidecar unavailable"}
+
+    async def test_unreachable_sidecar_fails_all_entries(self):
+        dapr = DaprPubSubClient(base_url="http://127.0.0.1:9", timeout=1.0)
+        result = await dapr.publish_bulk("task-events", [{"n": 0}])
+        await dapr.close()
+
+        assert set(result.failed) == {0}
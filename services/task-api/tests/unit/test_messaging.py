@@ -0,0 +1,177 @@
+"""RabbitMQClient channel pool, publisher confirms ve backpressure testleri."""
+
+import asyncio
+import json
+
+import pytest
+from pamqp.commands import Basic
+
+from app.core import messaging
+from app.core.messaging import MessagePublishError, RabbitMQClient
+
+
+class FakeExchange:
+    """Confirm'i broker.gate acilana kadar geciktiren sahte exchange."""
+
+    def __init__(self, broker: "FakeBroker", channel_no: int):
+        self.broker = broker
+        self.channel_no = channel_no
+
+    async def publish(self, message, routing_key: str, timeout=None):
+        self.broker.in_flight += 1
+        self.broker.max_in_flight = max(
+            self.broker.max_in_flight, self.broker.in_flight
+        )
+        self.broker.published.append((self.channel_no, json.loads(message.body)))
+        await self.broker.gate.wait()
+        self.broker.in_flight -= 1
+        if routing_key in self.broker.nack_keys:
+            return Basic.Nack()
+        return Basic.Ack()
+
+
+class FakeChannel:
+    def __init__(self, broker: "FakeBroker", channel_no: int, publisher_confirms: bool):
+        self.publisher_confirms = publisher_confirms
+        self.is_closed = False
+        self._exchange = FakeExchange(broker, channel_no)
+
+    async def declare_exchange(self, name, type, durable):
+        return self._exchange
+
+
+class FakeBroker:
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.published: list[tuple[int, dict]] = []
+        self.channels: list[FakeChannel] = []
+        self.nack_keys: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.is_closed = False
+
+    async def channel(self, publisher_confirms: bool = True):
+        channel = FakeChannel(self, len(self.channels), publisher_confirms)
+        self.channels.append(channel)
+        return channel
+
+    async def close(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def broker(monkeypatch) -> FakeBroker:
+    fake = FakeBroker()
+
+    async def fake_connect_robust(url):
+        return fake
+
+    monkeypatch.setattr(messaging, "connect_robust", fake_connect_robust)
+    return fake
+
+
+async def connected_client(**kwargs) -> RabbitMQClient:
+    client = RabbitMQClient(**kwargs)
+    await client.connect()
+    return client
+
+
+class TestChannelPool:
+    """Channel pool ve publisher confirms"""
+
+    async def test_opens_confirming_channel_pool(self, broker):
+        client = await connected_client(pool_size=3)
+
+        assert len(broker.channels) == 3
+        assert all(channel.publisher_confirms for channel in broker.channels)
+        assert await client.health_check() is True
+
+    async def test_publishes_round_robin(self, broker):
+        client = await connected_client(pool_size=2)
+
+        for i in range(4):
+            await client.publish("task.created", {"n": i})
+
+        assert [channel_no for channel_no, _ in broker.published] == [0, 1, 0, 1]
+        assert client.stats()["confirmed"] == 4
+
+    async def test_closed_channel_is_skipped(self, broker):
+        client = await connected_client(pool_size=2)
+        broker.channels[0].is_closed = True
+
+        await client.publish("task.created", {"n": 0})
+        await client.publish("task.created", {"n": 1})
+
+        assert [channel_no for channel_no, _ in broker.published] == [1, 1]
+
+
+class TestConfirms:
+    """Pipelined confirm ve nack"""
+
+    async def test_confirms_are_pipelined(self, broker):
+        client = await connected_client(pool_size=2, buffer_size=100)
+        broker.gate.clear()
+
+        publishes = [
+            asyncio.create_task(client.publish("task.created", {"n": i}))
+            for i in range(10)
+        ]
+        await asyncio.sleep(0.01)
+        # Hicbiri onaylanmadan hepsi gonderildi
+        assert broker.in_flight == 10
+        assert client.stats()["in_flight"] == 10
+
+        broker.gate.set()
+        await asyncio.gather(*publishes)
+        assert client.stats()["confirmed"] == 10
+
+    async def test_nack_raises(self, broker):
+        client = await connected_client(pool_size=1)
+        broker.nack_keys.add("task.deleted")
+
+        with pytest.raises(MessagePublishError):
+            await client.publish("task.deleted", {"n": 0})
+        assert client.stats()["failed"] == 1
+
+    async def test_publish_many_reports_per_message(self, broker):
+        client = await connected_client(pool_size=2)
+        broker.nack_keys.add("task.deleted")
+
+        results = await client.publish_many([
+            ("task.created", {"n": 0}),
+            ("task.deleted", {"n": 1}),
+            ("task.updated", {"n": 2}),
+        ])
+
+        assert results[0] is None and results[2] is None
+        assert isinstance(results[1], MessagePublishError)
+
+    async def test_publish_without_connect_fails(self):
+        with pytest.raises(RuntimeError):
+            await RabbitMQClient(pool_size=1).publish("task.created", {})
+
+
+class TestBackpressure:
+    """Bounded buffer"""
+
+    async def test_full_buffer_blocks_publish(self, broker):
+        client = await connected_client(pool_size=2, buffer_size=3)
+        broker.gate.clear()
+
+        publishes = [
+            asyncio.create_task(client.publish("task.created", {"n": i}))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0.01)
+
+        # Sadece buffer kadar mesaj broker'a gitti, digerleri bekliyor
+        assert broker.in_flight == 3
+        assert not any(task.done() for task in publishes)
+        assert client.stats()["backpressure_waits"] == 2
+
+        broker.gate.set()
+        await asyncio.wait_for(asyncio.gather(*publishes), timeout=1)
+        assert broker.max_in_flight == 3
+        assert client.stats()["max_in_flight"] == 3
+        assert client.stats()["confirmed"] == 5
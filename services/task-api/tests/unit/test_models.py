@@ -11,9 +11,12 @@ Bu testler:
 
 """
 
+from datetime import UTC, datetime
+
 import pytest
 from pydantic import ValidationError
 
+from app.models.events import TaskEvent, TaskEventType
 from app.models.task import (
     TaskCreate,
     TaskPriority,
@@ -166,3 +169,26 @@ class TestUserLogin:
         """Gecersiz email ile login denemesi basarisiz"""
         with pytest.raises(ValidationError):
             UserLogin(email="invalid", password="password")
+
+
+class TestTaskEvent:
+    """TaskEvent model testleri"""
+
+    def _event(self) -> TaskEvent:
+        return TaskEvent(
+            event_type=TaskEventType.CREATED,
+            task_id=1,
+            user_id=1,
+            timestamp=datetime.now(UTC),
+        )
+
+    def test_event_id_is_stable(self):
+        """event_id olusturulurken uretilir, to_dict her seferinde ayni ID'yi verir."""
+        event = self._event()
+
+        assert event.to_dict()["event_id"] == event.event_id
+        assert event.to_dict()["event_id"] == event.to_dict()["event_id"]
+
+    def test_event_ids_are_unique(self):
+        """Her event farkli event_id alir."""
+        assert self._event().event_id != self._event().event_id
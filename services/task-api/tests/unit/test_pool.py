@@ -0,0 +1,114 @@
+"""Database engine/pool ayarlari ve istatistikleri testleri."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+
+from app.config import settings
+from app.core.resilience import db_bulkhead
+from app.db.pool import (
+    InstrumentedAsyncQueuePool,
+    create_database_engine,
+    get_pool_stats,
+)
+
+
+class TestCreateDatabaseEngine:
+    """Surucuye gore engine ayarlari"""
+
+    async def test_asyncpg_defaults(self):
+        engine = create_database_engine("postgresql+asyncpg://u:p@localhost:5432/tasks")
+
+        assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+        assert engine.pool.size() == db_bulkhead.max_concurrent
+        assert engine.pool._pre_ping is True
+        assert engine.pool._recycle == 1800
+        assert engine.url.query["prepared_statement_cache_size"] == str(
+            settings.db_statement_cache_size
+        )
+        await engine.dispose()
+
+    async def test_settings_override_driver_defaults(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_pool_size", 3)
+        monkeypatch.setattr(settings, "db_max_overflow", 0)
+        engine = create_database_engine("postgresql+asyncpg://u:p@localhost:5432/tasks")
+
+        stats = get_pool_stats(engine)
+        assert stats["size"] == 3
+        assert stats["capacity"] == 3
+        await engine.dispose()
+
+    def test_asyncpg_connect_args(self, monkeypatch):
+        """statement_timeout varsayilan eklenmez; asyncpg cache'i ayardan gelir"""
+        captured: dict = {}
+        monkeypatch.setattr(
+            "app.db.pool.create_async_engine",
+            lambda url, **kwargs: captured.update(kwargs),
+        )
+        monkeypatch.setattr(settings, "db_statement_cache_size", 0)
+
+        create_database_engine("postgresql+asyncpg://u:p@localhost:5432/tasks")
+        connect_args = captured["connect_args"]
+        assert connect_args["statement_cache_size"] == 0
+        assert "statement_timeout" not in connect_args.get("server_settings", {})
+
+        monkeypatch.setattr(settings, "db_statement_timeout_ms", 5000)
+        create_database_engine("postgresql+asyncpg://u:p@localhost:5432/tasks")
+        server_settings = captured["connect_args"]["server_settings"]
+        assert server_settings["statement_timeout"] == "5000"
+
+    async def test_sqlite_memory_keeps_default_pool(self):
+        engine = create_database_engine("sqlite+aiosqlite:///:memory:")
+
+        assert not isinstance(engine.pool, InstrumentedAsyncQueuePool)
+        await engine.dispose()
+
+
+class TestPoolStats:
+    """get_pool_stats testleri"""
+
+    async def test_checkouts_and_waits_are_recorded(self, tmp_path):
+        engine = create_database_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert get_pool_stats(engine)["checked_out"] == 1
+
+        stats = get_pool_stats(engine)
+        assert stats["checked_out"] == 0
+        assert stats["acquisitions"] == 1
+        assert stats["max_wait_ms"] >= 0
+        await engine.dispose()
+
+    async def test_pool_timeout_is_counted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "db_pool_size", 1)
+        monkeypatch.setattr(settings, "db_max_overflow", 0)
+        monkeypatch.setattr(settings, "db_pool_timeout_seconds", 0.05)
+        engine = create_database_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                await asyncio.wait_for(engine.connect().start(), timeout=1)
+            assert get_pool_stats(engine)["checked_out"] == 1
+
+        assert get_pool_stats(engine)["timeouts"] == 1
+        await engine.dispose()
+
+    async def test_connect_errors_are_not_counted_as_timeouts(self, tmp_path):
+        db_path = tmp_path / "missing" / "pool.db"
+        engine = create_database_engine(f"sqlite+aiosqlite:///{db_path}")
+
+        with pytest.raises(exc.OperationalError):
+            async with engine.connect():
+                pass
+
+        assert get_pool_stats(engine)["timeouts"] == 0
+        await engine.dispose()
+
+    async def test_unbounded_overflow_has_no_capacity(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "db_max_overflow", -1)
+        engine = create_database_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+
+        assert get_pool_stats(engine)["capacity"] is None
+        await engine.dispose()
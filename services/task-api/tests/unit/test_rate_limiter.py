@@ -0,0 +1,151 @@
+"""
+Rate limiter testleri.
+
+Bu testler:
+- Token bucket'in limit kadar istege izin verdigini
+- Redis icindeki Lua script'inin paralel isteklerde dogru saydigini
+- Redis yokken fail-open davranisini
+- Hybrid modda lokal bucket ve Redis senkronizasyonunu
+denetler.
+"""
+
+import asyncio
+
+from app.config import settings
+from app.core.rate_limiter import HybridRateLimiter, RateLimiter, create_rate_limiter
+
+# Pencereyi cok uzun tutuyoruz ki test sirasinda refill sayimi bozmasin
+LONG_WINDOW = 1_000_000
+
+
+class TestTokenBucket:
+    """Lua tabanli token bucket testleri"""
+
+    async def test_allows_up_to_limit_then_rejects(self, fake_redis):
+        """Limit kadar istek gecer, sonraki reddedilir."""
+        limiter = RateLimiter(max_requests=3, window_seconds=LONG_WINDOW)
+
+        results = [(await limiter.is_allowed("ip:1"))[0] for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    async def test_info_reports_remaining_tokens(self, fake_redis):
+        """Bilgi dict'i kalan token sayisini doner."""
+        limiter = RateLimiter(max_requests=5, window_seconds=LONG_WINDOW)
+
+        _, info = await limiter.is_allowed("ip:1")
+
+        assert info["remaining"] == 4
+        assert info["limit"] == 5
+        assert info["reset_after"] == 0
+
+    async def test_identifiers_have_separate_buckets(self, fake_redis):
+        """Farkli identifier'lar birbirinin kovasini tuketmez."""
+        limiter = RateLimiter(max_requests=1, window_seconds=LONG_WINDOW)
+
+        assert (await limiter.is_allowed("ip:1"))[0] is True
+        assert (await limiter.is_allowed("ip:2"))[0] is True
+        assert (await limiter.is_allowed("ip:1"))[0] is False
+
+    async def test_concurrent_requests_admit_exactly_limit(self, fake_redis):
+        """1000 paralel istekten tam olarak max_requests kadari gecer."""
+        limiter = RateLimiter(max_requests=100, window_seconds=LONG_WINDOW)
+
+        results = await asyncio.gather(
+            *[limiter.is_allowed("ip:hot") for _ in range(1000)]
+        )
+
+        assert sum(1 for allowed, _ in results if allowed) == 100
+
+    async def test_bucket_key_has_ttl(self, fake_redis):
+        """Bucket key'i TTL ile saklanir."""
+        limiter = RateLimiter(max_requests=5, window_seconds=60)
+
+        await limiter.is_allowed("ip:1")
+
+        assert 0 < await fake_redis.pttl("ratelimit:ip:1") <= 120_000
+
+    async def test_allows_when_redis_unavailable(self):
+        """Redis yokken istekler engellenmez."""
+        limiter = RateLimiter(max_requests=1, window_seconds=LONG_WINDOW)
+
+        assert (await limiter.is_allowed("ip:1"))[0] is True
+        assert (await limiter.is_allowed("ip:1"))[0] is True
+
+
+class TestHybridRateLimiter:
+    """Lokal bucket + periyodik Redis sync testleri"""
+
+    async def test_hot_client_skips_redis(self, fake_redis):
+        """Ilk istekten sonra tolerans dolana kadar Redis'e gidilmez."""
+        limiter = HybridRateLimiter(
+            max_requests=100, window_seconds=LONG_WINDOW, tolerance=0.1
+        )
+        calls = 0
+        original_sync = limiter._sync
+
+        async def counting_sync(identifier, bucket):
+            nonlocal calls
+            calls += 1
+            await original_sync(identifier, bucket)
+
+        limiter._sync = counting_sync
+
+        for _ in range(10):
+            assert (await limiter.is_allowed("ip:1"))[0] is True
+
+        # Sadece ilk gorus senkronizasyonu
+        assert calls == 1
+
+    async def test_flush_writes_consumed_tokens_to_redis(self, fake_redis):
+        """flush lokal harcamayi global bucket'tan duser."""
+        limiter = HybridRateLimiter(
+            max_requests=100, window_seconds=LONG_WINDOW, tolerance=0.5
+        )
+        for _ in range(10):
+            await limiter.is_allowed("ip:1")
+
+        await limiter.flush()
+
+        tokens = float(await fake_redis.hget("ratelimit:ip:1", "tokens"))
+        assert 89 <= tokens <= 90.1
+
+    async def test_global_limit_within_tolerance_across_workers(self, fake_redis):
+        """Iki worker birlikte limiti tolerans kadar asabilir, fazlasini degil."""
+        max_requests, tolerance = 100, 0.05
+        workers = [
+            HybridRateLimiter(
+                max_requests=max_requests,
+                window_seconds=LONG_WINDOW,
+                tolerance=tolerance,
+            )
+            for _ in range(2)
+        ]
+
+        admitted = 0
+        for i in range(400):
+            allowed, _ = await workers[i % 2].is_allowed("ip:hot")
+            admitted += allowed
+            if i % 20 == 0:
+                for worker in workers:
+                    await worker.flush()
+
+        slack = len(workers) * int(max_requests * tolerance)
+        assert max_requests - slack <= admitted <= max_requests + slack
+
+    async def test_works_without_redis(self):
+        """Redis yokken worker ici limit uygulanir."""
+        limiter = HybridRateLimiter(max_requests=3, window_seconds=LONG_WINDOW)
+
+        results = [(await limiter.is_allowed("ip:1"))[0] for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+
+def test_create_rate_limiter_uses_settings_mode(monkeypatch):
+    """rate_limit_mode ayari limiter tipini secer."""
+    monkeypatch.setattr(settings, "rate_limit_mode", "hybrid")
+    assert isinstance(create_rate_limiter(), HybridRateLimiter)
+
+    monkeypatch.setattr(settings, "rate_limit_mode", "redis")
+    assert type(create_rate_limiter()) is RateLimiter
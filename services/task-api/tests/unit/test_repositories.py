@@ -0,0 +1,124 @@
+"""
+BaseRepository.find_page testleri.
+
+Bu testler:
+-Sayfa ve toplamin tek SQL sorgusunda geldigini
+-Toplam atlandiginda has_more'un dogru hesaplandigini
+denetlemektedir.
+"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.db.entities import TaskEntity, UserEntity
+from app.db.repositories.specifications import (
+    PaginationSpecification,
+    TaskStatusSpecification,
+    TaskUserSpecification,
+)
+from app.db.repositories.task import TaskRepository
+from app.models.task import TaskPriority, TaskStatus
+
+
+@contextmanager
+def count_queries(engine):
+    """Blok icinde calisan SQL ifadelerini toplar."""
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_execute)
+
+
+async def seed_tasks(session, count: int) -> int:
+    user = UserEntity(email="repo@example.com", hashed_password="x")
+    session.add(user)
+    await session.flush()
+    for i in range(count):
+        session.add(TaskEntity(
+            user_id=user.id,
+            title=f"Task {i}",
+            status=TaskStatus.COMPLETED if i % 2 else TaskStatus.PENDING,
+            priority=TaskPriority.MEDIUM,
+        ))
+    await session.commit()
+    return user.id
+
+
+class TestFindPage:
+    """BaseRepository.find_page testleri"""
+
+    async def test_rows_and_total_in_single_query(self, test_session, test_engine):
+        """Sayfa ve toplam tek sorguda gelmeli"""
+        user_id = await seed_tasks(test_session, 7)
+        repo = TaskRepository(test_session)
+
+        with count_queries(test_engine) as statements:
+            page = await repo.find_page(
+                TaskUserSpecification(user_id), PaginationSpecification(2, 3)
+            )
+
+        assert len(statements) == 1
+        assert "OVER" in statements[0].upper()
+        assert len(page.items) == 3
+        assert page.total == 7
+        assert page.has_more is True
+
+    async def test_total_respects_filters(self, test_session):
+        """COUNT(*) OVER() filtreleri dikkate almali, sayfalamayi almamali"""
+        user_id = await seed_tasks(test_session, 7)
+        repo = TaskRepository(test_session)
+
+        page = await repo.find_page(
+            TaskUserSpecification(user_id),
+            TaskStatusSpecification(TaskStatus.PENDING),
+            PaginationSpecification(2, 3),
+        )
+
+        assert page.total == 4
+        assert len(page.items) == 1
+        assert page.has_more is False
+
+    async def test_page_past_end_still_reports_total(self, test_session):
+        """Son sayfadan sonrasi bos gelir ama toplam dogru olmali"""
+        user_id = await seed_tasks(test_session, 3)
+        repo = TaskRepository(test_session)
+
+        page = await repo.find_page(
+            TaskUserSpecification(user_id), PaginationSpecification(5, 3)
+        )
+
+        assert page.items == []
+        assert page.total == 3
+        assert page.has_more is False
+
+    async def test_without_total_returns_has_more(self, test_session, test_engine):
+        """with_total=False toplami hesaplamamali, has_more dogru olmali"""
+        user_id = await seed_tasks(test_session, 5)
+        repo = TaskRepository(test_session)
+
+        with count_queries(test_engine) as statements:
+            first = await repo.find_page(
+                TaskUserSpecification(user_id),
+                PaginationSpecification(1, 3),
+                with_total=False,
+            )
+        last = await repo.find_page(
+            TaskUserSpecification(user_id),
+            PaginationSpecification(2, 3),
+            with_total=False,
+        )
+
+        assert len(statements) == 1
+        assert "OVER" not in statements[0].upper()
+        assert first.total is None
+        assert len(first.items) == 3
+        assert first.has_more is True
+        assert len(last.items) == 2
+        assert last.has_more is False
@@ -0,0 +1,46 @@
+"""ReadRouter (read-your-writes) testleri."""
+
+import time
+
+from app.db.routing import ReadRouter
+
+
+class TestReadRouter:
+    """Yazmadan sonra okumalarin primary'de kalmasi"""
+
+    async def test_reads_use_replica_without_writes(self):
+        router = ReadRouter(window_seconds=5)
+
+        assert await router.use_primary(1) is False
+        assert router.stats()["replica_reads"] == 1
+
+    async def test_writer_sticks_to_primary(self):
+        router = ReadRouter(window_seconds=5)
+        await router.mark_write(1)
+
+        assert await router.use_primary(1) is True
+        # Diger kullanicilar etkilenmez
+        assert await router.use_primary(2) is False
+
+    async def test_window_expires(self, monkeypatch):
+        router = ReadRouter(window_seconds=5)
+        await router.mark_write(1)
+
+        clock = time.monotonic() + 6
+        monkeypatch.setattr("app.db.routing.time.monotonic", lambda: clock)
+        assert await router.use_primary(1) is False
+
+    async def test_marker_is_shared_through_redis(self, fake_redis):
+        writer = ReadRouter(window_seconds=5)
+        reader = ReadRouter(window_seconds=5)  # baska bir worker
+        await writer.mark_write(1)
+
+        assert await reader.use_primary(1) is True
+        assert await fake_redis.ttl("db:recent_write:user:1") == 5
+
+    async def test_disabled_router_skips_marker(self, fake_redis):
+        router = ReadRouter(window_seconds=5, enabled=False)  # replica yok
+        await router.mark_write(1)
+
+        assert await fake_redis.exists("db:recent_write:user:1") == 0
+        assert router._recent_writes == {}
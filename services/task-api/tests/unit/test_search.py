@@ -0,0 +1,134 @@
+"""Full-text search yardimcilarinin unit testleri."""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_mock_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.config import settings
+from app.db.entities import TaskEntity
+from app.db.repositories.specifications import TaskSearchSpecification
+from app.db.search import get_connect_args, get_search_backend, search_tokens
+
+MIGRATIONS_DIR = Path(__file__).parents[2] / "alembic" / "versions"
+
+
+class TestSearchBackend:
+    """database_url'e gore backend secimi"""
+
+    def test_backend_from_database_url(self):
+        assert get_search_backend("postgresql+asyncpg://u:p@db/tasks") == "postgres"
+        assert get_search_backend("sqlite+aiosqlite:///./tasks.db") == "sqlite"
+        assert get_search_backend("mysql+aiomysql://u:p@db/tasks") == "like"
+
+    def test_tokens_drop_fts_operators(self):
+        assert search_tokens('"Rapor" OR -taslak*:') == ["rapor", "or", "taslak"]
+        assert search_tokens("!!!") == []
+
+    def test_trigram_threshold_only_for_asyncpg(self, monkeypatch):
+        monkeypatch.setattr(settings, "search_mode", "trigram")
+        args = get_connect_args("postgresql+asyncpg://u:p@db/tasks")
+
+        assert "pg_trgm.word_similarity_threshold" in args["server_settings"]
+        assert get_connect_args("sqlite+aiosqlite:///./tasks.db") == {}
+
+    def test_no_trigram_settings_in_fulltext_mode(self, monkeypatch):
+        monkeypatch.setattr(settings, "search_mode", "fulltext")
+
+        assert get_connect_args("postgresql+asyncpg://u:p@db/tasks") == {}
+
+    def test_trigram_ddl_only_in_trigram_mode(self, monkeypatch):
+        statements: list[str] = []
+
+        def executor(sql, *multiparams, **params):
+            statements.append(str(sql.compile(dialect=postgresql.dialect())))
+
+        engine = create_mock_engine("postgresql://", executor)
+
+        monkeypatch.setattr(settings, "search_mode", "fulltext")
+        TaskEntity.__table__.create(engine)
+        assert not any("pg_trgm" in s for s in statements)
+
+        statements.clear()
+        monkeypatch.setattr(settings, "search_mode", "trigram")
+        TaskEntity.__table__.create(engine)
+        assert any("CREATE EXTENSION IF NOT EXISTS pg_trgm" in s for s in statements)
+
+    @pytest.mark.parametrize(
+        ("dialect", "mode", "expected"),
+        [
+            ("postgresql", "fulltext", False),
+            ("postgresql", "trigram", True),
+            ("sqlite", "trigram", False),
+        ],
+    )
+    def test_trigram_migration_only_in_trigram_mode(
+            self, monkeypatch, dialect, mode, expected
+    ):
+        path = MIGRATIONS_DIR / "c47d9e05b3a8_add_task_trigram_indexes.py"
+        spec = importlib.util.spec_from_file_location("trigram_migration", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        statements: list[str] = []
+        bind = SimpleNamespace(dialect=SimpleNamespace(name=dialect))
+        monkeypatch.setattr(
+            migration, "op",
+            SimpleNamespace(get_bind=lambda: bind, execute=statements.append),
+        )
+        monkeypatch.setattr(settings, "search_mode", mode)
+
+        migration.upgrade()
+        assert any("pg_trgm" in s for s in statements) is expected
+
+        statements.clear()
+        migration.downgrade()
+        assert any("ix_tasks_title_trgm" in s for s in statements) is expected
+
+
+class TestSearchSpecification:
+    """TaskSearchSpecification'in urettigi SQL"""
+
+    def test_postgres_uses_tsvector_and_rank(self):
+        query = TaskSearchSpecification("rep", backend="postgres").apply(
+            select(TaskEntity)
+        )
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "tasks.search_vector @@ to_tsquery" in sql
+        assert "ts_rank" in sql
+        assert "ILIKE" not in sql.upper()
+
+    def test_unranked_search_has_no_order_by(self):
+        query = TaskSearchSpecification("rep", ranked=False, backend="postgres").apply(
+            select(TaskEntity)
+        )
+
+        assert "ORDER BY" not in str(query.compile(dialect=postgresql.dialect()))
+
+    def test_falls_back_to_ilike_without_tokens(self):
+        query = TaskSearchSpecification("%%", backend="postgres").apply(
+            select(TaskEntity)
+        )
+
+        assert "ILIKE" in str(query.compile(dialect=postgresql.dialect())).upper()
+
+    def test_trigram_mode_uses_word_similarity(self):
+        spec = TaskSearchSpecification("reprot", backend="postgres", mode="trigram")
+        query = spec.apply(select(TaskEntity))
+        sql = str(query.compile(dialect=asyncpg.dialect()))
+
+        assert "<% tasks.title" in sql
+        assert "<% tasks.description" in sql
+        assert "word_similarity" in sql
+        assert "search_vector" not in sql
+
+    def test_trigram_mode_falls_back_to_fulltext_on_sqlite(self):
+        spec = TaskSearchSpecification("rep", backend="sqlite", mode="trigram")
+        sql = str(spec.apply(select(TaskEntity)))
+
+        assert "tasks_fts" in sql
+        assert "word_similarity" not in sql
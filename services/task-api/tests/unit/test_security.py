@@ -6,14 +6,29 @@ Bu testler:
 
 - JWT token oluşturma ve decode etme
 
+- Thread pool'da şifre işlemleri ve 503 davranışı
+
+- Doğrulanmış token cache'i
+
 """
 
+import asyncio
+import time
+
+import pytest
+
+from app.core import security
+from app.core.exceptions import BulkheadFullError
+from app.core.resilience import Bulkhead
 from app.core.security import (
+    VerifiedTokenCache,
     create_access_token,
     create_refresh_token,
     decode_token,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -151,3 +166,108 @@ class TestJWTTokens:
         payload = decode_token(empty_token)
 
         assert payload is None
+
+
+class TestPasswordHashingPool:
+    """Thread pool'da calisan sifre islemleri testleri"""
+
+    async def test_hash_password_async_verifies(self):
+        """Async hash, async verify ile dogrulanir."""
+        hashed = await hash_password_async("mysecretpassword")
+
+        assert hashed.startswith("$2b$")
+        assert await verify_password_async("mysecretpassword", hashed) is True
+        assert await verify_password_async("wrongpassword", hashed) is False
+
+    async def test_hashing_does_not_block_event_loop(self):
+        """bcrypt calisirken event loop diger isleri yurutur."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await hash_password_async("mysecretpassword")
+        task.cancel()
+
+        assert ticks > 0
+
+    async def test_rejects_when_pool_is_saturated(self, monkeypatch):
+        """Pool ve kuyruk doluyken 503 (BulkheadFullError) firlatilir."""
+        monkeypatch.setattr(
+            security, "password_bulkhead", Bulkhead(max_concurrent=1, name="test")
+        )
+
+        first = asyncio.create_task(hash_password_async("mysecretpassword"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(BulkheadFullError) as exc_info:
+            await hash_password_async("mysecretpassword")
+        await first
+
+        assert exc_info.value.status_code == 503
+
+    async def test_executor_recreated_after_shutdown(self):
+        """Shutdown sonrasi (ikinci lifespan) sifre islemleri calismaya devam eder."""
+        await hash_password_async("mysecretpassword")
+        security.shutdown_password_executor()
+
+        hashed = await hash_password_async("mysecretpassword")
+
+        assert await verify_password_async("mysecretpassword", hashed) is True
+
+
+class TestVerifiedTokenCache:
+    """Dogrulanmis JWT cache testleri"""
+
+    def test_repeated_decode_is_served_from_cache(self, monkeypatch):
+        """Ayni token ikinci kez dogrulanmaz."""
+        cache = VerifiedTokenCache(max_entries=10)
+        monkeypatch.setattr(security, "verified_token_cache", cache)
+        token = create_access_token(7)
+
+        first = decode_token(token)
+        second = decode_token(token)
+
+        assert first == second
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_invalid_token_is_not_cached(self, monkeypatch):
+        """Gecersiz token cache'e yazilmaz."""
+        cache = VerifiedTokenCache(max_entries=10)
+        monkeypatch.setattr(security, "verified_token_cache", cache)
+
+        assert decode_token("this.is.invalid") is None
+        assert len(cache) == 0
+
+    def test_entry_expires_at_token_exp(self):
+        """exp zamani gecmis entry donmez."""
+        cache = VerifiedTokenCache(max_entries=10)
+        digest = VerifiedTokenCache.digest("token")
+        cache.set(digest, {"sub": "1", "exp": time.time() - 1})
+
+        assert cache.get(digest) is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self):
+        """Kapasite asilinca en eski entry cikarilir."""
+        cache = VerifiedTokenCache(max_entries=1)
+        exp = time.time() + 60
+        cache.set(b"a", {"sub": "1", "exp": exp})
+        cache.set(b"b", {"sub": "2", "exp": exp})
+
+        assert cache.get(b"a") is None
+        assert cache.get(b"b")["sub"] == "2"
+
+    def test_returned_payload_is_a_copy(self):
+        """Donen payload degistirilse de cache etkilenmez."""
+        cache = VerifiedTokenCache(max_entries=10)
+        cache.set(b"a", {"sub": "1", "exp": time.time() + 60})
+
+        cache.get(b"a")["sub"] = "hacked"
+
+        assert cache.get(b"a")["sub"] == "1"
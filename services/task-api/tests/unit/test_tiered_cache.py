@@ -0,0 +1,105 @@
+"""
+Iki katmanli cache testleri.
+
+Bu testler:
+- L1 LRU cache'in entry/byte/TTL sinirlarini
+- L1 -> L2 okuma sirasini ve hit oranlarini
+- Pub/sub ile worker'lar arasi invalidation'i
+denetler.
+"""
+
+import asyncio
+import time
+
+from app.core.tiered_cache import LocalLRUCache, TieredCache
+
+
+class TestLocalLRUCache:
+    """Process ici LRU cache testleri"""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Entry siniri asilinca en eski kullanilan cikarilir."""
+        cache = LocalLRUCache(max_entries=2, max_bytes=1024, ttl_seconds=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # a artik en yeni
+
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.evictions == 1
+
+    def test_evicts_when_byte_limit_exceeded(self):
+        """Byte siniri asilinca eski entry'ler cikarilir."""
+        cache = LocalLRUCache(max_entries=100, max_bytes=10, ttl_seconds=60)
+        cache.set("a", "x" * 6)
+        cache.set("b", "y" * 6)
+
+        assert cache.get("a") is None
+        assert cache.size_bytes == 6
+
+    def test_value_larger_than_limit_is_not_cached(self):
+        """Tek basina sigmayan deger cache'lenmez."""
+        cache = LocalLRUCache(max_entries=100, max_bytes=4, ttl_seconds=60)
+        cache.set("a", "x" * 5)
+
+        assert cache.get("a") is None
+        assert cache.size_bytes == 0
+
+    def test_expired_entry_is_not_returned(self):
+        """Suresi dolan entry donmez."""
+        cache = LocalLRUCache(max_entries=10, max_bytes=1024, ttl_seconds=60)
+        cache.set("a", "1", ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestTieredCache:
+    """L1 + Redis testleri"""
+
+    async def test_second_read_is_served_from_l1(self, fake_redis):
+        """Ikinci okuma Redis'e gitmeden L1'den gelir."""
+        cache = TieredCache(enabled=True)
+        await fake_redis.set("k", '{"v": 1}')
+
+        assert await cache.get("k") == {"v": 1}
+        await fake_redis.delete("k")  # Redis'te artik yok
+
+        assert await cache.get("k") == {"v": 1}
+        stats = cache.stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l2_hits"] == 1
+        assert stats["l1_hit_ratio"] == 0.5
+
+    async def test_disabled_l1_always_reads_redis(self, fake_redis):
+        """L1 kapaliyken her okuma Redis'e gider."""
+        cache = TieredCache(enabled=False)
+        await cache.set("k", {"v": 1})
+        await fake_redis.delete("k")
+
+        assert await cache.get("k") is None
+        assert cache.stats()["l1_hits"] == 0
+
+    async def test_incr_invalidates_other_workers(self, fake_redis):
+        """Bir worker'daki INCR diger worker'in L1'inden key'i siler."""
+        worker_a = TieredCache(enabled=True)
+        worker_b = TieredCache(enabled=True)
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            assert await worker_b.get_version("ver") == 0
+
+            await worker_a.incr("ver")
+            for _ in range(50):
+                if worker_b.local.get("ver") is None:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert await worker_b.get_version("ver") == 1
+        finally:
+            await worker_a.stop()
+            await worker_b.stop()
@@ -0,0 +1,107 @@
+"""
+TaskUnitOfWork.commit testleri.
+
+Commit'in sadece yazilan satirlar icin sunucu degerlerini aldigini ve
+yuklu ama degismemis nesneleri yeniden sorgulamadigini denetler.
+"""
+
+from sqlalchemy import event
+
+from app.db.entities import TaskEntity, UserEntity
+from app.db.repositories.specifications import TaskUserSpecification
+from app.db.unit_of_work import TaskUnitOfWork
+from app.models.task import TaskPriority, TaskStatus
+
+
+def record_statements(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+async def seed(session, count: int) -> int:
+    user = UserEntity(email="uow@example.com", hashed_password="x")
+    session.add(user)
+    await session.flush()
+    for i in range(count):
+        session.add(TaskEntity(
+            user_id=user.id, title=f"Task {i}",
+            status=TaskStatus.PENDING, priority=TaskPriority.LOW,
+        ))
+    await session.commit()
+    session.expunge_all()
+    return user.id
+
+
+class TestCommit:
+    """TaskUnitOfWork.commit testleri"""
+
+    async def test_commit_does_not_refresh_unchanged_objects(
+            self, test_session, test_engine
+    ):
+        """N satir yuklenip biri guncellenince commit sadece UPDATE calistirmali"""
+        user_id = await seed(test_session, 5)
+        uow = TaskUnitOfWork(test_session)
+        tasks = await uow.tasks.find(TaskUserSpecification(user_id))
+        tasks[0].title = "Changed"
+
+        statements = record_statements(test_engine)
+        await uow.commit()
+
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE tasks")
+        assert "RETURNING" in statements[0]
+        # Sunucuda uretilen updated_at ek sorgu olmadan okunabilmeli
+        assert tasks[0].updated_at is not None
+
+    async def test_insert_returns_server_values(self, test_session, test_engine):
+        """INSERT sonrasi id ve timestamp'ler ek SELECT olmadan dolu olmali"""
+        user_id = await seed(test_session, 0)
+        uow = TaskUnitOfWork(test_session)
+        task = await uow.tasks.create(TaskEntity(
+            user_id=user_id, title="New",
+            status=TaskStatus.PENDING, priority=TaskPriority.LOW,
+        ))
+
+        statements = record_statements(test_engine)
+        await uow.commit()
+
+        assert [s.split()[0] for s in statements] == ["INSERT"]
+        assert task.id is not None
+        assert task.created_at is not None
+
+    async def test_rollback_clears_tracked_writes(
+            self, test_session, test_engine, monkeypatch
+    ):
+        """Rollback edilen flush sonraki commit'te refresh/invalidation yapmamali"""
+        invalidated: list[int] = []
+
+        async def fake_invalidate(user_id: int) -> None:
+            invalidated.append(user_id)
+
+        monkeypatch.setattr(
+            "app.db.unit_of_work.invalidate_cached_user", fake_invalidate
+        )
+        user_id = await seed(test_session, 1)
+        uow = TaskUnitOfWork(test_session)
+
+        user = await uow.users.get_by_id(user_id)
+        user.full_name = "Discarded"
+        await uow.tasks.create(TaskEntity(
+            user_id=user_id, title="Discarded",
+            status=TaskStatus.PENDING, priority=TaskPriority.LOW,
+        ))
+        await uow.flush()
+        await uow.rollback()
+
+        tasks = await uow.tasks.find(TaskUserSpecification(user_id))
+        tasks[0].title = "Kept"
+        statements = record_statements(test_engine)
+        await uow.commit()
+
+        assert [s.split()[0] for s in statements] == ["UPDATE"]
+        assert invalidated == []